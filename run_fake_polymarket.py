@@ -0,0 +1,73 @@
+"""
+Fake Polymarket server startup script for BotForm2.
+
+Runs the local stand-in for the Polymarket REST and streaming APIs so the
+bots can be exercised offline. Point the client at it with:
+
+    POLYMARKET_BASE_URL=http://<host>:<port>  (legacy host: place_order/cancel_order)
+    POLYMARKET_DATA_URL=http://<host>:<port>
+    POLYMARKET_GAMMA_URL=http://<host>:<port>
+    POLYMARKET_CLOB_URL=http://<host>:<port>
+    STREAM_URL=ws://<host>:<port>/ws/market  (with INGESTION_MODE=stream)
+
+Leaving POLYMARKET_BASE_URL unset sends production orders to the real API
+instead of the fake.
+
+Activity comes from --replay (JSONL, one data-api trade per line) or a
+synthetic run (--traders); faults can be changed later via /_fake/faults.
+"""
+
+import argparse
+import uvicorn
+
+from src.testing.fake_polymarket import fake_server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the fake Polymarket server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+
+    # Activity replay
+    parser.add_argument("--replay", default=None, help="JSONL recording of data-api trades to replay")
+    parser.add_argument("--traders", type=int, default=0, help="Synthetic traders to simulate")
+    parser.add_argument("--rate", type=float, default=0.2, help="Synthetic trades per second per trader")
+    parser.add_argument("--duration", type=float, default=600, help="Synthetic timeline length in seconds")
+    parser.add_argument("--markets", type=int, default=20, help="Synthetic markets")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed multiplier")
+    parser.add_argument("--loop", action="store_true", help="Restart the replay when it ends")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+
+    # Fault injection
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every REST response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on injected 429s")
+    args = parser.parse_args()
+
+    fake_server.configure_faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after
+    )
+
+    if args.replay is not None or args.traders > 0:
+        timeline = fake_server.build_timeline(
+            path=args.replay,
+            traders=args.traders,
+            rate=args.rate,
+            duration=args.duration,
+            markets=args.markets,
+            seed=args.seed
+        )
+        fake_server.schedule_replay(timeline, _speed=args.speed, _loop=args.loop)
+        print("Replaying {} trades at {}x".format(len(timeline), args.speed))
+
+    uvicorn.run(
+        fake_server.app,
+        host=args.host,
+        port=args.port,
+        log_config=None
+    )
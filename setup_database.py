@@ -308,6 +308,17 @@ DATABASE_URL={}
 POLYMARKET_API_KEY=
 POLYMARKET_API_SECRET=
 POLYMARKET_BASE_URL=https://api.polymarket.com
+# Per-service overrides (leave empty for the public APIs; point at run_fake_polymarket.py for offline runs)
+POLYMARKET_DATA_URL=
+POLYMARKET_GAMMA_URL=
+POLYMARKET_CLOB_URL=
+POLYMARKET_STRAPI_URL=
+POLYMARKET_HTTP2=true
+POLYMARKET_MAX_CONNECTIONS=20
+POLYMARKET_MAX_KEEPALIVE=10
+POLYMARKET_KEEPALIVE_EXPIRY=30
+POLYMARKET_TIMEOUT=10
+POLYMARKET_DNS_CACHE_TTL=300
 
 # Security Configuration
 REQUIRE_VPN=false
@@ -321,7 +332,30 @@ PORT=8000
 
 # Bot Configuration
 POLL_INTERVAL=5
+POLL_MIN_INTERVAL=2
+POLL_MAX_INTERVAL=60
 RATE_LIMIT_DELAY=0.2
+RATE_LIMIT_BURST=5
+POLYMARKET_MAX_CONCURRENCY=4
+POLYMARKET_MAX_RETRIES=3
+POLYMARKET_COALESCE_TTL=0.5
+POLYMARKET_HEDGE_PERCENTILE=95
+POLYMARKET_BREAKER_THRESHOLD=5
+POLYMARKET_BREAKER_RECOVERY=30
+PRICE_MAX_AGE=10
+PRICE_REFRESH_INTERVAL=5
+WALLET_FLUSH_INTERVAL=1
+WALLET_RECONCILE_INTERVAL=60
+TRADE_BATCH_WINDOW=0.01
+TRADE_BATCH_SIZE=100
+ORDER_AGGREGATION_WINDOW=0.05
+ORDER_AGGREGATION_MAX=50
+ORDER_BOOK_MAX_AGE=5
+ORDER_BOOK_REFRESH_INTERVAL=2
+ORDER_BOOK_CAPACITY=200
+PAPER_MAX_SLIPPAGE=0.05
+INGESTION_MODE=poll
+STREAM_URL=wss://ws-subscriptions-clob.polymarket.com/ws/market
 """.format(connection_string))
 
 
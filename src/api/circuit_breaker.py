@@ -0,0 +1,197 @@
+"""
+Per-host circuit breaking for BotForm2.
+
+Stops calling an upstream Polymarket host after repeated failures so bot
+loops fail fast instead of each waiting out the request timeout, then
+lets a few probe requests through to detect recovery.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import time
+from typing import Optional, Dict
+
+
+# Breaker states
+STATE_CLOSED = 'closed'  # Normal operation
+STATE_OPEN = 'open'  # Failing fast
+STATE_HALF_OPEN = 'half_open'  # Letting probes through
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the host's breaker is open."""
+
+    def __init__(self, _host, _retry_in):
+        """
+        Initialize error.
+
+        Args:
+            _host: Host name
+            _retry_in: Seconds until the breaker lets a probe through
+        """
+        super().__init__("Circuit open for {} (retry in {:.1f}s)".format(_host, _retry_in))
+        self.host = _host
+        self.retry_in = _retry_in
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker with a rolling health score for one host."""
+
+    def __init__(self, _name, _failure_threshold=5, _recovery_timeout=30.0, _half_open_probes=1,
+                 _health_smoothing=0.1):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            _name: Host name (e.g. 'data', 'gamma', 'clob', 'strapi')
+            _failure_threshold: Consecutive failures that open the breaker
+            _recovery_timeout: Seconds the breaker stays open before probing
+            _half_open_probes: Probe requests allowed at once while half-open
+            _health_smoothing: Weight of the newest outcome in the health score (0-1)
+        """
+        self._name = _name
+        self._failure_threshold = max(int(_failure_threshold), 1)
+        self._recovery_timeout = _recovery_timeout
+        self._half_open_probes = max(int(_half_open_probes), 1)
+        self._health_smoothing = _health_smoothing
+
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._health = 1.0
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._successes = 0
+        self._failures = 0
+        self._rejected = 0
+        self._trips = 0
+        self._last_error = None
+
+    @property
+    def name(self):
+        """Get host name."""
+        return self._name
+
+    @property
+    def state(self):
+        """Get breaker state, moving from open to half-open once the recovery timeout passes."""
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self._recovery_timeout:
+            self._state = STATE_HALF_OPEN
+            self._probes_in_flight = 0
+            self._logger.info("Circuit for {} half-open, probing".format(self._name))
+        return self._state
+
+    @property
+    def is_open(self):
+        """Check if requests are currently being refused."""
+        return True if self.state == STATE_OPEN else False
+
+    @property
+    def health(self):
+        """Get rolling success ratio between 0 and 1."""
+        return self._health
+
+    def before_request(self):
+        """
+        Check the breaker before sending a request.
+
+        Returns:
+            True if the request is a half-open probe
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with all probes taken
+        """
+        state = self.state
+
+        if state == STATE_CLOSED:
+            return False
+
+        if state == STATE_HALF_OPEN and self._probes_in_flight < self._half_open_probes:
+            self._probes_in_flight = self._probes_in_flight + 1
+            return True
+
+        self._rejected = self._rejected + 1
+        retry_in = max(self._recovery_timeout - (time.monotonic() - self._opened_at), 0.0)
+        raise CircuitOpenError(self._name, retry_in)
+
+    def record_success(self, _probe=False):
+        """
+        Record a successful request.
+
+        Args:
+            _probe: Whether the request was a half-open probe
+        """
+        self._successes = self._successes + 1
+        self._consecutive_failures = 0
+        self._update_health(1.0)
+
+        if _probe == True:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+        if self._state != STATE_CLOSED:
+            self._state = STATE_CLOSED
+            self._logger.info("Circuit for {} closed, host recovered".format(self._name))
+
+    def record_failure(self, _error=None, _probe=False):
+        """
+        Record a failed request (connection error, timeout or 5xx).
+
+        Args:
+            _error: Description of the failure
+            _probe: Whether the request was a half-open probe
+        """
+        self._failures = self._failures + 1
+        self._consecutive_failures = self._consecutive_failures + 1
+        self._last_error = _error
+        self._update_health(0.0)
+
+        if _probe == True:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+        if self._state == STATE_HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+            if self._state != STATE_OPEN:
+                self._trips = self._trips + 1
+                self._logger.warning("Circuit for {} opened after {} failures: {}".format(
+                    self._name, self._consecutive_failures, _error
+                ))
+            self._state = STATE_OPEN
+            self._opened_at = time.monotonic()
+
+    def record_cancelled(self, _probe=False):
+        """
+        Record a request that was cancelled before it finished.
+
+        Args:
+            _probe: Whether the request was a half-open probe
+        """
+        if _probe == True:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    def _update_health(self, _outcome):
+        """Fold one outcome (1 success, 0 failure) into the health score."""
+        self._health = self._health_smoothing * _outcome + (1 - self._health_smoothing) * self._health
+
+    def get_stats(self):
+        """
+        Get breaker statistics.
+
+        Returns:
+            Dictionary of breaker state and counters
+        """
+        state = self.state
+        retry_in = 0.0
+        if state == STATE_OPEN:
+            retry_in = max(self._recovery_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+        return {
+            'state': state,
+            'health': round(self._health, 3),
+            'consecutive_failures': self._consecutive_failures,
+            'retry_in': round(retry_in, 1),
+            'successes': self._successes,
+            'failures': self._failures,
+            'rejected': self._rejected,
+            'trips': self._trips,
+            'last_error': self._last_error
+        }
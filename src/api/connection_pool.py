@@ -0,0 +1,281 @@
+"""
+Persistent per-host connection pools for BotForm2.
+
+Wraps long-lived httpx clients (HTTP/2, keep-alive, DNS caching) so that
+every Polymarket call reuses warm connections instead of doing a fresh
+TCP+TLS handshake.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+import socket
+import time
+from typing import Optional, Dict, Any
+import httpx
+import httpcore
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """httpcore network backend that caches DNS lookups for a fixed TTL."""
+
+    def __init__(self, _ttl=300.0, _backend=None):
+        """
+        Initialize caching network backend.
+
+        Args:
+            _ttl: Seconds to keep a resolved address
+            _backend: Underlying httpcore network backend
+        """
+        self._ttl = _ttl
+        self._backend = httpcore.AnyIOBackend() if _backend is None else _backend
+        self._cache = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self):
+        """Get number of DNS cache hits."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Get number of DNS cache misses."""
+        return self._misses
+
+    async def _resolve(self, _host, _port):
+        """
+        Resolve host to its IP addresses, using the cache when possible.
+
+        Args:
+            _host: Hostname to resolve
+            _port: Port number
+
+        Returns:
+            List of IP address strings in resolver order (or [host] if resolution fails)
+        """
+        now = time.monotonic()
+        cached = self._cache.get(_host)
+        if cached is not None and cached[1] > now:
+            self._hits = self._hits + 1
+            return cached[0]
+
+        self._misses = self._misses + 1
+        try:
+            loop = asyncio.get_running_loop()
+            infos = await loop.getaddrinfo(_host, _port, type=socket.SOCK_STREAM)
+        except Exception:
+            return [_host]
+
+        addresses = []
+        for info in infos:
+            if info[4][0] not in addresses:
+                addresses.append(info[4][0])
+
+        if len(addresses) == 0:
+            return [_host]
+
+        self._cache[_host] = (addresses, now + self._ttl)
+        return addresses
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        """
+        Open a TCP connection to the first reachable cached address for host.
+
+        If an address can't be reached the cache entry is evicted (so the next
+        connection resolves again) and the remaining addresses are tried.
+        """
+        addresses = await self._resolve(host, port)
+        last_error = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout, OSError) as e:
+                last_error = e
+                self._cache.pop(host, None)
+
+        raise last_error
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        """Open a unix socket connection."""
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds):
+        """Sleep using the underlying backend."""
+        await self._backend.sleep(seconds)
+
+
+class HostConnectionPool:
+    """Long-lived HTTP client bound to one upstream host."""
+
+    def __init__(self, _name, _base_url, _http2=True, _max_connections=20, _max_keepalive_connections=10,
+                 _keepalive_expiry=30.0, _timeout=10.0, _dns_cache_ttl=300.0, _headers=None):
+        """
+        Initialize host connection pool.
+
+        Args:
+            _name: Short host name (e.g. 'data', 'gamma', 'clob')
+            _base_url: Base URL for the host
+            _http2: Whether to negotiate HTTP/2
+            _max_connections: Maximum open connections
+            _max_keepalive_connections: Maximum idle keep-alive connections
+            _keepalive_expiry: Seconds an idle connection is kept
+            _timeout: Request timeout in seconds
+            _dns_cache_ttl: Seconds to cache DNS lookups (0 disables caching)
+            _headers: Default request headers
+        """
+        self._name = _name
+        self._base_url = _base_url
+        self._http2 = _http2
+        self._max_connections = _max_connections
+        self._max_keepalive_connections = _max_keepalive_connections
+        self._keepalive_expiry = _keepalive_expiry
+        self._timeout = _timeout
+        self._dns_cache_ttl = _dns_cache_ttl
+        self._headers = {} if _headers is None else _headers
+
+        self._client = None
+        self._transport = None
+        self._network_backend = None
+        self._logger = logging.getLogger(__name__)
+
+        # Request statistics
+        self._requests = 0
+        self._errors = 0
+        self._http_versions = {}
+
+    @property
+    def name(self):
+        """Get host name."""
+        return self._name
+
+    @property
+    def base_url(self):
+        """Get base URL."""
+        return self._base_url
+
+    @property
+    def client(self):
+        """Get underlying httpx client."""
+        return self._client
+
+    def open(self):
+        """
+        Create the underlying client and transport.
+
+        Returns:
+            Self for chaining
+        """
+        if self._client is not None:
+            return self
+
+        http2 = self._http2
+        if http2 == True:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                self._logger.warning("h2 package not installed, falling back to HTTP/1.1 for {}".format(self._name))
+                http2 = False
+
+        self._transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_keepalive_connections,
+                keepalive_expiry=self._keepalive_expiry
+            )
+        )
+
+        # httpx does not expose the network backend, so swap it on the httpcore pool
+        if self._dns_cache_ttl > 0 and hasattr(self._transport, '_pool'):
+            self._network_backend = CachingNetworkBackend(_ttl=self._dns_cache_ttl)
+            self._transport._pool._network_backend = self._network_backend
+
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            transport=self._transport,
+            timeout=self._timeout,
+            headers=self._headers
+        )
+        return self
+
+    async def close(self):
+        """Close the underlying client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._transport = None
+
+    async def request(self, _method, _url, _params=None, _json=None, _headers=None):
+        """
+        Send a request over the pooled client.
+
+        Args:
+            _method: HTTP method
+            _url: Path relative to the base URL (or absolute URL)
+            _params: Query parameters
+            _json: JSON body
+            _headers: Extra request headers
+
+        Returns:
+            httpx.Response
+        """
+        if self._client is None:
+            self.open()
+
+        self._requests = self._requests + 1
+        try:
+            response = await self._client.request(
+                method=_method,
+                url=_url,
+                params=_params,
+                json=_json,
+                headers=_headers
+            )
+        except Exception:
+            self._errors = self._errors + 1
+            raise
+
+        version = response.http_version
+        self._http_versions[version] = self._http_versions.get(version, 0) + 1
+        return response
+
+    def get_stats(self):
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary of request counts and connection states
+        """
+        connections = []
+        if self._transport is not None and hasattr(self._transport, '_pool'):
+            connections = self._transport._pool.connections
+
+        idle = 0
+        active = 0
+        for connection in connections:
+            if connection.is_idle() == True:
+                idle = idle + 1
+            else:
+                active = active + 1
+
+        stats = {
+            'base_url': self._base_url,
+            'open': True if self._client is not None else False,
+            'requests': self._requests,
+            'errors': self._errors,
+            'http_versions': dict(self._http_versions),
+            'connections': len(connections),
+            'active_connections': active,
+            'idle_connections': idle,
+            'max_connections': self._max_connections,
+            'max_keepalive_connections': self._max_keepalive_connections
+        }
+
+        if self._network_backend is not None:
+            stats['dns_cache_hits'] = self._network_backend.hits
+            stats['dns_cache_misses'] = self._network_backend.misses
+
+        return stats
@@ -0,0 +1,323 @@
+"""
+Market metadata cache for BotForm2.
+
+Two tiers: an in-process LRU with TTL (plus negative caching) in front of
+the `markets` table, in front of the Polymarket lookups. Entries are
+reachable by condition ID, token ID or slug.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List
+
+
+class MarketCache:
+    """LRU + Postgres cache for market metadata keyed by condition ID, token ID and slug."""
+
+    def __init__(self, _polymarket_client=None, _db_manager=None, _capacity=2000, _ttl=3600,
+                 _negative_ttl=300, _persistent_ttl=86400):
+        """
+        Initialize market cache.
+
+        Args:
+            _polymarket_client: Polymarket API client instance
+            _db_manager: Database manager instance (persistent tier, optional)
+            _capacity: Maximum markets kept in memory
+            _ttl: Seconds a market stays fresh in memory
+            _negative_ttl: Seconds a "not found" result is remembered
+            _persistent_ttl: Seconds a row in the markets table is trusted
+        """
+        self._polymarket_client = _polymarket_client
+        self._db_manager = _db_manager
+        self._capacity = _capacity
+        self._ttl = _ttl
+        self._negative_ttl = _negative_ttl
+        self._persistent_ttl = _persistent_ttl
+
+        self._entries = OrderedDict()  # condition_id -> entry
+        self._aliases = {}  # any key -> condition_id
+        self._negative = OrderedDict()  # key -> expiry, oldest first (bounded like the LRU)
+        self._inflight = {}  # key -> task
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._hits = 0
+        self._negative_hits = 0
+        self._db_hits = 0
+        self._upstream_fetches = 0
+        self._evictions = 0
+
+    @property
+    def size(self):
+        """Get number of markets held in memory."""
+        return len(self._entries)
+
+    def peek(self, _key):
+        """
+        Get a market from memory only, without any I/O.
+
+        Args:
+            _key: Condition ID, token ID or slug
+
+        Returns:
+            Market dictionary or None
+        """
+        canonical = self._aliases.get(_key)
+        if canonical is None:
+            return None
+
+        entry = self._entries.get(canonical)
+        if entry is None or entry['expires'] < time.monotonic():
+            return None
+
+        self._entries.move_to_end(canonical)
+        return entry['market']
+
+    def get_end_date(self, _key):
+        """
+        Get a cached market's end time without any I/O.
+
+        Args:
+            _key: Condition ID, token ID or slug
+
+        Returns:
+            Naive UTC datetime, or None if unknown or not cached
+        """
+        market = self.peek(_key)
+        if market is None:
+            return None
+        return self._end_date(market)
+
+    async def get_market(self, _key):
+        """
+        Get market metadata, loading it from Postgres or Polymarket on a miss.
+
+        Concurrent misses for the same key share one lookup.
+
+        Args:
+            _key: Condition ID, token ID or slug
+
+        Returns:
+            Market dictionary or None if the market cannot be found
+        """
+        if _key is None or _key == '':
+            return None
+
+        market = self.peek(_key)
+        if market is not None:
+            self._hits = self._hits + 1
+            return market
+
+        negative_expiry = self._negative.get(_key)
+        if negative_expiry is not None:
+            if negative_expiry > time.monotonic():
+                self._negative_hits = self._negative_hits + 1
+                return None
+            del self._negative[_key]
+
+        task = self._inflight.get(_key)
+        if task is None:
+            task = self._start_load(_key)
+
+        return await asyncio.shield(task)
+
+    def prefetch(self, _key):
+        """
+        Start loading a market in the background if it isn't cached.
+
+        Args:
+            _key: Condition ID, token ID or slug
+        """
+        if _key is None or _key == '':
+            return
+        if self.peek(_key) is not None or _key in self._inflight:
+            return
+
+        negative_expiry = self._negative.get(_key)
+        if negative_expiry is not None and negative_expiry > time.monotonic():
+            return
+
+        self._start_load(_key)
+
+    def get_stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary of sizes and counters
+        """
+        return {
+            'size': len(self._entries),
+            'capacity': self._capacity,
+            'aliases': len(self._aliases),
+            'negative': len(self._negative),
+            'inflight': len(self._inflight),
+            'hits': self._hits,
+            'negative_hits': self._negative_hits,
+            'db_hits': self._db_hits,
+            'upstream_fetches': self._upstream_fetches,
+            'evictions': self._evictions
+        }
+
+    def _start_load(self, _key):
+        """Start a shared background load for a key and register it as in flight."""
+        task = asyncio.create_task(self._load(_key))
+        self._inflight[_key] = task
+        task.add_done_callback(lambda _task: self._inflight.pop(_key, None))
+        return task
+
+    async def _load(self, _key):
+        """Load a market from Postgres, then Polymarket, and cache the result."""
+        try:
+            market = await self._load_from_db(_key)
+            if market is not None:
+                self._db_hits = self._db_hits + 1
+                self._store(_key, market)
+                return market
+
+            if self._polymarket_client is None:
+                return None
+
+            self._upstream_fetches = self._upstream_fetches + 1
+            market = await self._polymarket_client.get_market_info(_key)
+
+            if market is None:
+                # A miss while a metadata host is down says nothing about the market
+                if (self._polymarket_client.is_host_available('gamma') == True and
+                        self._polymarket_client.is_host_available('clob') == True):
+                    self._remember_missing(_key)
+                return None
+
+            self._store(_key, market)
+            await self._save_to_db(_key, market)
+            return market
+
+        except Exception as e:
+            self._logger.error("Failed to load market {}: {}".format(_key, str(e)))
+            return None
+
+    async def _load_from_db(self, _key):
+        """Look a market up in the persistent tier if the row is recent enough."""
+        if self._db_manager is None:
+            return None
+
+        try:
+            row = await self._db_manager.get_market(_key)
+        except Exception as e:
+            self._logger.debug("Market table lookup failed: {}".format(str(e)))
+            return None
+
+        if row is None or row.get('data') is None:
+            return None
+
+        fetched_at = row.get('fetched_at')
+        if fetched_at is not None and fetched_at < datetime.utcnow() - timedelta(seconds=self._persistent_ttl):
+            return None
+
+        return row['data']
+
+    async def _save_to_db(self, _key, _market):
+        """Write a market through to the persistent tier."""
+        if self._db_manager is None:
+            return
+
+        try:
+            await self._db_manager.upsert_market({
+                'condition_id': self._condition_id(_key, _market),
+                'slug': _market.get('slug') or _market.get('market_slug'),
+                'token_ids': self._token_ids(_market),
+                'question': _market.get('question') or _market.get('title'),
+                'end_date': self._end_date(_market),
+                'data': _market
+            })
+        except Exception as e:
+            self._logger.debug("Market table write failed: {}".format(str(e)))
+
+    def _remember_missing(self, _key):
+        """Remember a "not found" key, pruning expired ones and keeping at most capacity."""
+        now = time.monotonic()
+        self._negative.pop(_key, None)
+        self._negative[_key] = now + self._negative_ttl
+
+        # Every entry shares the same TTL, so the oldest expire first
+        while len(self._negative) > 0:
+            oldest_key, oldest_expiry = next(iter(self._negative.items()))
+            if oldest_expiry > now and len(self._negative) <= self._capacity:
+                break
+            del self._negative[oldest_key]
+
+    def _store(self, _key, _market):
+        """Insert a market into the LRU under all of its keys."""
+        canonical = self._condition_id(_key, _market)
+
+        keys = [_key, canonical]
+        slug = _market.get('slug') or _market.get('market_slug')
+        if slug:
+            keys.append(slug)
+        keys.extend(self._token_ids(_market))
+
+        existing = self._entries.pop(canonical, None)
+        if existing is not None:
+            for alias in existing['aliases']:
+                self._aliases.pop(alias, None)
+
+        self._entries[canonical] = {
+            'market': _market,
+            'aliases': keys,
+            'expires': time.monotonic() + self._ttl
+        }
+        for alias in keys:
+            self._aliases[alias] = canonical
+            self._negative.pop(alias, None)
+
+        while len(self._entries) > self._capacity:
+            evicted_id, evicted = self._entries.popitem(last=False)
+            for alias in evicted['aliases']:
+                if self._aliases.get(alias) == evicted_id:
+                    del self._aliases[alias]
+            self._evictions = self._evictions + 1
+
+    def _condition_id(self, _key, _market):
+        """Get a market's condition ID, falling back to the lookup key."""
+        return _market.get('conditionId') or _market.get('condition_id') or _key
+
+    def _token_ids(self, _market):
+        """Get a market's outcome token IDs from either the gamma or CLOB shape."""
+        token_ids = []
+
+        clob_token_ids = _market.get('clobTokenIds')
+        if isinstance(clob_token_ids, str):
+            try:
+                clob_token_ids = json.loads(clob_token_ids)
+            except ValueError:
+                clob_token_ids = []
+        if isinstance(clob_token_ids, list):
+            token_ids.extend([str(token_id) for token_id in clob_token_ids])
+
+        tokens = _market.get('tokens')
+        if isinstance(tokens, list):
+            for token in tokens:
+                if isinstance(token, dict) and token.get('token_id'):
+                    token_ids.append(str(token['token_id']))
+
+        return token_ids
+
+    def _end_date(self, _market):
+        """Get a market's end time as a naive UTC datetime, if present."""
+        value = _market.get('endDate') or _market.get('end_date_iso')
+        if not value:
+            return None
+
+        try:
+            parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
@@ -0,0 +1,246 @@
+"""
+Order book snapshot for BotForm2.
+
+Holds one outcome token's CLOB book as sorted price levels, updated in
+place from streamed level changes, and walks it to price a market order:
+volume-weighted fill price, slippage against a reference price, and how
+much of the order the visible depth (and an optional limit price) lets
+through.
+Follows bobbyofna coding style conventions.
+"""
+
+import time
+from typing import Optional, Dict, List
+
+
+class OrderBook:
+    """One token's bid and ask levels, best price first."""
+
+    def __init__(self, _token_id, _bids=None, _asks=None, _fetched_at=None):
+        """
+        Initialize order book.
+
+        Args:
+            _token_id: Outcome token ID
+            _bids: List of (price, size) tuples
+            _asks: List of (price, size) tuples
+            _fetched_at: Epoch seconds the snapshot was taken (defaults to now)
+        """
+        self._token_id = _token_id
+        self._bids = sorted([level for level in (_bids or []) if level[1] > 0], key=lambda level: -level[0])
+        self._asks = sorted([level for level in (_asks or []) if level[1] > 0], key=lambda level: level[0])
+        self._fetched_at = time.time() if _fetched_at is None else _fetched_at
+        self._updated_at = self._fetched_at
+        self._changes = 0
+
+    @classmethod
+    def from_clob(cls, _token_id, _data):
+        """
+        Build a book from a CLOB /book response.
+
+        Args:
+            _token_id: Outcome token ID
+            _data: Response with 'bids' and 'asks' lists of {'price', 'size'} (strings or numbers)
+
+        Returns:
+            OrderBook instance
+        """
+        return cls(
+            _token_id,
+            _bids=cls._parse_levels(_data.get('bids')),
+            _asks=cls._parse_levels(_data.get('asks'))
+        )
+
+    @staticmethod
+    def _parse_levels(_levels):
+        """Convert CLOB levels to (price, size) tuples, skipping malformed ones."""
+        levels = []
+        for level in _levels or []:
+            try:
+                levels.append((float(level['price']), float(level['size'])))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return levels
+
+    @property
+    def token_id(self):
+        """Get outcome token ID."""
+        return self._token_id
+
+    @property
+    def bids(self):
+        """Get bid levels, highest price first."""
+        return self._bids
+
+    @property
+    def asks(self):
+        """Get ask levels, lowest price first."""
+        return self._asks
+
+    @property
+    def fetched_at(self):
+        """Get epoch seconds the snapshot was taken."""
+        return self._fetched_at
+
+    @property
+    def updated_at(self):
+        """Get epoch seconds of the snapshot or the last applied change."""
+        return self._updated_at
+
+    @property
+    def changes(self):
+        """Get number of level changes applied since the snapshot."""
+        return self._changes
+
+    @property
+    def age(self):
+        """Get seconds since the book was last known to be current."""
+        return time.time() - self._updated_at
+
+    @property
+    def best_bid(self):
+        """Get highest bid price, or None if there are no bids."""
+        return self._bids[0][0] if len(self._bids) > 0 else None
+
+    @property
+    def best_ask(self):
+        """Get lowest ask price, or None if there are no asks."""
+        return self._asks[0][0] if len(self._asks) > 0 else None
+
+    @property
+    def spread(self):
+        """Get best ask minus best bid, or None if either side is empty."""
+        if len(self._bids) == 0 or len(self._asks) == 0:
+            return None
+        return self._asks[0][0] - self._bids[0][0]
+
+    @property
+    def midpoint(self):
+        """Get the midpoint of best bid and best ask, or None if either side is empty."""
+        if len(self._bids) == 0 or len(self._asks) == 0:
+            return None
+        return (self._asks[0][0] + self._bids[0][0]) / 2
+
+    def apply_change(self, _side, _price, _size):
+        """
+        Set one price level's size (0 removes the level).
+
+        Args:
+            _side: 'BUY' for bids, 'SELL' for asks
+            _price: Level price
+            _size: New total size at that price
+
+        Returns:
+            Self for chaining
+        """
+        price = float(_price)
+        size = float(_size)
+        is_bid = True if str(_side).upper() in ('BUY', 'BID', 'BIDS') else False
+        levels = self._bids if is_bid == True else self._asks
+
+        # Books are a few dozen levels deep, so a linear pass is enough
+        i = 0
+        while i < len(levels) and (levels[i][0] > price if is_bid == True else levels[i][0] < price):
+            i = i + 1
+
+        if i < len(levels) and levels[i][0] == price:
+            if size > 0:
+                levels[i] = (price, size)
+            else:
+                del levels[i]
+        elif size > 0:
+            levels.insert(i, (price, size))
+
+        self._updated_at = time.time()
+        self._changes = self._changes + 1
+        return self
+
+    def simulate_buy(self, _amount, _reference_price, _limit_price=None):
+        """
+        Price a market buy of a dollar amount against the asks.
+
+        Args:
+            _amount: Dollars to spend
+            _reference_price: Price the fill is compared with (e.g. the target's price)
+            _limit_price: Highest price to pay (no limit if None)
+
+        Returns:
+            Fill dictionary (see _fill())
+        """
+        remaining = float(_amount)
+        spent = 0.0
+        shares = 0.0
+        levels = 0
+        for price, size in self._asks:
+            if remaining <= 0:
+                break
+            if _limit_price is not None and price > _limit_price:
+                break
+
+            take = min(remaining, price * size)
+            spent = spent + take
+            shares = shares + take / price
+            remaining = remaining - take
+            levels = levels + 1
+
+        return self._fill('BUY', spent, shares, levels, _reference_price, remaining > 0.005)
+
+    def simulate_sell(self, _shares, _reference_price, _limit_price=None):
+        """
+        Price a market sell of a number of shares against the bids.
+
+        Args:
+            _shares: Shares to sell
+            _reference_price: Price the fill is compared with (e.g. the requested exit price)
+            _limit_price: Lowest price to accept (no limit if None)
+
+        Returns:
+            Fill dictionary (see _fill())
+        """
+        remaining = float(_shares)
+        proceeds = 0.0
+        sold = 0.0
+        levels = 0
+        for price, size in self._bids:
+            if remaining <= 0:
+                break
+            if _limit_price is not None and price < _limit_price:
+                break
+
+            take = min(remaining, size)
+            proceeds = proceeds + take * price
+            sold = sold + take
+            remaining = remaining - take
+            levels = levels + 1
+
+        return self._fill('SELL', proceeds, sold, levels, _reference_price, remaining > 1e-9)
+
+    def _fill(self, _side, _value, _shares, _levels, _reference_price, _partial):
+        """
+        Summarize a walk through the book.
+
+        Slippage is the fill price's shortfall against the reference price as
+        a fraction of it: positive when the fill is worse (paid more on a buy,
+        received less on a sell).
+
+        Returns:
+            Dictionary with side, filled (dollars), shares, price (VWAP, or
+            None if nothing filled), slippage, levels and partial
+        """
+        price = _value / _shares if _shares > 0 else None
+        slippage = None
+        if price is not None and _reference_price:
+            if _side == 'BUY':
+                slippage = (price - _reference_price) / _reference_price
+            else:
+                slippage = (_reference_price - price) / _reference_price
+
+        return {
+            'side': _side,
+            'filled': _value,
+            'shares': _shares,
+            'price': price,
+            'slippage': slippage,
+            'levels': _levels,
+            'partial': _partial
+        }
@@ -0,0 +1,328 @@
+"""
+Order book cache for BotForm2.
+
+Keeps CLOB order books only for outcome tokens that matter right now:
+tokens held in an open position (pinned until every holder releases them)
+and tokens of copies in flight (prefetched when the target's trade is
+detected, kept in a small LRU). Books start from a REST snapshot and are
+updated in place by streamed book/price_change events; a book nobody has
+confirmed within max_age is stale and is refetched before it is served.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+from collections import OrderedDict
+from typing import Optional, Dict, List
+
+from .order_book import OrderBook
+
+
+class OrderBookCache:
+    """Snapshot + delta order books for held and pending tokens, with staleness tracking."""
+
+    def __init__(self, _polymarket_client=None, _max_age=5.0, _refresh_interval=2.0, _capacity=200):
+        """
+        Initialize order book cache.
+
+        Args:
+            _polymarket_client: Polymarket API client instance
+            _max_age: Seconds without a snapshot or streamed change before a book is stale
+            _refresh_interval: Seconds between background checks that refetch stale held books
+            _capacity: Maximum books kept for tokens nobody holds (pending copies)
+        """
+        self._polymarket_client = _polymarket_client
+        self._max_age = _max_age
+        self._refresh_interval = _refresh_interval
+        self._capacity = max(int(_capacity), 0)
+
+        self._books = OrderedDict()  # token_id -> OrderBook, least recently used first
+        self._held = {}  # token_id -> reference count
+        self._inflight = {}  # token_id -> task fetching a snapshot
+        self._task = None
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._hits = 0
+        self._stale = 0
+        self._snapshots = 0
+        self._fetch_failures = 0
+        self._stream_snapshots = 0
+        self._deltas = 0
+        self._dropped_deltas = 0
+        self._stale_deltas = 0
+        self._refreshes = 0
+        self._evictions = 0
+
+    @property
+    def size(self):
+        """Get number of books in memory."""
+        return len(self._books)
+
+    async def start(self):
+        """
+        Start refreshing stale held books in the background.
+
+        Returns:
+            Self for chaining
+        """
+        if self._task is None and self._refresh_interval > 0:
+            self._task = asyncio.create_task(self._refresh_loop())
+        return self
+
+    async def stop(self):
+        """Stop the background refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for task in list(self._inflight.values()):
+            task.cancel()
+
+    def track_token(self, _token_id):
+        """
+        Pin a token's book while a position in it is open.
+
+        Args:
+            _token_id: Outcome token ID
+        """
+        if not _token_id:
+            return
+
+        self._held[_token_id] = self._held.get(_token_id, 0) + 1
+        if _token_id not in self._books:
+            self.prefetch(_token_id)
+
+    def untrack_token(self, _token_id):
+        """
+        Release a held token, dropping its book when no position holds it.
+
+        Args:
+            _token_id: Outcome token ID
+        """
+        count = self._held.get(_token_id, 0)
+        if count > 1:
+            self._held[_token_id] = count - 1
+            return
+
+        self._held.pop(_token_id, None)
+        if self._books.pop(_token_id, None) is not None:
+            self._evictions = self._evictions + 1
+
+    def is_held(self, _token_id):
+        """Check if a token's book is pinned by an open position."""
+        return True if _token_id in self._held else False
+
+    def prefetch(self, _token_id):
+        """
+        Start loading a token's book in the background (e.g. for a copy about to execute).
+
+        Args:
+            _token_id: Outcome token ID
+        """
+        if not _token_id or _token_id in self._inflight:
+            return
+        if self.peek(_token_id) is not None:
+            return
+        self._start_fetch(_token_id)
+
+    def peek(self, _token_id):
+        """
+        Get a token's book without fetching.
+
+        Args:
+            _token_id: Outcome token ID
+
+        Returns:
+            OrderBook if cached and not stale, else None
+        """
+        book = self._books.get(_token_id)
+        if book is None or book.age > self._max_age:
+            return None
+        return book
+
+    def best_bid(self, _token_id):
+        """Get a token's cached best bid (None if not cached, stale or empty)."""
+        book = self.peek(_token_id)
+        return book.best_bid if book is not None else None
+
+    def best_ask(self, _token_id):
+        """Get a token's cached best ask (None if not cached, stale or empty)."""
+        book = self.peek(_token_id)
+        return book.best_ask if book is not None else None
+
+    async def get_book(self, _token_id):
+        """
+        Get a current book for a token, fetching a snapshot if it is missing or stale.
+
+        Concurrent callers share one fetch.
+
+        Args:
+            _token_id: Outcome token ID
+
+        Returns:
+            OrderBook, or None if no current book could be had
+        """
+        book = self.peek(_token_id)
+        if book is not None:
+            self._hits = self._hits + 1
+            self._books.move_to_end(_token_id)
+            return book
+
+        if _token_id in self._books:
+            self._stale = self._stale + 1
+
+        task = self._inflight.get(_token_id)
+        if task is None:
+            task = self._start_fetch(_token_id)
+        return await asyncio.shield(task)
+
+    def apply_stream_event(self, _data):
+        """
+        Apply a streamed book snapshot or level change.
+
+        Understands CLOB market-channel events: 'book' (full snapshot with
+        bids/asks) and 'price_change' (changes with price, side, size).
+        Changes for tokens without a cached book are dropped; the next
+        lookup starts from a fresh snapshot instead. Changes for a stale
+        book are dropped too (it may have missed others during a stream
+        gap, and applying one would make it look current) and a snapshot
+        is fetched in its place.
+
+        Args:
+            _data: Event dictionary
+
+        Returns:
+            Number of books updated
+        """
+        event_type = _data.get('event_type')
+
+        if event_type == 'book':
+            token_id = _data.get('asset_id')
+            if not token_id or (token_id not in self._held and token_id not in self._books):
+                return 0
+            self._store(token_id, OrderBook.from_clob(token_id, _data))
+            self._stream_snapshots = self._stream_snapshots + 1
+            return 1
+
+        if event_type != 'price_change':
+            return 0
+
+        changes = _data.get('price_changes') or _data.get('changes') or []
+        updated = set()
+        for change in changes:
+            token_id = change.get('asset_id') or _data.get('asset_id')
+            book = self._books.get(token_id)
+            if book is None:
+                self._dropped_deltas = self._dropped_deltas + 1
+                continue
+
+            if book.age > self._max_age:
+                self._stale_deltas = self._stale_deltas + 1
+                if token_id not in self._inflight:
+                    self._start_fetch(token_id)
+                continue
+
+            try:
+                book.apply_change(change['side'], change['price'], change['size'])
+            except (KeyError, TypeError, ValueError):
+                self._dropped_deltas = self._dropped_deltas + 1
+                continue
+
+            self._deltas = self._deltas + 1
+            updated.add(token_id)
+
+        return len(updated)
+
+    def _start_fetch(self, _token_id):
+        """Start a snapshot fetch, registered as in flight until it finishes."""
+        task = asyncio.create_task(self._fetch_book(_token_id))
+        self._inflight[_token_id] = task
+        task.add_done_callback(lambda _task, _token_id=_token_id: self._inflight.pop(_token_id, None))
+        return task
+
+    async def _fetch_book(self, _token_id):
+        """Fetch and store one REST snapshot."""
+        if self._polymarket_client is None:
+            return None
+
+        self._snapshots = self._snapshots + 1
+        try:
+            data = await self._polymarket_client.get_order_book(_token_id)
+        except Exception as e:
+            self._logger.debug("Failed to fetch order book for {}: {}".format(_token_id, str(e)))
+            data = None
+
+        if data is None:
+            self._fetch_failures = self._fetch_failures + 1
+            return None
+
+        book = OrderBook.from_clob(_token_id, data)
+        self._store(_token_id, book)
+        return book
+
+    def _store(self, _token_id, _book):
+        """Store a book as most recently used and evict unheld books over capacity."""
+        self._books[_token_id] = _book
+        self._books.move_to_end(_token_id)
+
+        unheld = [token_id for token_id in self._books.keys() if token_id not in self._held]
+        excess = len(unheld) - self._capacity
+        i = 0
+        while i < excess:
+            del self._books[unheld[i]]
+            self._evictions = self._evictions + 1
+            i = i + 1
+
+    async def _refresh_loop(self):
+        """Refetch held books that have gone stale (no stream update within max_age)."""
+        while True:
+            try:
+                await asyncio.sleep(self._refresh_interval)
+
+                due = []
+                for token_id in list(self._held.keys()):
+                    book = self._books.get(token_id)
+                    if (book is None or book.age > self._max_age) and token_id not in self._inflight:
+                        due.append(token_id)
+
+                if len(due) > 0:
+                    tasks = [self._start_fetch(token_id) for token_id in due]
+                    await asyncio.gather(*[asyncio.shield(task) for task in tasks], return_exceptions=True)
+                    self._refreshes = self._refreshes + len(due)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self._logger.error("Order book refresh failed: {}".format(str(e)))
+
+    def get_stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary of sizes, counters and the oldest held book's age
+        """
+        held_ages = [self._books[token_id].age for token_id in self._held.keys() if token_id in self._books]
+        return {
+            'books': len(self._books),
+            'held_tokens': len(self._held),
+            'inflight': len(self._inflight),
+            'capacity': self._capacity,
+            'max_age': self._max_age,
+            'hits': self._hits,
+            'stale': self._stale,
+            'snapshots': self._snapshots,
+            'fetch_failures': self._fetch_failures,
+            'stream_snapshots': self._stream_snapshots,
+            'deltas': self._deltas,
+            'dropped_deltas': self._dropped_deltas,
+            'stale_deltas': self._stale_deltas,
+            'refreshes': self._refreshes,
+            'evictions': self._evictions,
+            'oldest_held_age': round(max(held_ages), 2) if len(held_ages) > 0 else None
+        }
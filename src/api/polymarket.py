@@ -7,15 +7,29 @@ Follows bobbyofna coding style conventions.
 
 import logging
 import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
 from typing import Optional, Dict, List, Any
 import httpx
-from datetime import datetime
+from datetime import datetime, timezone
+
+from .connection_pool import HostConnectionPool
+from .rate_limiter import HostRateLimiter, PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from ..utils.metrics import LatencyTracker
+from ..models.activity import decode_activities
 
 
 class PolymarketClient:
     """Async HTTP client for Polymarket API."""
 
-    def __init__(self, _api_key='', _api_secret='', _base_url='https://api.polymarket.com'):
+    def __init__(self, _api_key='', _api_secret='', _base_url='https://api.polymarket.com', _http2=True,
+                 _max_connections=20, _max_keepalive_connections=10, _keepalive_expiry=30.0, _timeout=10.0,
+                 _dns_cache_ttl=300.0, _rate_limit=5.0, _rate_burst=5, _max_concurrency=4, _max_retries=3,
+                 _max_backoff=30.0, _coalesce_ttl=0.0, _hedge_percentile=95.0, _hedge_min_delay=0.05,
+                 _hedge_default_delay=1.0, _breaker_threshold=5, _breaker_recovery=30.0, _data_url=None,
+                 _gamma_url=None, _clob_url=None, _strapi_url=None, _order_timeout=30.0):
         """
         Initialize Polymarket client.
 
@@ -23,59 +37,540 @@ class PolymarketClient:
             _api_key: Polymarket API key
             _api_secret: Polymarket API secret
             _base_url: Base URL for Polymarket API (legacy)
+            _http2: Whether pooled connections negotiate HTTP/2
+            _max_connections: Maximum open connections per host
+            _max_keepalive_connections: Maximum idle keep-alive connections per host
+            _keepalive_expiry: Seconds an idle connection is kept per host
+            _timeout: Request timeout in seconds
+            _order_timeout: Request timeout for the legacy host, which places and cancels orders
+            _dns_cache_ttl: Seconds to cache DNS lookups (0 disables caching)
+            _rate_limit: Sustained requests per second per host (0 disables)
+            _rate_burst: Token bucket burst size per host
+            _max_concurrency: Maximum in-flight requests per host
+            _max_retries: Maximum retries after a 429 response
+            _max_backoff: Maximum backoff between retries in seconds
+            _coalesce_ttl: Seconds a successful GET response is reused for identical requests (0 disables)
+            _hedge_percentile: Primary latency percentile after which the fallback is fired (0 disables hedging)
+            _hedge_min_delay: Lower bound on the hedge delay in seconds
+            _hedge_default_delay: Hedge delay used until enough latency samples exist
+            _breaker_threshold: Consecutive failures that open a host's circuit breaker
+            _breaker_recovery: Seconds a host's breaker stays open before probing
+            _data_url: Data API base URL override (e.g. the local fake server)
+            _gamma_url: Gamma API base URL override
+            _clob_url: CLOB API base URL override
+            _strapi_url: Strapi base URL override
         """
         self._api_key = _api_key
         self._api_secret = _api_secret
         self._base_url = _base_url
 
         # Polymarket has 4 primary API services
-        self._clob_url = 'https://clob.polymarket.com'  # Central Limit Order Book
-        self._gamma_url = 'https://gamma-api.polymarket.com'  # Market data
-        self._strapi_url = 'https://strapi-matic.poly.market'  # Alternative endpoint
-        self._data_url = 'https://data-api.polymarket.com'  # Data API
-
-        self._client = None
+        self._clob_url = _clob_url or 'https://clob.polymarket.com'  # Central Limit Order Book
+        self._gamma_url = _gamma_url or 'https://gamma-api.polymarket.com'  # Market data
+        self._strapi_url = _strapi_url or 'https://strapi-matic.poly.market'  # Alternative endpoint
+        self._data_url = _data_url or 'https://data-api.polymarket.com'  # Data API
+
+        # One long-lived connection pool per upstream host
+        self._pool_settings = {
+            '_http2': _http2,
+            '_max_connections': _max_connections,
+            '_max_keepalive_connections': _max_keepalive_connections,
+            '_keepalive_expiry': _keepalive_expiry,
+            '_timeout': _timeout,
+            '_dns_cache_ttl': _dns_cache_ttl
+        }
+        self._order_timeout = _order_timeout
+        self._pools = {}
         self._logger = logging.getLogger(__name__)
 
-        # Rate limiting
-        self._rate_limit_delay = 0.2  # 200ms minimum delay
-        self._last_request_time = None
-        self._backoff_time = 1.0  # Initial backoff time for 429 errors
+        # Rate limiting: one token bucket and concurrency gate per upstream host
+        self._limiter_settings = {
+            '_rate': _rate_limit,
+            '_burst': _rate_burst,
+            '_max_concurrency': _max_concurrency
+        }
+        self._limiters = {}
+        self._max_retries = _max_retries
+        self._max_backoff = _max_backoff
+        self._retries = 0
+
+        # Single-flight: identical concurrent GETs share one upstream call
+        self._coalesce_ttl = _coalesce_ttl
+        self._inflight = {}  # request key -> task
+        self._recent_responses = {}  # request key -> (response, expiry)
+        self._coalesced = 0
+        self._reused = 0
+
+        # Hedged fetches: per-endpoint latency drives when the fallback is fired
+        self._hedge_percentile = _hedge_percentile
+        self._hedge_min_delay = _hedge_min_delay
+        self._hedge_default_delay = _hedge_default_delay
+        self._latency = {}  # endpoint name -> LatencyTracker
+        self._hedges = 0
+        self._hedge_wins = 0
+
+        # Circuit breakers: fail fast while a host is down
+        self._breaker_settings = {
+            '_failure_threshold': _breaker_threshold,
+            '_recovery_timeout': _breaker_recovery
+        }
+        self._breakers = {}
 
     @property
     def base_url(self):
         """Get base URL."""
         return self._base_url
 
+    @property
+    def host_urls(self):
+        """Get mapping of host name to base URL."""
+        return {
+            'legacy': self._base_url,
+            'data': self._data_url,
+            'gamma': self._gamma_url,
+            'clob': self._clob_url,
+            'strapi': self._strapi_url
+        }
+
     async def initialize(self):
-        """Initialize HTTP client."""
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=30.0,
-            headers={
-                'User-Agent': 'BotForm2/1.0'
-            }
-        )
-        self._logger.info("Polymarket client initialized")
+        """Initialize persistent per-host connection pools."""
+        for name in self.host_urls.keys():
+            self._get_pool(name)
+        self._logger.info("Polymarket client initialized ({} host pools)".format(len(self._pools)))
         return self
 
     async def close(self):
-        """Close HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._logger.info("Polymarket client closed")
+        """Close all host connection pools."""
+        for pool in self._pools.values():
+            await pool.close()
+        self._pools.clear()
+        self._logger.info("Polymarket client closed")
+
+    def _get_pool(self, _host):
+        """
+        Get (creating if needed) the connection pool for a host.
+
+        Args:
+            _host: Host name ('legacy', 'data', 'gamma', 'clob', 'strapi')
+
+        Returns:
+            HostConnectionPool instance
+        """
+        pool = self._pools.get(_host)
+        if pool is None:
+            settings = dict(self._pool_settings)
+
+            # A timed-out order leaves its status unknown, so order calls get longer to complete
+            if _host == 'legacy':
+                settings['_timeout'] = self._order_timeout
+
+            pool = HostConnectionPool(
+                _name=_host,
+                _base_url=self.host_urls[_host],
+                _headers={'User-Agent': 'BotForm2/1.0'},
+                **settings
+            )
+            pool.open()
+            self._pools[_host] = pool
+        return pool
+
+    def get_pool_stats(self):
+        """
+        Get connection pool statistics for every host.
+
+        Returns:
+            Dictionary of host name to pool stats
+        """
+        stats = {}
+        for name, pool in self._pools.items():
+            stats[name] = pool.get_stats()
+        return stats
+
+    def _get_limiter(self, _host):
+        """
+        Get (creating if needed) the rate limiter for a host.
+
+        Args:
+            _host: Host name
+
+        Returns:
+            HostRateLimiter instance
+        """
+        limiter = self._limiters.get(_host)
+        if limiter is None:
+            limiter = HostRateLimiter(_name=_host, **self._limiter_settings)
+            self._limiters[_host] = limiter
+        return limiter
+
+    def _get_breaker(self, _host):
+        """
+        Get (creating if needed) the circuit breaker for a host.
+
+        Args:
+            _host: Host name
+
+        Returns:
+            CircuitBreaker instance
+        """
+        breaker = self._breakers.get(_host)
+        if breaker is None:
+            breaker = CircuitBreaker(_name=_host, **self._breaker_settings)
+            self._breakers[_host] = breaker
+        return breaker
+
+    def get_circuit_stats(self):
+        """
+        Get circuit breaker state and health for every host.
+
+        Returns:
+            Dictionary of host name to breaker stats
+        """
+        stats = {}
+        for name, breaker in self._breakers.items():
+            stats[name] = breaker.get_stats()
+        return stats
+
+    def is_host_available(self, _host):
+        """
+        Check if a host's breaker currently lets requests through.
+
+        Args:
+            _host: Host name
+
+        Returns:
+            True unless the host's breaker is open
+        """
+        breaker = self._breakers.get(_host)
+        if breaker is None:
+            return True
+        return False if breaker.is_open == True else True
+
+    def get_rate_limit_stats(self):
+        """
+        Get rate limiter statistics for every host.
+
+        Returns:
+            Dictionary of host name to limiter stats
+        """
+        stats = {}
+        for name, limiter in self._limiters.items():
+            stats[name] = limiter.get_stats()
+        stats['retries'] = self._retries
+        return stats
+
+    def get_coalescing_stats(self):
+        """
+        Get request coalescing statistics.
+
+        Returns:
+            Dictionary of in-flight and reuse counters
+        """
+        return {
+            'ttl': self._coalesce_ttl,
+            'inflight': len(self._inflight),
+            'cached': len(self._recent_responses),
+            'coalesced': self._coalesced,
+            'reused': self._reused
+        }
+
+    def get_latency_stats(self):
+        """
+        Get per-endpoint latency and hedging statistics.
+
+        Returns:
+            Dictionary of endpoint name to latency stats, plus hedge counters
+        """
+        stats = {}
+        for name, tracker in self._latency.items():
+            stats[name] = tracker.get_stats()
+        stats['hedges'] = self._hedges
+        stats['hedge_wins'] = self._hedge_wins
+        return stats
+
+    def _get_latency_tracker(self, _endpoint):
+        """Get (creating if needed) the latency tracker for an endpoint."""
+        tracker = self._latency.get(_endpoint)
+        if tracker is None:
+            tracker = LatencyTracker()
+            self._latency[_endpoint] = tracker
+        return tracker
+
+    def _hedge_delay(self, _endpoint):
+        """
+        Work out how long to give an endpoint before firing its fallback.
+
+        Args:
+            _endpoint: Primary endpoint name
+
+        Returns:
+            Delay in seconds (the endpoint's latency percentile once it has enough samples)
+        """
+        tracker = self._get_latency_tracker(_endpoint)
+        if tracker.count < 20:
+            return self._hedge_default_delay
+        return max(tracker.percentile(self._hedge_percentile), self._hedge_min_delay)
+
+    async def _timed_send(self, _endpoint, _host, _path, _params=None, _priority=PRIORITY_NORMAL, _decoder=None):
+        """
+        Send a GET and record its latency against an endpoint name.
+
+        A call cancelled by a hedge still records how long it had taken,
+        so a slow endpoint keeps pulling its percentile up.
+
+        Args:
+            _endpoint: Endpoint name used for latency tracking
+            _host: Host name
+            _path: Path relative to the host base URL
+            _params: Query parameters
+            _priority: Request priority
+            _decoder: Callable turning the raw body into results (JSON decode if None)
+
+        Returns:
+            List of results, or None for an error, non-200 or empty response
+        """
+        tracker = self._get_latency_tracker(_endpoint)
+        started = time.monotonic()
+        try:
+            response = await self._send(_host, 'GET', _path, _params=_params, _priority=_priority)
+        except asyncio.CancelledError:
+            tracker.record(time.monotonic() - started)
+            raise
+        except Exception as e:
+            self._logger.debug("{} failed: {}".format(_endpoint, str(e)))
+            return None
+        tracker.record(time.monotonic() - started)
+
+        if response.status_code != 200:
+            return None
+        try:
+            results = _decoder(response.content) if _decoder is not None else response.json()
+        except Exception as e:
+            self._logger.debug("{} returned an undecodable body: {}".format(_endpoint, str(e)))
+            return None
+        if results is None or len(results) == 0:
+            return None
+        return results
+
+    async def _hedged_fetch(self, _primary_endpoint, _primary, _fallback):
+        """
+        Run a primary fetch, firing the fallback if the primary is slow or fails.
 
-    async def _wait_for_rate_limit(self):
-        """Enforce rate limiting between requests."""
-        if self._last_request_time is not None:
-            elapsed = datetime.now().timestamp() - self._last_request_time
-            if elapsed < self._rate_limit_delay:
-                wait_time = self._rate_limit_delay - elapsed
-                await asyncio.sleep(wait_time)
+        The fallback starts once the primary has taken longer than its
+        latency percentile, or straight away if the primary comes back bad.
+        The first good result wins and the other call is cancelled.
 
-        self._last_request_time = datetime.now().timestamp()
+        Args:
+            _primary_endpoint: Primary endpoint name (for its latency threshold)
+            _primary: Coroutine for the primary fetch (returns results or None)
+            _fallback: Zero-argument callable creating the fallback coroutine
 
-    async def _request(self, _method, _endpoint, _params=None, _data=None):
+        Returns:
+            List of results (empty if neither call produced any)
+        """
+        primary_task = asyncio.create_task(_primary)
+        pending = {primary_task}
+
+        try:
+            if self._hedge_percentile > 0:
+                done, pending = await asyncio.wait(pending, timeout=self._hedge_delay(_primary_endpoint))
+            else:
+                done, pending = await asyncio.wait(pending)
+
+            if primary_task in done and primary_task.result() is not None:
+                return primary_task.result()
+
+            fallback_task = asyncio.create_task(_fallback())
+            pending.add(fallback_task)
+            if primary_task.done() == False:
+                self._hedges = self._hedges + 1
+
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.result() is not None:
+                        if task is fallback_task and primary_task.done() == False:
+                            self._hedge_wins = self._hedge_wins + 1
+                        return task.result()
+
+            return []
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _request_key(self, _host, _path, _params):
+        """Build the identity of a GET request for coalescing."""
+        params = ()
+        if _params is not None:
+            params = tuple(sorted((str(key), str(value)) for key, value in _params.items()))
+        return (_host, _path, params)
+
+    def _retry_delay(self, _response, _attempt):
+        """
+        Work out how long to wait before retrying a throttled request.
+
+        Honors Retry-After (seconds or HTTP date); otherwise uses capped
+        exponential backoff. Jitter is added either way so bots don't retry in lockstep.
+
+        Args:
+            _response: The 429 response
+            _attempt: Zero-based retry attempt
+
+        Returns:
+            Delay in seconds
+        """
+        retry_after = _response.headers.get('Retry-After')
+        if retry_after is not None:
+            delay = None
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+
+            if delay is not None:
+                delay = min(max(delay, 0.0), self._max_backoff)
+                return delay + random.uniform(0, min(1.0, delay * 0.1 + 0.1))
+
+        backoff = min(self._max_backoff, 1.0 * (2 ** _attempt))
+        return random.uniform(backoff / 2, backoff)
+
+    async def _send(self, _host, _method, _path, _params=None, _data=None, _priority=PRIORITY_NORMAL):
+        """
+        Send a request to a host, sharing identical concurrent GETs.
+
+        A GET that matches one already in flight waits for that call's
+        response instead of going upstream again; with a coalescing TTL a
+        successful response is also reused for that many seconds.
+
+        Args:
+            _host: Host name ('legacy', 'data', 'gamma', 'clob', 'strapi')
+            _method: HTTP method
+            _path: Path relative to the host base URL
+            _params: Query parameters
+            _data: JSON body
+            _priority: PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW
+
+        Returns:
+            httpx.Response (the last 429 if retries are exhausted)
+        """
+        if _method.upper() != 'GET':
+            return await self._send_upstream(_host, _method, _path, _params, _data, _priority)
+
+        key = self._request_key(_host, _path, _params)
+
+        if self._coalesce_ttl > 0:
+            cached = self._recent_responses.get(key)
+            if cached is not None:
+                if cached[1] > time.monotonic():
+                    self._reused = self._reused + 1
+                    return cached[0]
+                del self._recent_responses[key]
+
+        entry = self._inflight.get(key)
+        if entry is not None:
+            self._coalesced = self._coalesced + 1
+        else:
+            task = asyncio.create_task(self._send_upstream(_host, _method, _path, _params, _data, _priority))
+            entry = {'task': task, 'waiters': 0}
+            self._inflight[key] = entry
+            task.add_done_callback(lambda _task: self._finish_inflight(key, _task))
+
+        # Shielded so one caller giving up doesn't cancel the call for everyone else;
+        # the upstream call is only cancelled once its last caller has gone
+        entry['waiters'] = entry['waiters'] + 1
+        try:
+            return await asyncio.shield(entry['task'])
+        except asyncio.CancelledError:
+            if entry['waiters'] == 1 and entry['task'].done() == False:
+                entry['task'].cancel()
+            raise
+        finally:
+            entry['waiters'] = entry['waiters'] - 1
+
+    def _finish_inflight(self, _key, _task):
+        """Drop a completed GET from the in-flight registry, keeping successes for the TTL."""
+        self._inflight.pop(_key, None)
+
+        # Always retrieve the outcome, even if every caller has stopped waiting
+        if _task.cancelled() == True or _task.exception() is not None or self._coalesce_ttl <= 0:
+            return
+
+        response = _task.result()
+        if response.status_code == 200:
+            self._recent_responses[_key] = (response, time.monotonic() + self._coalesce_ttl)
+
+        # Keep the reuse cache from growing without bound
+        if len(self._recent_responses) > 1000:
+            now = time.monotonic()
+            expired = [key for key, entry in self._recent_responses.items() if entry[1] <= now]
+            for key in expired:
+                del self._recent_responses[key]
+
+    async def _send_upstream(self, _host, _method, _path, _params=None, _data=None, _priority=PRIORITY_NORMAL):
+        """
+        Send a request to a host over its persistent pool, within its rate limit.
+
+        Throttled (429) responses are retried up to the retry cap; the whole
+        host is paused for the backoff so other requests don't pile on.
+        Connection errors, timeouts and 5xx responses count against the
+        host's circuit breaker; while it is open requests fail immediately.
+
+        Args:
+            _host: Host name ('legacy', 'data', 'gamma', 'clob', 'strapi')
+            _method: HTTP method
+            _path: Path relative to the host base URL
+            _params: Query parameters
+            _data: JSON body
+            _priority: PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW
+
+        Returns:
+            httpx.Response (the last 429 if retries are exhausted)
+
+        Raises:
+            CircuitOpenError: If the host's circuit breaker is open
+        """
+        pool = self._get_pool(_host)
+        limiter = self._get_limiter(_host)
+        breaker = self._get_breaker(_host)
+
+        attempt = 0
+        while True:
+            probe = breaker.before_request()
+            try:
+                await limiter.acquire(_priority)
+                try:
+                    response = await pool.request(_method, _path, _params=_params, _json=_data)
+                finally:
+                    limiter.release()
+            except asyncio.CancelledError:
+                breaker.record_cancelled(probe)
+                raise
+            except Exception as e:
+                breaker.record_failure("{}: {}".format(type(e).__name__, str(e)), probe)
+                raise
+
+            if response.status_code >= 500:
+                breaker.record_failure("HTTP {}".format(response.status_code), probe)
+            else:
+                breaker.record_success(probe)
+
+            if response.status_code != 429 or attempt >= self._max_retries:
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            limiter.pause(delay)
+            self._retries = self._retries + 1
+            self._logger.warning("Rate limit hit on {}, retry {}/{} in {:.2f}s".format(
+                _host, attempt + 1, self._max_retries, delay
+            ))
+            await asyncio.sleep(delay)
+            attempt = attempt + 1
+
+    async def _request(self, _method, _endpoint, _params=None, _data=None, _priority=PRIORITY_NORMAL):
         """
         Make HTTP request with rate limiting and error handling.
 
@@ -84,34 +579,22 @@ class PolymarketClient:
             _endpoint: API endpoint
             _params: Query parameters
             _data: Request body data
+            _priority: Request priority
 
         Returns:
             Response JSON data
         """
-        await self._wait_for_rate_limit()
-
         try:
-            response = await self._client.request(
-                method=_method,
-                url=_endpoint,
-                params=_params,
-                json=_data
+            response = await self._send(
+                'legacy', _method, _endpoint, _params=_params, _data=_data, _priority=_priority
             )
 
-            # Handle rate limiting
-            if response.status_code == 429:
-                self._logger.warning("Rate limit hit, backing off for {}s".format(self._backoff_time))
-                await asyncio.sleep(self._backoff_time)
-                self._backoff_time = self._backoff_time * 2  # Exponential backoff
-                return await self._request(_method, _endpoint, _params, _data)
-
-            # Reset backoff on success
-            if response.status_code == 200:
-                self._backoff_time = 1.0
-
             response.raise_for_status()
             return response.json()
 
+        except CircuitOpenError as e:
+            self._logger.debug(str(e))
+            raise
         except httpx.HTTPStatusError as e:
             self._logger.error("HTTP error {}: {}".format(e.response.status_code, str(e)))
             raise
@@ -152,50 +635,101 @@ class PolymarketClient:
             Market information dictionary with 'question' or 'title' field, or None
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as temp_client:
-                # Try Gamma API first (market data endpoint)
-                gamma_url = "{}/markets/{}".format(self._gamma_url, _market_id)
-
-                try:
-                    response = await temp_client.get(gamma_url)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data and ('question' in data or 'title' in data):
-                            return data
-                except Exception:
-                    pass
+            # Try Gamma API first (market data endpoint)
+            try:
+                response = await self._send('gamma', 'GET', "/markets/{}".format(_market_id), _priority=PRIORITY_LOW)
+                if response.status_code == 200:
+                    data = response.json()
+                    if data and ('question' in data or 'title' in data):
+                        return data
+            except Exception:
+                pass
 
-                # Try CLOB API markets endpoint
-                clob_url = "{}/markets/{}".format(self._clob_url, _market_id)
+            # Try CLOB API markets endpoint
+            try:
+                response = await self._send('clob', 'GET', "/markets/{}".format(_market_id), _priority=PRIORITY_LOW)
+                if response.status_code == 200:
+                    data = response.json()
+                    if data and ('question' in data or 'title' in data):
+                        return data
+            except Exception:
+                pass
 
-                try:
-                    response = await temp_client.get(clob_url)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data and ('question' in data or 'title' in data):
-                            return data
-                except Exception:
-                    pass
-
-                # Try searching for the market
-                search_url = "{}/markets".format(self._gamma_url)
-                try:
-                    response = await temp_client.get(search_url, params={'id': _market_id})
-                    if response.status_code == 200:
-                        results = response.json()
-                        if results and len(results) > 0:
-                            return results[0]
-                except Exception:
-                    pass
+            # Try searching for the market
+            try:
+                response = await self._send(
+                    'gamma', 'GET', "/markets", _params={'id': _market_id}, _priority=PRIORITY_LOW
+                )
+                if response.status_code == 200:
+                    results = response.json()
+                    if results and len(results) > 0:
+                        return results[0]
+            except Exception:
+                pass
 
-                self._logger.warning("Could not fetch market info for: {}".format(_market_id))
-                return None
+            self._logger.warning("Could not fetch market info for: {}".format(_market_id))
+            return None
 
         except Exception as e:
             self._logger.error("Failed to get market info: {}".format(str(e)))
             return None
 
-    async def place_order(self, _market_id, _outcome, _amount, _price):
+    async def get_market_trades(self, _market_id, _limit=5, _priority=PRIORITY_HIGH):
+        """
+        Get the most recent trades for a market from all users.
+
+        Args:
+            _market_id: Market/condition ID
+            _limit: Number of recent trades to return
+            _priority: Request priority (stop-loss price checks are high priority)
+
+        Returns:
+            List of trades (newest first), empty on failure
+        """
+        params = {
+            'condition_id': _market_id,
+            '_limit': _limit,
+            '_sort': 'timestamp:desc'
+        }
+
+        try:
+            response = await self._send('data', 'GET', "/trades", _params=params, _priority=_priority)
+            if response.status_code == 200:
+                trades = response.json()
+                if trades is not None:
+                    return trades
+            return []
+
+        except Exception as e:
+            self._logger.debug("Failed to get market trades: {}".format(str(e)))
+            return []
+
+    async def get_order_book(self, _token_id, _priority=PRIORITY_HIGH):
+        """
+        Get the CLOB order book for an outcome token.
+
+        Args:
+            _token_id: Outcome token ID
+            _priority: Request priority
+
+        Returns:
+            Book dictionary with 'bids' and 'asks' lists of {'price', 'size'}, or None on failure
+        """
+        try:
+            response = await self._send(
+                'clob', 'GET', "/book", _params={'token_id': _token_id}, _priority=_priority
+            )
+            if response.status_code == 200:
+                book = response.json()
+                if isinstance(book, dict):
+                    return book
+            return None
+
+        except Exception as e:
+            self._logger.debug("Failed to get order book: {}".format(str(e)))
+            return None
+
+    async def place_order(self, _market_id, _outcome, _amount, _price, _side='BUY'):
         """
         Place an order on Polymarket.
 
@@ -204,6 +738,7 @@ class PolymarketClient:
             _outcome: Outcome to trade ('YES' or 'NO')
             _amount: Amount in dollars
             _price: Price (probability between 0 and 1)
+            _side: 'BUY' or 'SELL'
 
         Returns:
             Order response dictionary
@@ -212,14 +747,15 @@ class PolymarketClient:
         data = {
             'market_id': _market_id,
             'outcome': _outcome,
+            'side': _side,
             'amount': float(_amount),
             'price': float(_price)
         }
 
         try:
-            response = await self._request('POST', endpoint, _data=data)
-            self._logger.info("Order placed: market={}, outcome={}, amount={}".format(
-                _market_id, _outcome, _amount
+            response = await self._request('POST', endpoint, _data=data, _priority=PRIORITY_HIGH)
+            self._logger.info("Order placed: market={}, outcome={}, side={}, amount={}".format(
+                _market_id, _outcome, _side, _amount
             ))
             return response
         except Exception as e:
@@ -239,7 +775,7 @@ class PolymarketClient:
         endpoint = "/orders/{}".format(_order_id)
 
         try:
-            response = await self._request('DELETE', endpoint)
+            response = await self._request('DELETE', endpoint, _priority=PRIORITY_HIGH)
             self._logger.info("Order cancelled: {}".format(_order_id))
             return response
         except Exception as e:
@@ -290,36 +826,33 @@ class PolymarketClient:
 
             # Try to validate with Polymarket API
             try:
-                # Create a separate client for this request to use correct base URL
-                async with httpx.AsyncClient(timeout=10.0) as temp_client:
-                    # Try Strapi API for user activity (most reliable for user data)
-                    url = "{}/api/users".format(self._strapi_url)
-                    params = {'filters[address][$eq]': _user_address}
-
-                    response = await temp_client.get(url, params=params)
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        if 'data' in data and len(data['data']) > 0:
-                            return {
-                                'valid': True,
-                                'message': 'User found on Polymarket',
-                                'data': data['data'][0]
-                            }
-
-                    # Try alternative: check if we can get any data about this address
-                    # Using data API to look for trades
-                    data_url = "{}/trades?maker={}".format(self._data_url, _user_address)
-                    response2 = await temp_client.get(data_url)
-
-                    if response2.status_code == 200:
-                        trades_data = response2.json()
-                        if trades_data and len(trades_data) > 0:
-                            return {
-                                'valid': True,
-                                'message': 'User found on Polymarket',
-                                'data': trades_data[0]
-                            }
+                # Try Strapi API for user activity (most reliable for user data)
+                params = {'filters[address][$eq]': _user_address}
+                response = await self._send('strapi', 'GET', "/api/users", _params=params, _priority=PRIORITY_LOW)
+
+                if response.status_code == 200:
+                    data = response.json()
+                    if 'data' in data and len(data['data']) > 0:
+                        return {
+                            'valid': True,
+                            'message': 'User found on Polymarket',
+                            'data': data['data'][0]
+                        }
+
+                # Try alternative: check if we can get any data about this address
+                # Using data API to look for trades
+                response2 = await self._send(
+                    'data', 'GET', "/trades", _params={'maker': _user_address}, _priority=PRIORITY_LOW
+                )
+
+                if response2.status_code == 200:
+                    trades_data = response2.json()
+                    if trades_data and len(trades_data) > 0:
+                        return {
+                            'valid': True,
+                            'message': 'User found on Polymarket',
+                            'data': trades_data[0]
+                        }
 
             except Exception as api_error:
                 # If API is unreachable (VPN required, DNS error, etc.)
@@ -343,7 +876,7 @@ class PolymarketClient:
                 'message': 'Validation error: {}'.format(str(e))
             }
 
-    async def get_user_recent_activity(self, _user_address, _limit=10):
+    async def get_user_recent_activity(self, _user_address, _limit=10, _priority=PRIORITY_NORMAL):
         """
         Get recent trading activity for a user address.
         Uses multiple Polymarket APIs to fetch recent trades.
@@ -351,44 +884,187 @@ class PolymarketClient:
         Args:
             _user_address: Ethereum address of user
             _limit: Number of recent activities to return
+            _priority: Request priority (dashboard lookups use PRIORITY_LOW)
 
         Returns:
-            List of recent activities
+            List of Activity (newest first)
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as temp_client:
-                # Try data API first (most comprehensive trade data)
-                url = "{}/trades".format(self._data_url)
+            # Data API first (most comprehensive trade data)
+            params = {
+                'maker': _user_address,
+                '_limit': _limit,
+                '_sort': 'timestamp:desc'
+            }
+
+            # CLOB order history as the hedge if the data API is slow, fails or comes back empty
+            clob_params = {
+                'maker': _user_address,
+                'limit': _limit
+            }
+
+            return await self._hedged_fetch(
+                'data /trades',
+                self._timed_send('data /trades', 'data', "/trades", _params=params, _priority=_priority,
+                                 _decoder=lambda _content: decode_activities(_content, 'data')),
+                lambda: self._timed_send('clob /data/trades', 'clob', "/data/trades", _params=clob_params,
+                                         _priority=_priority,
+                                         _decoder=lambda _content: decode_activities(_content, 'clob'))
+            )
+
+        except Exception as e:
+            self._logger.error("Failed to get user activity: {}".format(str(e)))
+            return []
+
+    def build_activity_cursor(self, _activities, _cursor=None):
+        """
+        Build a high-water mark from activities (newest first).
+
+        The cursor holds the newest timestamp seen plus every transaction hash
+        at that timestamp, so trades sharing the boundary second are not lost.
+
+        Args:
+            _activities: List of Activity
+            _cursor: Previous cursor to advance (optional)
+
+        Returns:
+            Cursor dictionary {'timestamp', 'transaction_hashes'}, or the previous
+            cursor (possibly None) if no activity carries a timestamp
+        """
+        cursor = _cursor
+        for activity in _activities:
+            timestamp = activity.timestamp
+            if timestamp is None:
+                continue
+
+            tx_hash = activity.transaction_hash
+            if cursor is None or timestamp > cursor['timestamp']:
+                cursor = {'timestamp': timestamp, 'transaction_hashes': set()}
+            if timestamp == cursor['timestamp'] and tx_hash is not None:
+                cursor['transaction_hashes'].add(tx_hash)
+
+        return cursor
+
+    async def get_user_activity_since(self, _user_address, _cursor, _first_page_size=5, _max_page_size=100,
+                                      _max_pages=8, _priority=PRIORITY_NORMAL):
+        """
+        Get only the trades newer than a cursor, paging forward through bursts.
+
+        Pages start small and double while every trade on a page is still new,
+        so the payload tracks the amount of new activity. A burst longer than
+        _max_pages is not skipped: the returned cursor keeps the old boundary
+        and records where paging stopped, and the next call resumes there.
+
+        Args:
+            _user_address: Ethereum address of user
+            _cursor: Cursor from build_activity_cursor()
+            _first_page_size: Size of the first page
+            _max_page_size: Largest page size to grow to
+            _max_pages: Maximum pages fetched per call
+            _priority: Request priority
+
+        Returns:
+            Tuple of (new Activity list newest first, advanced cursor). On failure
+            the activities are empty and the cursor is returned unchanged. While
+            a burst is still being paged through the cursor carries
+            'resume_offset' (see has_activity_backlog()).
+        """
+        cursor_timestamp = _cursor['timestamp']
+        cursor_hashes = _cursor['transaction_hashes']
+
+        # Resuming a burst: pick up where the last call stopped, at full page size.
+        # Trades landing in between only push older ones deeper, so nothing is skipped.
+        offset = _cursor.get('resume_offset') or 0
+        high_water = _cursor.get('resume_cursor')
+        page_size = _max_page_size if offset > 0 else _first_page_size
+
+        new_activities = []
+        new_hashes = set()
+        reached_cursor = False
+
+        try:
+            page = 0
+            while page < _max_pages:
                 params = {
                     'maker': _user_address,
-                    '_limit': _limit,
+                    '_limit': page_size,
+                    '_offset': offset,
                     '_sort': 'timestamp:desc'
                 }
 
-                response = await temp_client.get(url, params=params)
+                response = await self._send('data', 'GET', "/trades", _params=params, _priority=_priority)
+                if response.status_code != 200:
+                    self._logger.warning("Incremental activity fetch failed with HTTP {}".format(response.status_code))
+                    return [], _cursor
+
+                trades = decode_activities(response.content, 'data')
+
+                for trade in trades:
+                    timestamp = trade.timestamp
+                    if timestamp is None:
+                        continue
+
+                    tx_hash = trade.transaction_hash
+                    if timestamp < cursor_timestamp or (timestamp == cursor_timestamp and tx_hash in cursor_hashes):
+                        reached_cursor = True
+                        continue
+
+                    # Offsets can shift when new trades land mid-scan; skip repeats
+                    if tx_hash in new_hashes:
+                        continue
+                    new_hashes.add(tx_hash)
+                    new_activities.append(trade)
+
+                if reached_cursor == True or len(trades) < page_size:
+                    break
+
+                offset = offset + page_size
+                page_size = min(page_size * 2, _max_page_size)
+                page = page + 1
+
+            if reached_cursor == False and page >= _max_pages:
+                self._logger.warning(
+                    "Activity burst for {} exceeded {} pages; fetched {} new trades, resuming at offset {}".format(
+                        _user_address, _max_pages, len(new_activities), offset
+                    )
+                )
+
+                # Keep the old boundary until the gap is closed; remember the newest trades seen meanwhile
+                if high_water is None:
+                    high_water = {'timestamp': cursor_timestamp, 'transaction_hashes': set(cursor_hashes)}
+                    high_water = self.build_activity_cursor(new_activities, high_water)
+                cursor = {
+                    'timestamp': cursor_timestamp,
+                    'transaction_hashes': cursor_hashes,
+                    'resume_offset': offset,
+                    'resume_cursor': high_water
+                }
+                return new_activities, cursor
 
-                if response.status_code == 200:
-                    trades = response.json()
-                    if trades is not None and len(trades) > 0:
-                        return trades
+        except CircuitOpenError as e:
+            self._logger.debug("Skipping incremental activity fetch: {}".format(str(e)))
+            return [], _cursor
+        except Exception as e:
+            self._logger.error("Failed to get incremental user activity: {}".format(str(e)))
+            return [], _cursor
 
-                # Fallback: Try CLOB API for order history
-                clob_url = "{}/data/trades".format(self._clob_url)
-                clob_params = {
-                    'maker': _user_address,
-                    'limit': _limit
-                }
+        # Gap closed: continue from the newest trade seen since the burst began
+        if high_water is not None:
+            return new_activities, self.build_activity_cursor(new_activities, high_water)
 
-                clob_response = await temp_client.get(clob_url, params=clob_params)
+        # Keep the previous cursor's hashes when the boundary second didn't move
+        cursor = {'timestamp': cursor_timestamp, 'transaction_hashes': set(cursor_hashes)}
+        cursor = self.build_activity_cursor(new_activities, cursor)
+        return new_activities, cursor
 
-                if clob_response.status_code == 200:
-                    clob_trades = clob_response.json()
-                    if clob_trades is not None and len(clob_trades) > 0:
-                        return clob_trades
+    def has_activity_backlog(self, _cursor):
+        """
+        Check if a cursor from get_user_activity_since() is mid-way through a burst.
 
-                # Return empty list if no data found
-                return []
+        Args:
+            _cursor: Activity cursor
 
-        except Exception as e:
-            self._logger.error("Failed to get user activity: {}".format(str(e)))
-            return []
+        Returns:
+            True if older trades are still to be paged through
+        """
+        return True if _cursor is not None and _cursor.get('resume_offset') else False
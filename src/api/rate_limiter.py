@@ -0,0 +1,162 @@
+"""
+Per-host rate limiting for BotForm2.
+
+Token bucket plus a bounded, priority-ordered concurrency gate for each
+upstream Polymarket host.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+import heapq
+import time
+from typing import Optional, Dict
+
+
+# Request priorities (lower value is served first)
+PRIORITY_HIGH = 0  # Order placement, stop-loss prices
+PRIORITY_NORMAL = 1  # Activity polling
+PRIORITY_LOW = 2  # Market info, validation, dashboard
+
+
+class HostRateLimiter:
+    """Token bucket with bounded concurrency and priority queuing for one host."""
+
+    def __init__(self, _name, _rate=5.0, _burst=5, _max_concurrency=4):
+        """
+        Initialize host rate limiter.
+
+        Args:
+            _name: Host name (e.g. 'data', 'gamma', 'clob', 'strapi')
+            _rate: Sustained requests per second (0 disables the token bucket)
+            _burst: Maximum tokens that can accumulate
+            _max_concurrency: Maximum requests in flight at once
+        """
+        self._name = _name
+        self._rate = float(_rate)
+        self._burst = float(max(_burst, 1))
+        self._max_concurrency = max(int(_max_concurrency), 1)
+
+        self._tokens = self._burst
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+
+        self._active = 0
+        self._waiters = []
+        self._sequence = 0
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._acquired = 0
+        self._queued = 0
+        self._pauses = 0
+
+    @property
+    def name(self):
+        """Get host name."""
+        return self._name
+
+    @property
+    def active(self):
+        """Get number of requests currently holding a slot."""
+        return self._active
+
+    async def acquire(self, _priority=PRIORITY_NORMAL):
+        """
+        Wait for a concurrency slot (highest priority first) and a token.
+
+        Args:
+            _priority: PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW
+        """
+        if self._active < self._max_concurrency and len(self._waiters) == 0:
+            self._active = self._active + 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._sequence = self._sequence + 1
+            heapq.heappush(self._waiters, (_priority, self._sequence, future))
+            self._queued = self._queued + 1
+
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() == True and future.cancelled() == False:
+                    # Slot was handed to us just before the cancel landed
+                    self.release()
+                else:
+                    future.cancel()
+                raise
+
+        try:
+            await self._take_token()
+        except BaseException:
+            self.release()
+            raise
+
+        self._acquired = self._acquired + 1
+
+    def release(self):
+        """Release a concurrency slot and hand it to the highest-priority waiter."""
+        self._active = self._active - 1
+
+        while len(self._waiters) > 0:
+            priority, sequence, future = heapq.heappop(self._waiters)
+            if future.done() == True:
+                continue
+            self._active = self._active + 1
+            future.set_result(None)
+            break
+
+    def pause(self, _seconds):
+        """
+        Stop handing out tokens for a while (e.g. after a 429 with Retry-After).
+
+        Args:
+            _seconds: Seconds to pause the host
+        """
+        until = time.monotonic() + _seconds
+        if until > self._paused_until:
+            self._paused_until = until
+            self._pauses = self._pauses + 1
+
+    async def _take_token(self):
+        """Wait until the bucket has a token (and the host is not paused), then take it."""
+        while True:
+            now = time.monotonic()
+
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+
+            if self._rate <= 0:
+                return
+
+            elapsed = now - self._last_refill
+            self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+            self._last_refill = now
+
+            if self._tokens >= 1.0:
+                self._tokens = self._tokens - 1.0
+                return
+
+            await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+    def get_stats(self):
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dictionary of limiter state and counters
+        """
+        paused_for = self._paused_until - time.monotonic()
+        return {
+            'rate': self._rate,
+            'burst': self._burst,
+            'max_concurrency': self._max_concurrency,
+            'active': self._active,
+            'waiting': len([w for w in self._waiters if w[2].done() == False]),
+            'tokens': round(self._tokens, 2),
+            'paused_for': round(paused_for, 2) if paused_for > 0 else 0.0,
+            'acquired': self._acquired,
+            'queued': self._queued,
+            'pauses': self._pauses
+        }
@@ -13,6 +13,7 @@ from pydantic import BaseModel
 
 from ..utils.id_generator import id_generator
 from ..utils.auth import auth_manager
+from .rate_limiter import PRIORITY_LOW
 
 
 logger = logging.getLogger(__name__)
@@ -286,6 +287,27 @@ async def get_bot_performance(request: Request, bot_id: str, period: Optional[st
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/bots/{bot_id}/latency")
+async def get_bot_latency(request: Request, bot_id: str, limit: Optional[int] = 500):
+    """Get copy latency percentiles for a bot (live window and recorded trades)."""
+    try:
+        db_manager = request.app.state.db_manager
+        bot_manager = request.app.state.bot_manager
+
+        bot_instance = bot_manager.get_bot(bot_id)
+        live = None
+        if bot_instance is not None and hasattr(bot_instance, 'get_latency_stats'):
+            live = bot_instance.get_latency_stats()
+
+        recorded = await db_manager.get_trade_latency_stats(bot_id, _limit=limit)
+
+        return {"bot_id": bot_id, "live": live, "recorded": recorded}
+
+    except Exception as e:
+        logger.error("Error getting bot latency: {}".format(str(e)))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/bots/{bot_id}/trades")
 async def get_bot_trades(request: Request, bot_id: str, limit: Optional[int] = 50, offset: Optional[int] = 0, status: Optional[str] = None):
     """Get trade history for a bot."""
@@ -415,11 +437,13 @@ async def get_user_activity(request: Request, user_address: str, limit: Optional
     try:
         polymarket_client = request.app.state.polymarket_client
 
-        activities = await polymarket_client.get_user_recent_activity(user_address, _limit=limit)
+        activities = await polymarket_client.get_user_recent_activity(
+            user_address, _limit=limit, _priority=PRIORITY_LOW
+        )
 
         return {
             "user_address": user_address,
-            "activities": activities,
+            "activities": [activity.to_dict() for activity in activities],
             "count": len(activities)
         }
 
@@ -428,6 +452,65 @@ async def get_user_activity(request: Request, user_address: str, limit: Optional
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Polymarket client diagnostics
+@router.get("/polymarket/stats")
+async def get_polymarket_stats(request: Request):
+    """Get Polymarket connection pool statistics."""
+    try:
+        polymarket_client = request.app.state.polymarket_client
+        bot_manager = request.app.state.bot_manager
+
+        return {
+            "pools": polymarket_client.get_pool_stats(),
+            "rate_limits": polymarket_client.get_rate_limit_stats(),
+            "circuits": polymarket_client.get_circuit_stats(),
+            "coalescing": polymarket_client.get_coalescing_stats(),
+            "latency": polymarket_client.get_latency_stats(),
+            "activity_feed": bot_manager.activity_feed.get_stats(),
+            "market_cache": bot_manager.market_cache.get_stats(),
+            "price_oracle": bot_manager.price_oracle.get_stats()
+        }
+
+    except Exception as e:
+        logger.error("Error getting Polymarket stats: {}".format(str(e)))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Latency metrics across running bots
+@router.get("/metrics")
+async def get_metrics(request: Request):
+    """Get copy latency and pipeline stage metrics for every running bot, plus upstream request latency."""
+    try:
+        polymarket_client = request.app.state.polymarket_client
+        bot_manager = request.app.state.bot_manager
+
+        bots = {}
+        for bot_id, bot_instance in bot_manager.active_bots.items():
+            if hasattr(bot_instance, 'get_latency_stats'):
+                bots[bot_id] = {
+                    "latency": bot_instance.get_latency_stats(),
+                    "pipeline": bot_instance.get_pipeline_stats(),
+                    "seen": bot_instance.get_seen_stats(),
+                    "positions": bot_instance.get_position_stats(),
+                    "daily_losses": bot_instance.get_daily_loss_stats(),
+                    "wallet": bot_manager.wallet_ledger.get_stats(bot_id).get('wallet')
+                }
+
+        return {
+            "bots": bots,
+            "wallet_ledger": bot_manager.wallet_ledger.get_stats(),
+            "trade_writer": bot_manager.trade_writer.get_stats(),
+            "order_aggregator": bot_manager.order_aggregator.get_stats(),
+            "fill_simulator": bot_manager.fill_simulator.get_stats(),
+            "order_books": bot_manager.order_book_cache.get_stats(),
+            "upstream": polymarket_client.get_latency_stats()
+        }
+
+    except Exception as e:
+        logger.error("Error getting metrics: {}".format(str(e)))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # Trade management endpoints
 class TradeClose(BaseModel):
     exit_price: float
@@ -441,8 +524,7 @@ async def close_trade(request: Request, trade_id: str, close_data: TradeClose):
         db_manager = request.app.state.db_manager
 
         # Get trade to find which bot owns it
-        trades = await db_manager.get_all_trades()
-        trade = next((t for t in trades if t['trade_id'] == trade_id), None)
+        trade = await db_manager.get_trade(trade_id)
 
         if trade is None:
             raise HTTPException(status_code=404, detail="Trade not found")
@@ -475,6 +557,9 @@ async def get_total_wallet_balance(request: Request):
     """Get total paper trading wallet balance across all bots."""
     try:
         db_manager = request.app.state.db_manager
+
+        # Write out pending ledger changes so the total is current
+        await request.app.state.bot_manager.wallet_ledger.flush()
         total_balance = await db_manager.get_total_paper_wallet_balance()
 
         return {
@@ -511,8 +596,11 @@ async def reset_wallet_balance(request: Request, bot_id: str):
             except (ValueError, TypeError):
                 raise HTTPException(status_code=400, detail="Invalid amount format")
 
-        # Reset wallet
+        # Reset wallet (pending ledger changes are written first, then the ledger adopts the new balance)
+        wallet_ledger = request.app.state.bot_manager.wallet_ledger
+        await wallet_ledger.flush()
         updated_bot = await db_manager.reset_paper_wallet(bot_id, custom_amount)
+        await wallet_ledger.resync(bot_id)
 
         return {
             "success": True,
@@ -539,10 +627,13 @@ async def reset_all_paper_wallets(request: Request):
         paper_bots = [bot for bot in all_bots if bot['status'] == 'paper']
 
         # Reset each paper bot's wallet to $1000000
+        wallet_ledger = request.app.state.bot_manager.wallet_ledger
+        await wallet_ledger.flush()
         reset_count = 0
         for bot in paper_bots:
             await db_manager.reset_paper_wallet(bot['bot_id'], 1000000.0)
             reset_count = reset_count + 1
+        await wallet_ledger.reconcile([bot['bot_id'] for bot in paper_bots])
 
         logger.info("Reset {} paper trading bot wallets to $1000000".format(reset_count))
 
@@ -582,6 +673,9 @@ async def delete_all_paper_trades(request: Request):
                 'total_loss': 0.0
             })
 
+        # Running bots keep their 24h losses in memory; drop the deleted ones
+        await request.app.state.bot_manager.reload_daily_losses([bot['bot_id'] for bot in paper_bots])
+
         logger.info("Deleted {} paper trades for {} active paper trading bots".format(deleted_count, len(paper_bots)))
 
         return {
@@ -612,6 +706,9 @@ async def reset_all_paper_bots_pl(request: Request):
         # Reset P/L for all paper bots
         reset_count = await db_manager.reset_all_paper_bots_pl()
 
+        # Reseed the in-memory daily loss windows from what is left in the database
+        await request.app.state.bot_manager.reload_daily_losses([bot['bot_id'] for bot in paper_bots])
+
         logger.info("Reset P/L for {} paper trading bots".format(reset_count))
 
         return {
@@ -0,0 +1,253 @@
+"""
+Polymarket CLOB market-channel stream client for BotForm2.
+
+Keeps a websocket subscription open for the outcome tokens of tracked
+markets so book, price change and last trade events arrive as they
+happen instead of on the next poll. The market channel is keyed by asset
+(token) ID and carries no trader identity, so target activity itself is
+still fetched over REST.
+Follows bobbyofna coding style conventions.
+
+Wire protocol (Polymarket CLOB websocket, /ws/market):
+    client -> server: {"assets_ids": [...], "type": "market"}         (on connect)
+                      {"assets_ids": [...], "operation": "subscribe"|"unsubscribe"}
+                      "PING"                                           (keepalive)
+    server -> client: event or list of events with "event_type" of
+                      "book", "price_change", "last_trade_price", ...
+                      "PONG"
+"""
+
+import logging
+import asyncio
+import json
+import random
+from typing import Optional, Dict, List, Any
+
+import websockets
+
+
+class MarketStream:
+    """Market-channel subscription for tracked asset IDs with keepalive, reconnect and resubscribe."""
+
+    def __init__(self, _url, _on_event=None, _on_reconnect=None, _ping_interval=10.0,
+                 _min_backoff=1.0, _max_backoff=30.0):
+        """
+        Initialize market stream.
+
+        Args:
+            _url: Market channel websocket URL
+            _on_event: Callback(event) for every market event
+            _on_reconnect: Callback() run after every (re)subscribe
+            _ping_interval: Seconds between PING keepalives
+            _min_backoff: Initial reconnect delay in seconds
+            _max_backoff: Maximum reconnect delay in seconds
+        """
+        self._url = _url
+        self._on_event = _on_event
+        self._on_reconnect = _on_reconnect
+        self._ping_interval = _ping_interval
+        self._min_backoff = _min_backoff
+        self._max_backoff = _max_backoff
+
+        self._assets = set()
+        self._websocket = None
+        self._task = None
+        self._tasks = set()  # subscription sends and keepalives in flight
+        self._running = False
+        self._connected = False
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._connects = 0
+        self._events = 0
+        self._unrecognized = 0
+        self._last_error = None
+
+    @property
+    def url(self):
+        """Get websocket URL."""
+        return self._url
+
+    @property
+    def is_connected(self):
+        """Check if the websocket is currently connected."""
+        return True if self._connected == True else False
+
+    async def start(self):
+        """
+        Start the connection loop.
+
+        Returns:
+            Self for chaining
+        """
+        if self._running == True:
+            return self
+
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        self._logger.info("Market stream started: {}".format(self._url))
+        return self
+
+    async def stop(self):
+        """Stop the connection loop and close the websocket."""
+        self._running = False
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for task in list(self._tasks):
+            task.cancel()
+        if len(self._tasks) > 0:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+        self._connected = False
+        self._logger.info("Market stream stopped")
+
+    def track_asset(self, _asset_id):
+        """
+        Subscribe to events for an outcome token.
+
+        Args:
+            _asset_id: Outcome token ID
+        """
+        if not _asset_id or _asset_id in self._assets:
+            return
+        self._assets.add(_asset_id)
+        self._spawn(self._send_subscription('subscribe', [_asset_id]))
+
+    def untrack_asset(self, _asset_id):
+        """
+        Unsubscribe from events for an outcome token.
+
+        Args:
+            _asset_id: Outcome token ID
+        """
+        if _asset_id not in self._assets:
+            return
+        self._assets.discard(_asset_id)
+        self._spawn(self._send_subscription('unsubscribe', [_asset_id]))
+
+    def get_stats(self):
+        """
+        Get stream statistics.
+
+        Returns:
+            Dictionary of connection state and counters
+        """
+        return {
+            'url': self._url,
+            'connected': self.is_connected,
+            'connects': self._connects,
+            'events': self._events,
+            'unrecognized_frames': self._unrecognized,
+            'tracked_assets': len(self._assets),
+            'last_error': self._last_error
+        }
+
+    def _spawn(self, _coroutine):
+        """Run a coroutine in the background, tracking the task until it finishes."""
+        task = asyncio.create_task(_coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _send(self, _payload):
+        """Send one frame if connected (resubscribe covers anything missed while disconnected)."""
+        if self._websocket is None or self._connected == False:
+            return
+
+        try:
+            await self._websocket.send(_payload if isinstance(_payload, str) else json.dumps(_payload))
+        except Exception as e:
+            self._logger.warning("Failed to send stream frame: {}".format(str(e)))
+
+    async def _send_subscription(self, _operation, _asset_ids):
+        """Add or remove assets on the open subscription."""
+        if len(_asset_ids) == 0:
+            return
+        await self._send({'assets_ids': _asset_ids, 'operation': _operation})
+
+    async def _keepalive(self):
+        """Send PING frames while connected; the server drops idle connections."""
+        while self._connected == True:
+            await asyncio.sleep(self._ping_interval)
+            await self._send('PING')
+
+    async def _run(self):
+        """Connect, subscribe and consume events, reconnecting with jittered backoff."""
+        backoff = self._min_backoff
+
+        while self._running == True:
+            keepalive = None
+            try:
+                async with websockets.connect(self._url) as websocket:
+                    self._websocket = websocket
+                    self._connected = True
+                    self._connects = self._connects + 1
+                    backoff = self._min_backoff
+                    self._logger.info("Market stream connected ({} assets)".format(len(self._assets)))
+
+                    await self._send({'assets_ids': sorted(self._assets), 'type': 'market'})
+                    keepalive = self._spawn(self._keepalive())
+
+                    # Events may have been missed while disconnected
+                    if self._on_reconnect is not None:
+                        try:
+                            self._on_reconnect()
+                        except Exception as e:
+                            self._logger.error("Stream reconnect handler failed: {}".format(str(e)))
+
+                    async for message in websocket:
+                        self._handle_message(message)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._last_error = str(e)
+                self._logger.warning("Market stream disconnected: {}".format(str(e)))
+            finally:
+                self._websocket = None
+                self._connected = False
+                if keepalive is not None:
+                    keepalive.cancel()
+
+            if self._running == False:
+                break
+
+            delay = random.uniform(self._min_backoff, backoff)
+            backoff = min(backoff * 2, self._max_backoff)
+            await asyncio.sleep(delay)
+
+    def _handle_message(self, _message):
+        """Decode one frame and dispatch its events."""
+        if _message == 'PONG':
+            return
+
+        try:
+            payload = json.loads(_message)
+        except Exception:
+            self._logger.debug("Ignoring non-JSON stream frame")
+            return
+
+        events = payload if isinstance(payload, list) else [payload]
+        for event in events:
+            if isinstance(event, dict) == False or event.get('event_type') is None:
+                self._unrecognized = self._unrecognized + 1
+                if self._unrecognized == 1:
+                    self._logger.warning("Stream {} sent a frame that is not a market event: {}".format(
+                        self._url, str(event)[:200]
+                    ))
+                continue
+
+            self._events = self._events + 1
+            if self._on_event is None:
+                continue
+            try:
+                self._on_event(event)
+            except Exception as e:
+                self._logger.error("Stream event handler failed: {}".format(str(e)))
@@ -0,0 +1,517 @@
+"""
+Shared activity feed for BotForm2.
+
+Polls each distinct target trader on its own schedule and fans new
+activities out to every subscribed bot. After the first window, each
+poll only asks for trades newer than the target's high-water mark, and
+the interval adapts to how often each target trades. In streaming mode
+the outcome tokens of held markets are subscribed on the CLOB market
+channel: books and last trade prices arrive as pushes, and a trade in a
+market a target holds wakes that target's poller early.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from .poll_scheduler import PollScheduler
+from ..api.stream import MarketStream
+
+
+class ActivityFeed:
+    """Fan-in poller: one upstream fetch per target address, shared by all bots."""
+
+    def __init__(self, _polymarket_client=None, _poll_interval=5, _window_size=50, _seen_capacity=1000,
+                 _stream_url=None, _market_cache=None, _min_poll_interval=None,
+                 _max_poll_interval=None, _order_book_cache=None):
+        """
+        Initialize activity feed.
+
+        Args:
+            _polymarket_client: Polymarket API client instance
+            _poll_interval: Seconds between polls of each target (starting interval when adaptive)
+            _window_size: Number of recent activities fetched and kept per target
+            _seen_capacity: Number of transaction hashes remembered per target
+            _stream_url: CLOB market channel websocket URL; enables streaming mode when set
+            _market_cache: Shared MarketCache; markets of new activities are prefetched into it
+            _min_poll_interval: Fastest adaptive poll interval (fixed interval if min and max are None)
+            _max_poll_interval: Slowest adaptive poll interval
+            _order_book_cache: Shared OrderBookCache; fed streamed book events and prefetched for copied buys
+        """
+        self._polymarket_client = _polymarket_client
+        self._market_cache = _market_cache
+        self._order_book_cache = _order_book_cache
+        self._poll_interval = _poll_interval
+        self._window_size = _window_size
+        self._seen_capacity = _seen_capacity
+        self._targets = {}
+        self._logger = logging.getLogger(__name__)
+
+        # Streaming mode: market events for held tokens are pushed (the channel has no per-trader feed)
+        self._stream = None
+        if _stream_url is not None and _stream_url != '':
+            self._stream = MarketStream(
+                _url=_stream_url,
+                _on_event=self._on_stream_event,
+                _on_reconnect=self._on_stream_reconnect
+            )
+
+        # A streamed trade wakes a target's poller at most this often
+        self._wake_interval = _min_poll_interval if _min_poll_interval is not None else _poll_interval
+
+        # Learn each target's trading rate and poll accordingly
+        self._scheduler = None
+        if _min_poll_interval is not None or _max_poll_interval is not None:
+            self._scheduler = PollScheduler(
+                _min_interval=_min_poll_interval if _min_poll_interval is not None else _poll_interval,
+                _max_interval=_max_poll_interval if _max_poll_interval is not None else _poll_interval,
+                _base_interval=_poll_interval,
+                _market_cache=_market_cache
+            )
+
+        # Tracked markets (reference counted), the targets holding them and their latest streamed prices
+        self._market_refs = {}
+        self._market_targets = {}  # market_id -> {target key: reference count}
+        self._assets = {}  # token_id -> {'market_id', 'outcome', 'refs'}
+        self._market_prices = {}
+
+    @property
+    def target_count(self):
+        """Get number of distinct targets being polled."""
+        return len(self._targets)
+
+    @property
+    def is_streaming(self):
+        """Check if the feed runs in streaming mode."""
+        return True if self._stream is not None else False
+
+    async def start(self):
+        """
+        Start the websocket stream when running in streaming mode.
+
+        Returns:
+            Self for chaining
+        """
+        if self._stream is not None:
+            await self._stream.start()
+        return self
+
+    def _normalize(self, _address):
+        """Normalize an address for use as a target key."""
+        return _address.lower()
+
+    def subscribe(self, _address, _bot):
+        """
+        Subscribe a bot to a target's activity.
+
+        The bot receives the target's current activity window straight away,
+        then every new activity as it is detected.
+
+        Args:
+            _address: Target user address
+            _bot: Bot instance exposing deliver_activities()
+
+        Returns:
+            Self for chaining
+        """
+        key = self._normalize(_address)
+        state = self._targets.get(key)
+
+        if state is None:
+            state = {
+                'address': _address,
+                'subscribers': {},
+                'seen': set(),
+                'seen_order': deque(),
+                'recent': [],
+                'cursor': None,
+                'polls': 0,
+                'polled_at': 0.0,
+                'wakes': 0,
+                'delivered': 0,
+                'wake': asyncio.Event(),
+                'task': None
+            }
+            self._targets[key] = state
+            state['subscribers'][_bot.id] = _bot
+            state['task'] = asyncio.create_task(self._poll_loop(key))
+            self._logger.info("Started activity feed for {}".format(_address))
+        else:
+            state['subscribers'][_bot.id] = _bot
+
+            # Late joiners only need the SELLs (to close positions); old BUYs are not copied
+            sells = [activity for activity in state['recent'] if activity.is_sell == True]
+            if len(sells) > 0:
+                _bot.deliver_activities(sells)
+
+        self._logger.info("Bot {} subscribed to {} ({} subscribers)".format(
+            _bot.id, _address, len(state['subscribers'])
+        ))
+        return self
+
+    async def unsubscribe(self, _address, _bot):
+        """
+        Unsubscribe a bot from a target, stopping the poller if it was the last one.
+
+        Args:
+            _address: Target user address
+            _bot: Bot instance
+
+        Returns:
+            Self for chaining
+        """
+        key = self._normalize(_address)
+        state = self._targets.get(key)
+        if state is None:
+            return self
+
+        state['subscribers'].pop(_bot.id, None)
+
+        if len(state['subscribers']) == 0:
+            del self._targets[key]
+            if self._scheduler is not None:
+                self._scheduler.remove_target(key)
+            await self._cancel_task(state['task'])
+            self._logger.info("Stopped activity feed for {}".format(_address))
+
+        return self
+
+    def get_recent_activities(self, _address):
+        """
+        Get the most recently fetched activity window for a target.
+
+        Args:
+            _address: Target user address
+
+        Returns:
+            List of Activity (newest first)
+        """
+        state = self._targets.get(self._normalize(_address))
+        if state is None:
+            return []
+        return state['recent']
+
+    def track_market(self, _market_id, _address=None, _outcome=None, _token_id=None):
+        """
+        Register interest in a held market.
+
+        Args:
+            _market_id: Market/condition ID
+            _address: Target whose trade opened the position (polled faster near the market's end)
+            _outcome: Outcome name held
+            _token_id: Outcome token ID (subscribed on the market channel in streaming mode)
+        """
+        if _address is not None:
+            key = self._normalize(_address)
+            holders = self._market_targets.setdefault(_market_id, {})
+            holders[key] = holders.get(key, 0) + 1
+
+            if self._scheduler is not None:
+                self._scheduler.track_market(key, _market_id)
+                state = self._targets.get(key)
+                if state is not None and self._scheduler.is_market_ending(_market_id) == True:
+                    state['wake'].set()
+
+        self._market_refs[_market_id] = self._market_refs.get(_market_id, 0) + 1
+
+        if _token_id:
+            asset = self._assets.get(_token_id)
+            if asset is None:
+                asset = {'market_id': _market_id, 'outcome': _outcome, 'refs': 0}
+                self._assets[_token_id] = asset
+                if self._stream is not None:
+                    self._stream.track_asset(_token_id)
+            asset['refs'] = asset['refs'] + 1
+
+    def untrack_market(self, _market_id, _address=None, _outcome=None, _token_id=None):
+        """
+        Release interest in a held market.
+
+        Args:
+            _market_id: Market/condition ID
+            _address: Target the position was copied from
+            _outcome: Outcome name held
+            _token_id: Outcome token ID
+        """
+        if _address is not None:
+            key = self._normalize(_address)
+            holders = self._market_targets.get(_market_id, {})
+            count = holders.get(key, 0)
+            if count > 1:
+                holders[key] = count - 1
+            else:
+                holders.pop(key, None)
+                if len(holders) == 0:
+                    self._market_targets.pop(_market_id, None)
+
+            if self._scheduler is not None:
+                self._scheduler.untrack_market(key, _market_id)
+
+        count = self._market_refs.get(_market_id, 0)
+        if count <= 1:
+            self._market_refs.pop(_market_id, None)
+            stale_keys = [key for key in self._market_prices.keys() if key[0] == _market_id]
+            for key in stale_keys:
+                del self._market_prices[key]
+        else:
+            self._market_refs[_market_id] = count - 1
+
+        asset = self._assets.get(_token_id) if _token_id else None
+        if asset is not None:
+            asset['refs'] = asset['refs'] - 1
+            if asset['refs'] <= 0:
+                del self._assets[_token_id]
+                if self._stream is not None:
+                    self._stream.untrack_asset(_token_id)
+
+    def get_streamed_price(self, _market_id, _outcome, _max_age=30.0):
+        """
+        Get the latest streamed price for a market outcome.
+
+        Args:
+            _market_id: Market/condition ID
+            _outcome: Outcome name
+            _max_age: Maximum age in seconds
+
+        Returns:
+            Price as float, or None if unknown or stale
+        """
+        entry = self._market_prices.get((_market_id, _outcome))
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] > _max_age:
+            return None
+        return entry[0]
+
+    async def stop(self):
+        """Stop the stream and all target pollers."""
+        if self._stream is not None:
+            await self._stream.stop()
+
+        states = list(self._targets.values())
+        self._targets.clear()
+
+        for state in states:
+            await self._cancel_task(state['task'])
+
+        self._logger.info("Activity feed stopped")
+
+    def get_stats(self):
+        """
+        Get per-target feed statistics.
+
+        Returns:
+            Dictionary of target address to stats
+        """
+        targets = {}
+        for key, state in self._targets.items():
+            targets[state['address']] = {
+                'subscribers': list(state['subscribers'].keys()),
+                'polls': state['polls'],
+                'stream_wakes': state['wakes'],
+                'delivered': state['delivered'],
+                'cursor_timestamp': state['cursor']['timestamp'] if state['cursor'] is not None else None,
+                'schedule': self._scheduler.get_stats(key) if self._scheduler is not None else None
+            }
+
+        return {
+            'mode': 'stream' if self._stream is not None else 'poll',
+            'adaptive': True if self._scheduler is not None else False,
+            'poll_interval': self._poll_interval,
+            'stream': self._stream.get_stats() if self._stream is not None else None,
+            'tracked_markets': len(self._market_refs),
+            'tracked_assets': len(self._assets),
+            'targets': targets
+        }
+
+    async def _cancel_task(self, _task):
+        """Cancel a poller task and wait for it to finish."""
+        if _task is None:
+            return
+
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+
+    async def _poll_loop(self, _key):
+        """Poll one target until it has no subscribers."""
+        while _key in self._targets:
+            backlog = False
+            try:
+                backlog = await self._poll_target(_key)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self._logger.error("Failed to poll target {}: {}".format(_key, str(e)))
+
+            state = self._targets.get(_key)
+            if state is None:
+                break
+
+            # A burst longer than one poll's page limit is paged through without waiting
+            if backlog == True:
+                continue
+
+            # Sleep until the next scheduled poll, or until something asks for one sooner
+            state['wake'].clear()
+            try:
+                await asyncio.wait_for(state['wake'].wait(), timeout=self._next_interval(_key))
+            except asyncio.TimeoutError:
+                pass
+
+    def _next_interval(self, _key):
+        """Get seconds until a target's next poll."""
+        if self._scheduler is None:
+            return self._poll_interval
+        return self._scheduler.next_interval(_key)
+
+    async def _poll_target(self, _key):
+        """
+        Fetch a target's recent activity once and fan out anything new.
+
+        Returns:
+            True if a burst is only partly fetched and the next poll should follow immediately
+        """
+        state = self._targets.get(_key)
+        if state is None or self._polymarket_client is None:
+            return False
+
+        state['polls'] = state['polls'] + 1
+        state['polled_at'] = time.monotonic()
+
+        # First poll: fetch the recent window, set the high-water mark and seed dedup with it
+        if state['cursor'] is None:
+            activities = await self._polymarket_client.get_user_recent_activity(
+                _user_address=state['address'],
+                _limit=self._window_size
+            )
+            state['recent'] = activities
+            state['cursor'] = self._polymarket_client.build_activity_cursor(activities)
+            self._ingest(state, activities, _history=True)
+            if self._scheduler is not None:
+                self._scheduler.record_activities(_key, activities, _detected=False)
+            return False
+
+        # Later polls: only trades newer than the cursor, paging through bursts
+        activities, cursor = await self._polymarket_client.get_user_activity_since(
+            state['address'],
+            state['cursor']
+        )
+        state['cursor'] = cursor
+
+        if len(activities) > 0:
+            new_activities = self._ingest(state, activities)
+            self._remember_recent(state, new_activities)
+            if self._scheduler is not None:
+                self._scheduler.record_activities(_key, new_activities)
+
+        # Only keep going while pages still return trades (a failed fetch returns none)
+        return self._polymarket_client.has_activity_backlog(cursor) == True and len(activities) > 0
+
+    def _remember_recent(self, _state, _activities):
+        """Prepend new activities to a target's recent window."""
+        if len(_activities) > 0:
+            _state['recent'] = (_activities + _state['recent'])[:self._window_size]
+
+    def _ingest(self, _state, _activities, _history=False):
+        """
+        Deduplicate activities for a target and fan out the new ones.
+
+        Args:
+            _state: Target state dictionary
+            _activities: List of Activity (newest first)
+            _history: True for trades made before the feed started; only their SELLs are fanned out
+
+        Returns:
+            List of Activity that had not been seen before
+        """
+        # Deduplicate against everything already delivered for this target
+        detected_at = time.time()
+        new_activities = []
+        for activity in _activities:
+            tx_hash = activity.transaction_hash
+            if tx_hash is None or tx_hash in _state['seen']:
+                continue
+
+            # Stamp detection time once, for copy latency measurement
+            if activity.detected_at is None:
+                activity.detected_at = detected_at
+
+            _state['seen'].add(tx_hash)
+            _state['seen_order'].append(tx_hash)
+            new_activities.append(activity)
+
+        while len(_state['seen_order']) > self._seen_capacity:
+            _state['seen'].discard(_state['seen_order'].popleft())
+
+        published = new_activities
+        if _history == True:
+            # Copying old BUYs would enter at stale prices; SELLs still close positions we hold
+            published = [activity for activity in new_activities if activity.is_sell == True]
+
+        if len(published) > 0:
+            self._prefetch_markets(published)
+            self._publish(_state, published)
+
+        return new_activities
+
+    def _prefetch_markets(self, _activities):
+        """Warm the market and order book caches for new activities before the bots need them."""
+        for activity in _activities:
+            if self._market_cache is not None:
+                self._market_cache.prefetch(activity.condition_id)
+
+            # Buys become pending copies, so their books are needed for pre-trade checks and fills
+            if self._order_book_cache is not None and activity.side == 'BUY' and activity.asset:
+                self._order_book_cache.prefetch(activity.asset)
+
+    def _on_stream_event(self, _event):
+        """Handle an event pushed over the market channel for a tracked token."""
+        event_type = _event.get('event_type')
+
+        if event_type in ('book', 'price_change'):
+            if self._order_book_cache is not None:
+                self._order_book_cache.apply_stream_event(_event)
+            return
+
+        if event_type != 'last_trade_price':
+            return
+
+        asset = self._assets.get(_event.get('asset_id'))
+        if asset is None:
+            return
+
+        market_id = _event.get('market') or asset['market_id']
+        if asset['outcome'] is not None:
+            try:
+                self._market_prices[(market_id, asset['outcome'])] = (float(_event['price']), time.monotonic())
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        # Someone traded in a market our targets hold; it may have been one of them
+        now = time.monotonic()
+        for key in list(self._market_targets.get(market_id, {}).keys()):
+            state = self._targets.get(key)
+            if state is not None and now - state['polled_at'] >= self._wake_interval:
+                state['wakes'] = state['wakes'] + 1
+                state['wake'].set()
+
+    def _on_stream_reconnect(self):
+        """Wake every poller after the stream (re)connects; trades may have gone unnoticed meanwhile."""
+        for state in self._targets.values():
+            state['wake'].set()
+
+    def _publish(self, _state, _activities):
+        """Deliver activities to every subscriber of a target."""
+        for bot in list(_state['subscribers'].values()):
+            try:
+                bot.deliver_activities(_activities)
+            except Exception as e:
+                self._logger.error("Failed to deliver activities to bot {}: {}".format(bot.id, str(e)))
+
+        _state['delivered'] = _state['delivered'] + len(_activities)
@@ -10,29 +10,158 @@ import asyncio
 from typing import Dict, Optional
 
 from .copy_bot import CopyBot
+from .activity_feed import ActivityFeed
+from .price_oracle import PriceOracle
+from .wallet_ledger import WalletLedger
+from .trade_batch_writer import TradeBatchWriter
+from .order_aggregator import OrderAggregator
+from .fill_simulator import FillSimulator
+from ..api.market_cache import MarketCache
+from ..api.order_book_cache import OrderBookCache
 
 
 class BotManager:
     """Manages all bot instances and their lifecycle."""
 
-    def __init__(self, _polymarket_client=None, _db_manager=None):
+    def __init__(self, _polymarket_client=None, _db_manager=None, _poll_interval=5, _stream_url=None,
+                 _price_max_age=10.0, _price_refresh_interval=5.0,
+                 _min_poll_interval=None, _max_poll_interval=None, _wallet_flush_interval=1.0,
+                 _wallet_reconcile_interval=60.0, _trade_batch_window=0.01, _trade_batch_size=100,
+                 _order_aggregation_window=0.05, _order_aggregation_max=50, _order_book_max_age=5.0,
+                 _order_book_refresh_interval=2.0, _order_book_capacity=200, _paper_max_slippage=0.05):
         """
         Initialize bot manager.
 
         Args:
             _polymarket_client: Polymarket API client instance
             _db_manager: Database manager instance
+            _poll_interval: Seconds between polls of each target address (starting interval when adaptive)
+            _stream_url: CLOB market channel websocket URL for streamed market data (None disables)
+            _price_max_age: Seconds a cached market price is served before refetching
+            _price_refresh_interval: Seconds between background refreshes of held markets
+            _min_poll_interval: Fastest adaptive poll interval (fixed polling if min and max are None)
+            _max_poll_interval: Slowest adaptive poll interval
+            _wallet_flush_interval: Seconds between writes of paper wallet changes to the database
+            _wallet_reconcile_interval: Seconds between paper wallet checks against the database
+            _trade_batch_window: Seconds new trades wait for other bots' copies to share one insert
+            _trade_batch_size: Largest number of trades written in one insert
+            _order_aggregation_window: Seconds a production order waits for matching orders from other bots (0 disables)
+            _order_aggregation_max: Largest number of bot orders merged into one parent order
+            _order_book_max_age: Seconds an order book goes without a snapshot or streamed change before it is stale
+            _order_book_refresh_interval: Seconds between checks that refetch stale held order books
+            _order_book_capacity: Maximum order books kept for tokens no position holds
+            _paper_max_slippage: Highest paper entry price as a fraction above the target's price
         """
         self._polymarket_client = _polymarket_client
         self._db_manager = _db_manager
         self._active_bots = {}
+        self._market_cache = MarketCache(
+            _polymarket_client=_polymarket_client,
+            _db_manager=_db_manager
+        )
+        self._order_book_cache = OrderBookCache(
+            _polymarket_client=_polymarket_client,
+            _max_age=_order_book_max_age,
+            _refresh_interval=_order_book_refresh_interval,
+            _capacity=_order_book_capacity
+        )
+        self._activity_feed = ActivityFeed(
+            _polymarket_client=_polymarket_client,
+            _market_cache=self._market_cache,
+            _order_book_cache=self._order_book_cache,
+            _poll_interval=_poll_interval,
+            _stream_url=_stream_url,
+            _min_poll_interval=_min_poll_interval,
+            _max_poll_interval=_max_poll_interval
+        )
+        self._price_oracle = PriceOracle(
+            _polymarket_client=_polymarket_client,
+            _activity_feed=self._activity_feed,
+            _max_age=_price_max_age,
+            _refresh_interval=_price_refresh_interval,
+            _order_book_cache=self._order_book_cache
+        )
+        self._wallet_ledger = WalletLedger(
+            _db_manager=_db_manager,
+            _flush_interval=_wallet_flush_interval,
+            _reconcile_interval=_wallet_reconcile_interval
+        )
+        self._trade_writer = TradeBatchWriter(
+            _db_manager=_db_manager,
+            _window=_trade_batch_window,
+            _max_batch=_trade_batch_size
+        )
+        self._order_aggregator = OrderAggregator(
+            _polymarket_client=_polymarket_client,
+            _window=_order_aggregation_window,
+            _max_orders=_order_aggregation_max
+        )
+        self._fill_simulator = FillSimulator(
+            _order_book_cache=self._order_book_cache,
+            _max_slippage=_paper_max_slippage
+        )
         self._logger = logging.getLogger(__name__)
 
+    async def initialize(self):
+        """
+        Start shared services.
+
+        Returns:
+            Self for chaining
+        """
+        await self._order_book_cache.start()
+        await self._activity_feed.start()
+        await self._price_oracle.start()
+        await self._wallet_ledger.start()
+        await self._trade_writer.start()
+        await self._order_aggregator.start()
+        return self
+
     @property
     def active_bots(self):
         """Get dictionary of active bots."""
         return self._active_bots
 
+    @property
+    def activity_feed(self):
+        """Get shared activity feed."""
+        return self._activity_feed
+
+    @property
+    def price_oracle(self):
+        """Get shared price oracle."""
+        return self._price_oracle
+
+    @property
+    def market_cache(self):
+        """Get shared market metadata cache."""
+        return self._market_cache
+
+    @property
+    def order_book_cache(self):
+        """Get shared order book cache."""
+        return self._order_book_cache
+
+    @property
+    def wallet_ledger(self):
+        """Get shared paper wallet ledger."""
+        return self._wallet_ledger
+
+    @property
+    def trade_writer(self):
+        """Get shared trade batch writer."""
+        return self._trade_writer
+
+    @property
+    def order_aggregator(self):
+        """Get shared production order aggregator."""
+        return self._order_aggregator
+
+    @property
+    def fill_simulator(self):
+        """Get shared paper fill simulator."""
+        return self._fill_simulator
+
     @property
     def bot_count(self):
         """Get number of active bots."""
@@ -50,6 +179,25 @@ class BotManager:
         """
         return self._active_bots.get(_bot_id, None)
 
+    async def reload_daily_losses(self, _bot_ids):
+        """
+        Reseed the daily loss windows of running bots from the database.
+
+        Args:
+            _bot_ids: Bot identifiers (bots that aren't loaded are skipped)
+
+        Returns:
+            Number of bots reseeded
+        """
+        reloaded = 0
+        for bot_id in _bot_ids:
+            bot = self._active_bots.get(bot_id, None)
+            if bot is None:
+                continue
+            await bot.reload_daily_losses()
+            reloaded = reloaded + 1
+        return reloaded
+
     async def create_bot(self, _bot_data):
         """
         Create a new bot instance.
@@ -77,7 +225,14 @@ class BotManager:
                     'max_daily_loss': _bot_data.get('max_daily_loss', 1000.0)
                 },
                 _polymarket_client=self._polymarket_client,
-                _db_manager=self._db_manager
+                _db_manager=self._db_manager,
+                _activity_feed=self._activity_feed,
+                _market_cache=self._market_cache,
+                _price_oracle=self._price_oracle,
+                _wallet_ledger=self._wallet_ledger,
+                _trade_writer=self._trade_writer,
+                _order_aggregator=self._order_aggregator,
+                _fill_simulator=self._fill_simulator
             )
 
             self._active_bots[bot_id] = bot
@@ -145,6 +300,9 @@ class BotManager:
         if bot.is_running == True:
             await bot.stop()
 
+        # Write out and drop its paper wallet
+        await self._wallet_ledger.unload(_bot_id)
+
         # Remove from active bots
         del self._active_bots[_bot_id]
         self._logger.info("Removed bot: {}".format(_bot_id))
@@ -164,4 +322,10 @@ class BotManager:
             i = i + 1
 
         self._active_bots.clear()
+        await self._order_aggregator.stop()
+        await self._trade_writer.stop()
+        await self._wallet_ledger.stop()
+        await self._price_oracle.stop()
+        await self._activity_feed.stop()
+        await self._order_book_cache.stop()
         self._logger.info("Bot manager cleanup complete")
@@ -7,17 +7,36 @@ Follows bobbyofna coding style conventions.
 
 import logging
 import asyncio
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 import re
+import uuid
 
 from .base_bot import BaseBot
+from .seen_index import SeenIndex
+from .position_book import PositionBook
+from .loss_tracker import LossTracker
+from .order_aggregator import order_fill, cancel_resting
+from ..utils.metrics import LatencyTracker
+
+
+# Copy latency stages: (name, start timestamp, end timestamp)
+LATENCY_STAGES = (
+    ('detect', 'source_timestamp', 'detected_at'),  # Target's trade -> we saw it
+    ('decide', 'detected_at', 'decided_at'),  # Seen -> passed sizing and limits
+    ('submit', 'decided_at', 'submitted_at'),  # Decided -> order sent (production)
+    ('ack', 'submitted_at', 'acked_at'),  # Order sent -> exchange acknowledged
+    ('commit', 'decided_at', 'committed_at'),  # Decided (or acked) -> trade row committed
+)
 
 
 class CopyBot(BaseBot):
     """Bot that copies trades from a target user."""
 
-    def __init__(self, _id, _name, _target_url, _target_address=None, _parameters=None, _polymarket_client=None, _db_manager=None):
+    def __init__(self, _id, _name, _target_url, _target_address=None, _parameters=None, _polymarket_client=None, _db_manager=None,
+                 _activity_feed=None, _market_cache=None, _price_oracle=None, _queue_size=100, _seen_capacity=10000,
+                 _wallet_ledger=None, _trade_writer=None, _order_aggregator=None, _fill_simulator=None):
         """
         Initialize copy bot.
 
@@ -29,6 +48,15 @@ class CopyBot(BaseBot):
             _parameters: Bot parameters
             _polymarket_client: Polymarket API client instance
             _db_manager: Database manager instance
+            _activity_feed: Shared ActivityFeed (bot polls the target itself if None)
+            _market_cache: Shared MarketCache (market info fetched directly if None)
+            _price_oracle: Shared PriceOracle (prices fetched per trade if None)
+            _queue_size: Capacity of each pipeline queue (ingest waits when the pipeline is full)
+            _seen_capacity: Recently handled transaction hashes kept in memory
+            _wallet_ledger: Shared WalletLedger (paper wallet updated in the database per trade if None)
+            _trade_writer: Shared TradeBatchWriter for paper trades held by the ledger (inserted per trade if None)
+            _order_aggregator: Shared OrderAggregator for production orders (placed per bot if None)
+            _fill_simulator: Shared FillSimulator pricing paper trades from the order book (target's price if None)
         """
         super().__init__(_id=_id, _name=_name, _bot_type='copy', _parameters=_parameters)
 
@@ -42,13 +70,61 @@ class CopyBot(BaseBot):
 
         self._polymarket_client = _polymarket_client
         self._db_manager = _db_manager
-
-        # Track active trades
-        self._active_trades = {}
+        self._activity_feed = _activity_feed
+        self._market_cache = _market_cache
+        self._price_oracle = _price_oracle
+        self._wallet_ledger = _wallet_ledger
+        self._trade_writer = _trade_writer
+        self._order_aggregator = _order_aggregator
+        self._fill_simulator = _fill_simulator
+
+        # New target activities pushed by the shared feed; the event wakes the loop early
+        self._activity_inbox = asyncio.Queue()
+        self._activity_event = asyncio.Event()
+
+        # Open trades indexed by market/outcome; target SELLs mark them for exit
+        self._active_trades = PositionBook(_min_hold=30)
         self._last_check_time = None
 
-        # Track seen transaction hashes to avoid duplicate processing
-        self._seen_transactions = set()
+        # Whether this bot's open trades currently hold references in the shared feed/oracle/book cache
+        self._markets_tracked = False
+
+        # Realized losses over the past 24 hours for the daily loss limit
+        self._daily_losses = LossTracker(_window=86400)
+
+        # Recently handled transaction hashes; older ones are checked against the trades table
+        self._seen_transactions = SeenIndex(_seen_capacity)
+
+        # Copy latency per stage, plus end to end (target's trade -> copy recorded)
+        self._latency = {}
+        for stage in LATENCY_STAGES:
+            self._latency[stage[0]] = LatencyTracker()
+        self._latency['total'] = LatencyTracker()
+
+        # Copy pipeline: ingest -> decide -> execute -> persist over bounded queues
+        self._decide_queue = asyncio.Queue(maxsize=_queue_size)
+        self._execute_queue = asyncio.Queue(maxsize=_queue_size)
+        self._persist_queue = asyncio.Queue(maxsize=_queue_size)
+        self._workers = []
+        self._accepting = True
+        self._stop_task = None
+
+        # Production orders being placed and recorded; not cancelled with the workers
+        self._order_tasks = set()
+
+        # Position monitor and daily loss checks run beside the pipeline; events wake them early
+        self._monitor_event = asyncio.Event()
+        self._risk_event = asyncio.Event()
+
+        self._stage_stats = {}
+        for stage in ['ingest', 'decide', 'execute', 'persist', 'monitor', 'risk']:
+            self._stage_stats[stage] = {
+                'processed': 0,
+                'filtered': 0,
+                'errors': 0,
+                'wait': LatencyTracker(),
+                'service': LatencyTracker()
+            }
 
     @property
     def target_address(self):
@@ -97,134 +173,542 @@ class CopyBot(BaseBot):
         Returns:
             Self for chaining
         """
+        # Already running: the parent just warns (reloading would track every market twice)
+        if self.is_running == True:
+            return await super().start(_mode)
+
         # Call parent start method
         await super().start(_mode)
+        self._markets_tracked = True
 
-        # Load active trades from database
+        # Load active trades and the past day's losses from database
         await self._load_active_trades()
+        await self._load_daily_losses()
+
+        # Paper balance checks and reservations are served from the ledger
+        if self._wallet_ledger is not None:
+            await self._wallet_ledger.load(self._id)
+
+        # Receive target activity from the shared feed once open trades are loaded
+        if self._activity_feed is not None and self._target_address is not None:
+            self._activity_feed.subscribe(self._target_address, self)
+
+        # Target SELLs seen before this start may already close positions we hold
+        await self._apply_recent_sells()
 
         return self
 
+    async def stop(self):
+        """
+        Stop bot operation, finish in-flight copies and leave the shared activity feed.
+
+        Returns:
+            Self for chaining
+        """
+        if self.is_running == True:
+            await self._drain_pipeline(10)
+
+        if self._activity_feed is not None and self._target_address is not None:
+            await self._activity_feed.unsubscribe(self._target_address, self)
+
+        result = await super().stop()
+
+        # Orders already sent are recorded even if stopping cancelled the worker waiting on them
+        if len(self._order_tasks) > 0:
+            await asyncio.gather(*list(self._order_tasks), return_exceptions=True)
+
+        # Stop may be called again (auto-pause, then the API or shutdown); release references only once
+        if self._markets_tracked == True:
+            for trade_id, trade in self._active_trades.trades():
+                self._untrack_market(trade.get('market_id', ''), trade.get('outcome'), trade.get('token_id'))
+            self._markets_tracked = False
+
+        return result
+
+    def _track_market(self, _market_id, _outcome=None, _token_id=None):
+        """Register a held market (and its outcome token's book) with the shared feed and price oracle."""
+        if self._markets_tracked == False:
+            return
+        if self._activity_feed is not None:
+            self._activity_feed.track_market(
+                _market_id, _address=self._target_address, _outcome=_outcome, _token_id=_token_id
+            )
+        if self._price_oracle is not None:
+            self._price_oracle.track_market(_market_id, _outcome=_outcome, _token_id=_token_id)
+
+    def _untrack_market(self, _market_id, _outcome=None, _token_id=None):
+        """Release a held market from the shared feed and price oracle (no-op once the bot has stopped)."""
+        if self._markets_tracked == False:
+            return
+        if self._activity_feed is not None:
+            self._activity_feed.untrack_market(
+                _market_id, _address=self._target_address, _outcome=_outcome, _token_id=_token_id
+            )
+        if self._price_oracle is not None:
+            self._price_oracle.untrack_market(_market_id, _outcome=_outcome, _token_id=_token_id)
+
+    def deliver_activities(self, _activities):
+        """
+        Queue new target activities pushed by the shared feed.
+
+        Args:
+            _activities: List of activity dictionaries (newest first)
+        """
+        for activity in _activities:
+            self._activity_inbox.put_nowait(activity)
+        self._activity_event.set()
+
+    def _drain_activity_inbox(self):
+        """
+        Take every activity currently queued by the shared feed.
+
+        Returns:
+            List of activities in delivery order
+        """
+        self._activity_event.clear()
+        activities = []
+        while self._activity_inbox.empty() == False:
+            activities.append(self._activity_inbox.get_nowait())
+        return activities
+
+    async def _wait_for_activity(self, _timeout):
+        """
+        Sleep until the feed pushes new activity or the timeout elapses.
+
+        Args:
+            _timeout: Maximum seconds to wait
+        """
+        try:
+            await asyncio.wait_for(self._activity_event.wait(), timeout=_timeout)
+        except asyncio.TimeoutError:
+            pass
+
     async def _load_active_trades(self):
-        """Load all open trades from database into memory and populate seen transactions."""
+        """Load open trades from database into memory."""
         try:
             if self._db_manager is None:
                 return
 
-            # Get all trades for this bot (both open and closed) to rebuild seen_transactions
-            all_trades = await self._db_manager.get_bot_trades(self._id, _limit=1000)
+            # Closed trades aren't needed: duplicates are caught by the trades table's unique index
+            open_trades = await self._db_manager.get_bot_trades(self._id, _status='open')
 
-            # Filter for open trades and populate seen transactions
             open_count = 0
-            for trade in all_trades:
-                # Add source_trade_id to seen transactions to prevent reprocessing
+            for trade in open_trades:
+                self._active_trades.add(trade)
+                self._track_market(trade.get('market_id', ''), trade.get('outcome'), trade.get('token_id'))
+
                 source_trade_id = trade.get('source_trade_id')
                 if source_trade_id:
                     self._seen_transactions.add(source_trade_id)
+                open_count = open_count + 1
 
-                if trade.get('status') == 'open':
-                    trade_id = trade.get('trade_id')
-                    self._active_trades[trade_id] = trade
-                    open_count = open_count + 1
-
-            self._logger.info("Loaded {} open trades and {} seen transactions from database".format(
-                open_count, len(self._seen_transactions)
-            ))
+            self._logger.info("Loaded {} open trades from database".format(open_count))
 
         except Exception as e:
             self._logger.error("Failed to load active trades: {}".format(str(e)))
 
     async def _run_loop(self):
-        """Main bot execution loop."""
+        """
+        Main bot execution loop.
+
+        Runs the copy pipeline (ingest -> decide -> execute -> persist) as worker
+        tasks joined by bounded queues, next to independent position monitor and
+        daily loss loops, so new target trades never wait behind either.
+        """
         self._logger.info("Starting copy bot loop for {}".format(self._target_address))
 
+        self._accepting = True
+        self._workers = [
+            asyncio.create_task(self._ingest_loop()),
+            asyncio.create_task(self._stage_worker('decide', self._decide_queue, self._decide_stage, self._execute_queue)),
+            asyncio.create_task(self._stage_worker('execute', self._execute_queue, self._execute_stage, self._persist_queue)),
+            asyncio.create_task(self._stage_worker('persist', self._persist_queue, self._persist_stage)),
+            asyncio.create_task(self._monitor_loop()),
+            asyncio.create_task(self._risk_loop())
+        ]
+
+        try:
+            await asyncio.gather(*self._workers)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+
+    async def _drain_pipeline(self, _timeout):
+        """
+        Stop taking new activity and let trades already in the pipeline finish.
+
+        Args:
+            _timeout: Maximum seconds to wait for the queues to empty
+        """
+        self._accepting = False
+        if len(self._workers) == 0:
+            return
+
+        try:
+            for queue in [self._decide_queue, self._execute_queue, self._persist_queue]:
+                await asyncio.wait_for(queue.join(), timeout=_timeout)
+        except asyncio.TimeoutError:
+            self._logger.warning("Pipeline did not drain within {}s, dropping in-flight trades".format(_timeout))
+
+    async def _stage_worker(self, _name, _queue, _handler, _next_queue=None):
+        """
+        Run one pipeline stage until cancelled.
+
+        Args:
+            _name: Stage name for metrics
+            _queue: Queue the stage takes items from
+            _handler: Async handler(item) returning the item to pass on, or None to drop it
+            _next_queue: Queue of the following stage (None for the last stage)
+        """
+        stats = self._stage_stats[_name]
+        while True:
+            item = await _queue.get()
+            try:
+                stats['wait'].record(time.monotonic() - item['enqueued_at'])
+                started = time.monotonic()
+                result = await _handler(item)
+                stats['service'].record(time.monotonic() - started)
+
+                if result is None:
+                    stats['filtered'] = stats['filtered'] + 1
+                else:
+                    stats['processed'] = stats['processed'] + 1
+                    if _next_queue is not None:
+                        result['enqueued_at'] = time.monotonic()
+                        await _next_queue.put(result)  # Blocks while the next stage is full
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stats['errors'] = stats['errors'] + 1
+                self._logger.error("Error in {} stage: {}".format(_name, str(e)))
+            finally:
+                _queue.task_done()
+
+    async def _ingest_loop(self):
+        """Pipeline stage 1: pick up new target trades and queue them for decision."""
         while self._running == True:
             try:
                 await self._poll_user_activity()
+                await self._wait_for_activity(5)  # Wake on pushed activity, else every 5 seconds
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stage_stats['ingest']['errors'] = self._stage_stats['ingest']['errors'] + 1
+                self._logger.error("Error in ingest loop: {}".format(str(e)))
+                await asyncio.sleep(5)
+
+    async def _monitor_loop(self):
+        """Check open positions on their own cadence, waking early when the target sells."""
+        while self._running == True:
+            try:
+                started = time.monotonic()
                 await self._monitor_positions()
+                self._stage_stats['monitor']['service'].record(time.monotonic() - started)
+                self._stage_stats['monitor']['processed'] = self._stage_stats['monitor']['processed'] + 1
+
+                try:
+                    await asyncio.wait_for(self._monitor_event.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    pass
+                self._monitor_event.clear()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stage_stats['monitor']['errors'] = self._stage_stats['monitor']['errors'] + 1
+                self._logger.error("Error in monitor loop: {}".format(str(e)))
+                await asyncio.sleep(5)
+
+    async def _risk_loop(self):
+        """Check the daily loss limit periodically and after every closed trade."""
+        while self._running == True:
+            try:
+                started = time.monotonic()
                 await self._check_daily_loss_limit()
-                await asyncio.sleep(5)  # Poll every 5 seconds
+                self._stage_stats['risk']['service'].record(time.monotonic() - started)
+                self._stage_stats['risk']['processed'] = self._stage_stats['risk']['processed'] + 1
+
+                try:
+                    await asyncio.wait_for(self._risk_event.wait(), timeout=30)
+                except asyncio.TimeoutError:
+                    pass
+                self._risk_event.clear()
 
             except asyncio.CancelledError:
-                break
+                raise
             except Exception as e:
-                self._logger.error("Error in run loop: {}".format(str(e)))
+                self._stage_stats['risk']['errors'] = self._stage_stats['risk']['errors'] + 1
+                self._logger.error("Error in risk loop: {}".format(str(e)))
                 await asyncio.sleep(5)
 
     async def _poll_user_activity(self):
-        """Poll target user for new trades."""
+        """Pick up new target trades and queue the BUYs for the decide stage."""
         if self._polymarket_client is None:
             return
 
+        stats = self._stage_stats['ingest']
+
         try:
-            activities = await self._polymarket_client.get_user_recent_activity(
-                _user_address=self._target_address,
-                _limit=10
-            )
+            if self._activity_feed is not None:
+                activities = self._drain_activity_inbox()
+            else:
+                activities = await self._polymarket_client.get_user_recent_activity(
+                    _user_address=self._target_address,
+                    _limit=10
+                )
+
+            # Drop transactions handled recently, then ask the database about the rest in one query
+            new_activities = []
+            batch_hashes = set()
+            for activity in activities:
+                tx_hash = activity.transaction_hash
+                if tx_hash is None or tx_hash in batch_hashes or tx_hash in self._seen_transactions:
+                    continue
+                batch_hashes.add(tx_hash)
+                new_activities.append(activity)
+
+            already_copied = await self._get_copied_source_trades([
+                activity.transaction_hash for activity in new_activities if activity.is_buy == True
+            ])
 
             # Process each activity
             i = 0
-            for activity in activities:
-                # Check if this is a new trade we haven't seen
-                tx_hash = activity.get('transactionHash')
+            for activity in new_activities:
+                if self._accepting == False:
+                    break
 
-                if tx_hash is None:
-                    i = i + 1
-                    continue
+                tx_hash = activity.transaction_hash
 
-                # Skip if we've already processed this transaction
-                if tx_hash in self._seen_transactions:
+                # Copied before this index remembered it (e.g. before a restart)
+                if tx_hash in already_copied:
+                    self._seen_transactions.add(tx_hash)
                     i = i + 1
                     continue
 
-                # Only process BUY orders (we'll handle SELL separately when monitoring positions)
-                side = activity.get('side')
+                # Only copy BUY orders; a SELL closes our matching positions via the monitor
+                side = activity.side
                 if side != 'BUY':
                     self._logger.debug("Skipping non-BUY trade: {}".format(side))
                     self._seen_transactions.add(tx_hash)
+                    if activity.is_sell == True:
+                        self._apply_source_sell(activity)
+                    stats['filtered'] = stats['filtered'] + 1
                     i = i + 1
                     continue
 
                 # Extract trade data
-                trade_size = activity.get('size', 0)
-                trade_price = activity.get('price', 0)
+                trade_size = activity.size
+                trade_price = activity.price
+                outcome = activity.outcome or 'Unknown'
 
                 # Log the new trade
                 self._logger.info("NEW TRADE DETECTED: {} {} @ ${} (tx: {})".format(
-                    activity.get('outcome', 'Unknown'),
+                    outcome,
                     trade_size,
                     trade_price,
                     tx_hash[:10]
                 ))
 
+                # Directly polled activity has not been stamped by the shared feed
+                if activity.detected_at is None:
+                    activity.detected_at = time.time()
+
                 # Prepare trade data for execution
                 trade_data = {
-                    'market_id': activity.get('conditionId', ''),
-                    'outcome': activity.get('outcome', 'Unknown'),
+                    'market_id': activity.condition_id or '',
+                    'outcome': outcome,
                     'amount': trade_size,
                     'price': trade_price,
                     'source_trade_id': tx_hash,
                     'target_trade_id': tx_hash,
-                    'market_title': activity.get('title', 'Unknown Market'),
-                    'market_slug': activity.get('slug', '')
+                    'token_id': activity.asset,
+                    'market_title': activity.title or 'Unknown Market',
+                    'market_slug': activity.slug or '',
+                    'source_timestamp': activity.timestamp,
+                    'detected_at': activity.detected_at
                 }
 
-                # Execute the copy trade
-                result = await self.execute_trade(trade_data)
-
-                if result is not None:
-                    self._logger.info("Successfully copied trade: {}".format(result.get('trade_id')))
-                else:
-                    self._logger.warning("Failed to copy trade or trade was filtered out")
-
                 # Mark transaction as seen (permanently to prevent reprocessing)
                 self._seen_transactions.add(tx_hash)
 
+                # Hand off to the decide stage; waits only if the pipeline is backed up
+                started = time.monotonic()
+                await self._decide_queue.put({'trade_data': trade_data, 'enqueued_at': time.monotonic()})
+                stats['wait'].record(time.monotonic() - started)
+                stats['processed'] = stats['processed'] + 1
+
                 i = i + 1
 
         except Exception as e:
+            stats['errors'] = stats['errors'] + 1
             self._logger.error("Failed to poll user activity: {}".format(str(e)))
 
+    async def _get_copied_source_trades(self, _tx_hashes):
+        """
+        Check which transactions already have a copy recorded.
+
+        Args:
+            _tx_hashes: List of transaction hashes not in the in-memory index
+
+        Returns:
+            Set of hashes already copied (empty if the lookup fails; the insert still rejects duplicates)
+        """
+        if self._db_manager is None or len(_tx_hashes) == 0:
+            return set()
+
+        try:
+            return await self._db_manager.get_copied_source_trades(self._id, _tx_hashes)
+        except Exception as e:
+            self._logger.error("Failed to check copied trades: {}".format(str(e)))
+            return set()
+
+    async def _decide_stage(self, _item):
+        """Pipeline stage 2: size the copy and apply trade limits."""
+        trade_data = _item['trade_data']
+        copy_amount = self._size_trade(trade_data)
+        if copy_amount is None:
+            self._logger.warning("Trade {} filtered out".format(trade_data.get('source_trade_id', '')[:10]))
+            return None
+
+        _item['amount'] = copy_amount
+        _item['paper'] = self.is_paper_mode
+        return _item
+
+    async def _execute_stage(self, _item):
+        """Pipeline stage 3: build the paper trade record or place the production order."""
+        if _item['paper'] == True:
+            if self._reserve_paper_funds(_item['amount']) == False:
+                return None
+            record = await self._prepare_trade(_item['trade_data'], _item['amount'])
+            if record is not None:
+                record = await self._simulate_paper_entry(record)
+            if record is None:
+                self._release_paper_funds(_item['amount'])
+        else:
+            # Placed and recorded in one task, so a fill is never left without its trade row
+            record = await asyncio.shield(self._start_production_order(_item['trade_data'], _item['amount']))
+
+        if record is None:
+            return None
+
+        _item['record'] = record
+        return _item
+
+    async def _persist_stage(self, _item):
+        """Pipeline stage 4: record the copied trade (reserving paper funds with it)."""
+        if _item['paper'] == True:
+            result = await self._persist_paper_trade(_item['trade_data'], _item['record'], _item['amount'])
+        else:
+            result = _item['record']  # Recorded with the order (see _start_production_order)
+
+        if result is not None:
+            self._logger.info("Successfully copied trade: {}".format(result.get('trade_id')))
+        return result
+
+    def get_position_stats(self):
+        """
+        Get position book statistics.
+
+        Returns:
+            Dictionary of open trades, indexed markets and pending exits
+        """
+        return self._active_trades.get_stats()
+
+    def get_daily_loss_stats(self):
+        """
+        Get rolling daily loss statistics.
+
+        Returns:
+            Dictionary of losses within the window and the configured limit
+        """
+        stats = self._daily_losses.get_stats()
+        stats['limit'] = float(self._parameters.get('max_daily_loss', 1000.0))
+        return stats
+
+    def get_seen_stats(self):
+        """
+        Get seen transaction index statistics.
+
+        Returns:
+            Dictionary of index size and hit/miss/eviction counters
+        """
+        return self._seen_transactions.get_stats()
+
+    def get_pipeline_stats(self):
+        """
+        Get per-stage pipeline statistics.
+
+        For the queued stages, 'wait' is time spent queued and 'service' is
+        handler time; for ingest, 'wait' is time blocked by backpressure.
+
+        Returns:
+            Dictionary of stage name to counters, queue depth and timings
+        """
+        queues = {
+            'decide': self._decide_queue,
+            'execute': self._execute_queue,
+            'persist': self._persist_queue
+        }
+
+        stats = {}
+        for name, stage in self._stage_stats.items():
+            stats[name] = {
+                'processed': stage['processed'],
+                'filtered': stage['filtered'],
+                'errors': stage['errors'],
+                'wait': stage['wait'].get_stats(),
+                'service': stage['service'].get_stats()
+            }
+            if name in queues:
+                stats[name]['queued'] = queues[name].qsize()
+                stats[name]['capacity'] = queues[name].maxsize
+        return stats
+
+    async def _apply_recent_sells(self):
+        """Apply the target's recent SELLs to the position book (after loading open trades)."""
+        if len(self._active_trades) == 0 or self._polymarket_client is None:
+            return
+
+        try:
+            if self._activity_feed is not None:
+                activities = self._activity_feed.get_recent_activities(self._target_address)
+            else:
+                activities = await self._polymarket_client.get_user_recent_activity(
+                    _user_address=self._target_address,
+                    _limit=50  # Get more activities to catch SELL orders
+                )
+
+            for activity in activities:
+                if activity.is_sell == True:
+                    self._apply_source_sell(activity)
+
+        except Exception as e:
+            self._logger.error("Failed to apply recent target sells: {}".format(str(e)))
+
+    def _apply_source_sell(self, _activity):
+        """
+        Mark our positions matching a target SELL for exit and wake the monitor.
+
+        Args:
+            _activity: SELL Activity from the target
+        """
+        marked = self._active_trades.apply_sell(_activity)
+        if len(marked) == 0:
+            return
+
+        self._logger.info(
+            "TARGET USER CLOSED POSITION: Market {} {} - Closing {} trade(s) at {}".format(
+                (_activity.condition_id or '')[:10], _activity.outcome, len(marked), _activity.price
+            )
+        )
+        self._monitor_event.set()
+
     async def _monitor_positions(self):
         """
         Monitor open positions for:
@@ -238,96 +722,51 @@ class CopyBot(BaseBot):
             return
 
         try:
-            # Get recent activities from target user
-            activities = await self._polymarket_client.get_user_recent_activity(
-                _user_address=self._target_address,
-                _limit=50  # Get more activities to catch SELL orders
-            )
-
-            # Build a mapping of market/outcome combinations that have been sold by target user
-            # Key: (market_id, outcome), Value: list of SELL transaction data
-            source_sell_orders = {}
-            for activity in activities:
-                if activity.get('side') == 'SELL':
-                    market_id = activity.get('conditionId', '')
-                    outcome = activity.get('outcome', '')
-                    key = (market_id, outcome)
-
-                    if key not in source_sell_orders:
-                        source_sell_orders[key] = []
-
-                    source_sell_orders[key].append({
-                        'tx_hash': activity.get('transactionHash'),
-                        'price': activity.get('price', 0),
-                        'size': activity.get('size', 0),
-                        'timestamp': activity.get('timestamp', 0)
-                    })
+            # Close exits marked by target SELLs first; they don't need a price lookup
+            for trade_id, exit_price in self._active_trades.take_exits():
+                # Validate exit price
+                if exit_price <= 0 or exit_price > 1.0:
+                    self._logger.error(
+                        "Invalid exit price {} from source trader SELL. Skipping close.".format(exit_price)
+                    )
+                    continue
 
-            # Check each of our active trades
-            trades_to_close = []
-            for trade_id, trade in list(self._active_trades.items()):
-                entry_price = float(trade.get('price', 0))
-                amount = float(trade.get('amount', 0))
-                outcome = trade.get('outcome', '')
-                market_id = trade.get('market_id', '')
-                opened_at = trade.get('opened_at')
-
-                # Parse opened_at timestamp if it's a string
-                if isinstance(opened_at, str):
-                    from dateutil import parser
-                    opened_at = parser.parse(opened_at)
-                elif opened_at is None:
-                    # If no timestamp, skip source trader close check
-                    opened_at = datetime.utcnow()
-
-                # Convert to Unix timestamp for comparison
-                opened_timestamp = int(opened_at.timestamp())
-
-                # Check if source trader has closed this market/outcome combination
-                # We match by market + outcome + timestamp (SELL must be after our BUY)
-                key = (market_id, outcome)
-                if key in source_sell_orders:
-                    # Find SELL orders that happened AFTER we opened our position
-                    # Also add minimum hold time of 30 seconds to avoid closing immediately
-                    min_hold_time = 30  # seconds
-                    matching_sells = [
-                        sell for sell in source_sell_orders[key]
-                        if (sell.get('timestamp', 0) > opened_timestamp and
-                            sell.get('timestamp', 0) > opened_timestamp + min_hold_time)
-                    ]
-
-                    if len(matching_sells) > 0:
-                        # Use the most recent SELL price as exit price
-                        most_recent_sell = max(matching_sells, key=lambda x: x.get('timestamp', 0))
-                        exit_price = float(most_recent_sell.get('price', 0))
-
-                        # Validate exit price
-                        if exit_price <= 0 or exit_price > 1.0:
-                            self._logger.error(
-                                "Invalid exit price {} from source trader SELL. Skipping close.".format(exit_price)
-                            )
-                            continue
+                closed = await self.close_trade(trade_id, exit_price)
+                if closed is None and trade_id in self._active_trades:
+                    self._active_trades.mark_exit(trade_id, exit_price)  # Retry on the next pass
+                else:
+                    self._logger.info("Position closed due to: source_trader_close")
 
-                        self._logger.info(
-                            "TARGET USER CLOSED POSITION: Market {} {} - Closing our trade {} at {}".format(
-                                market_id[:10], outcome, trade_id, exit_price
-                            )
-                        )
-                        trades_to_close.append((trade_id, exit_price, 'source_trader_close'))
-                        continue  # Skip stop-loss check if we're closing due to source trader
+            # Check minimum hold time before evaluating stop-loss
+            # This prevents closing positions immediately due to temporary price fluctuations
+            now = time.time()
+            min_hold_for_stop_loss = 60  # Wait at least 60 seconds before stop-loss can trigger
 
-                # Check minimum hold time before evaluating stop-loss
-                # This prevents closing positions immediately due to temporary price fluctuations
-                time_held = (datetime.utcnow() - opened_at).total_seconds()
-                min_hold_for_stop_loss = 60  # Wait at least 60 seconds before stop-loss can trigger
+            trades_to_close = []
+            stop_loss_candidates = []
+            for trade_id, trade in self._active_trades.trades():
+                if self._active_trades.is_exiting(trade_id) == True:
+                    continue
 
+                time_held = now - self._active_trades.opened_at(trade_id)
                 if time_held < min_hold_for_stop_loss:
                     # Too early to evaluate stop-loss
                     continue
 
-                # Get current market price for stop-loss monitoring
-                current_price = await self._get_current_market_price(market_id, outcome)
+                stop_loss_candidates.append((trade_id, trade, time_held))
 
+            # Get current prices for every stop-loss candidate in one batch
+            current_prices = await self._get_current_market_prices([
+                (trade.get('market_id', ''), trade.get('outcome', '')) for trade_id, trade, time_held in stop_loss_candidates
+            ])
+
+            for trade_id, trade, time_held in stop_loss_candidates:
+                entry_price = float(trade.get('price', 0))
+                amount = float(trade.get('amount', 0))
+                outcome = trade.get('outcome', '')
+                market_id = trade.get('market_id', '')
+
+                current_price = current_prices.get((market_id, outcome))
                 if current_price is None:
                     continue
 
@@ -364,6 +803,29 @@ class CopyBot(BaseBot):
         except Exception as e:
             self._logger.error("Failed to monitor positions: {}".format(str(e)))
 
+    async def _get_current_market_prices(self, _keys):
+        """
+        Get current market prices for several market outcomes.
+
+        Args:
+            _keys: List of (market_id, outcome) tuples
+
+        Returns:
+            Dictionary of (market_id, outcome) to price (missing if unavailable)
+        """
+        if len(_keys) == 0:
+            return {}
+
+        if self._price_oracle is not None:
+            return await self._price_oracle.get_prices(_keys)
+
+        prices = {}
+        for key in set(_keys):
+            price = await self._get_current_market_price(key[0], key[1])
+            if price is not None:
+                prices[key] = price
+        return prices
+
     async def _get_current_market_price(self, _market_id, _outcome):
         """
         Get current market price for a specific outcome.
@@ -375,83 +837,56 @@ class CopyBot(BaseBot):
         Returns:
             Current price as float, or None if unavailable
         """
-        try:
-            # Get recent trades for this market from all users
-            # Use httpx directly instead of relying on polymarket client's internal client
-            import httpx
-
-            async with httpx.AsyncClient(timeout=10.0) as temp_client:
-                url = "{}/trades".format(self._polymarket_client._data_url)
-                params = {
-                    'condition_id': _market_id,
-                    '_limit': 5,
-                    '_sort': 'timestamp:desc'
-                }
-
-                response = await temp_client.get(url, params=params)
+        # Prefer a fresh price pushed over the stream
+        if self._activity_feed is not None:
+            streamed_price = self._activity_feed.get_streamed_price(_market_id, _outcome)
+            if streamed_price is not None:
+                return streamed_price
 
-                if response.status_code == 200:
-                    trades = response.json()
+        try:
+            # Get recent trades for this market from all users over the shared client pool
+            trades = await self._polymarket_client.get_market_trades(_market_id, _limit=5)
 
-                    # Find most recent trade for this outcome
-                    for trade in trades:
-                        if trade.get('outcome') == _outcome:
-                            return float(trade.get('price', 0))
+            # Find most recent trade for this outcome
+            for trade in trades:
+                if trade.get('outcome') == _outcome:
+                    return float(trade.get('price', 0))
 
-                # If no recent trades, return None
-                return None
+            # If no recent trades, return None
+            return None
 
         except Exception as e:
             self._logger.debug("Failed to get market price: {}".format(str(e)))
             return None
 
+    async def reload_daily_losses(self):
+        """Reseed the rolling loss window after trades were deleted or P/L was reset."""
+        await self._load_daily_losses()
+
+    async def _load_daily_losses(self):
+        """Seed the rolling loss window from the database (one aggregate query)."""
+        try:
+            if self._db_manager is None:
+                return
+
+            buckets = await self._db_manager.get_loss_buckets(self._id, _window_hours=24)
+            self._daily_losses.seed(buckets)
+            self._risk_event.set()
+
+        except Exception as e:
+            self._logger.error("Failed to load daily losses: {}".format(str(e)))
+
     async def _check_daily_loss_limit(self):
         """
         Check if bot has exceeded daily loss limit.
         If exceeded, pause the bot temporarily.
         """
         try:
-            # Get all closed trades from past 24 hours
-            from datetime import timedelta
-
             max_daily_loss = float(self._parameters.get('max_daily_loss', 1000.0))
 
-            # Query trades from database for past 24 hours
-            if self._db_manager is None:
-                return
-
-            # Calculate total losses in past 24 hours
-            # We'll get all trades and filter in Python for simplicity
-            all_trades = await self._db_manager.get_bot_trades(self._id, _limit=100)
-
-            now = datetime.utcnow()
-            daily_cutoff = now - timedelta(hours=24)
-
-            total_loss = 0.0
-            loss_count = 0
-            for trade in all_trades:
-                # Only count closed trades
-                if trade.get('status') != 'closed':
-                    continue
-
-                # Check if within 24 hours
-                closed_at = trade.get('closed_at')
-                if closed_at is None:
-                    continue
-
-                # Parse datetime if it's a string
-                if isinstance(closed_at, str):
-                    from dateutil import parser
-                    closed_at = parser.parse(closed_at)
-
-                if closed_at < daily_cutoff:
-                    continue
-
-                # Sum up losses only (negative P&L)
-                pnl = float(trade.get('profit_loss', 0))
-                if pnl < 0:
-                    total_loss = total_loss + abs(pnl)
-                    loss_count = loss_count + 1
+            # Losses over the past 24 hours, kept up to date as trades close
+            total_loss = self._daily_losses.total_loss()
+            loss_count = self._daily_losses.loss_count()
 
             # Log daily loss status periodically (only if we have losses)
             if loss_count > 0:
@@ -461,6 +896,10 @@ class CopyBot(BaseBot):
                     )
                 )
 
+            # Already pausing
+            if self._stop_task is not None and self._stop_task.done() == False:
+                return
+
             # Check if exceeded limit
             if total_loss >= max_daily_loss:
                 self._logger.error(
@@ -468,33 +907,31 @@ class CopyBot(BaseBot):
                         total_loss, max_daily_loss
                     )
                 )
-                # Stop the bot
-                await self.stop()
+                # Take no new trades while stopping
+                self._accepting = False
 
                 # Update status in database
-                await self._db_manager.update_bot(self._id, {
-                    'status': 'inactive',
-                    'notes': 'Auto-paused: Daily loss limit exceeded (${:.2f})'.format(total_loss)
-                })
+                if self._db_manager is not None:
+                    await self._db_manager.update_bot(self._id, {
+                        'status': 'inactive',
+                        'notes': 'Auto-paused: Daily loss limit exceeded (${:.2f})'.format(total_loss)
+                    })
+
+                # Stop the bot from outside its own worker tasks (stop() cancels them)
+                self._stop_task = asyncio.create_task(self.stop())
 
         except Exception as e:
             self._logger.error("Failed to check daily loss limit: {}".format(str(e)))
 
-    async def execute_trade(self, _trade_data):
+    def _size_trade(self, _trade_data):
         """
-        Execute a copy trade with full wallet balance management.
+        Size a copy trade from the copy ratio and apply trade limits.
 
         Args:
-            _trade_data: Trade data dictionary containing:
-                - market_id: Market identifier
-                - outcome: YES/NO
-                - amount: Original trade amount
-                - price: Entry price (0.0-1.0)
-                - source_trade_id: ID of target user's trade
-                - target_trade_id: Polymarket trade ID
+            _trade_data: Trade data dictionary (stamped with 'decided_at')
 
         Returns:
-            Trade result dictionary or None on failure
+            Copy amount, or None if the trade is below the minimum
         """
         # Calculate actual trade amount based on copy ratio
         original_amount = float(_trade_data.get('amount', 0))
@@ -509,6 +946,32 @@ class CopyBot(BaseBot):
             copy_amount = float(self.max_trade_value)
             self._logger.info("Trade amount capped at maximum: {}".format(copy_amount))
 
+        _trade_data['decided_at'] = time.time()
+        return copy_amount
+
+    async def execute_trade(self, _trade_data):
+        """
+        Execute a copy trade with full wallet balance management.
+
+        Runs every pipeline step inline; the bot loop itself goes through the
+        staged pipeline instead.
+
+        Args:
+            _trade_data: Trade data dictionary containing:
+                - market_id: Market identifier
+                - outcome: YES/NO
+                - amount: Original trade amount
+                - price: Entry price (0.0-1.0)
+                - source_trade_id: ID of target user's trade
+                - target_trade_id: Polymarket trade ID
+
+        Returns:
+            Trade result dictionary or None on failure
+        """
+        copy_amount = self._size_trade(_trade_data)
+        if copy_amount is None:
+            return None
+
         # In paper mode, simulate trade with wallet balance
         if self.is_paper_mode == True:
             return await self._execute_paper_trade(_trade_data, copy_amount)
@@ -527,22 +990,131 @@ class CopyBot(BaseBot):
         Returns:
             Trade result or None
         """
+        if self._reserve_paper_funds(_amount) == False:
+            return None
+
+        trade_record = await self._prepare_trade(_trade_data, _amount)
+        if trade_record is not None:
+            trade_record = await self._simulate_paper_entry(trade_record)
+        if trade_record is None:
+            self._release_paper_funds(_amount)
+            return None
+        return await self._persist_paper_trade(_trade_data, trade_record, _amount)
+
+    async def _simulate_paper_entry(self, _trade_record):
+        """
+        Fill a paper trade against the order book.
+
+        The record's amount and price become what the book would have filled
+        (up to the simulator's slippage limit); without a token or a book the
+        trade fills in full at the target's price, as before.
+
+        Args:
+            _trade_record: Record built by _prepare_trade()
+
+        Returns:
+            Adjusted record, or None if nothing would have filled
+        """
+        token_id = _trade_record.get('token_id')
+        if self._fill_simulator is None or not token_id:
+            return _trade_record
+
         try:
-            # Check wallet balance
-            current_balance = await self._db_manager.get_paper_wallet_balance(self._id)
-            if current_balance is None or current_balance < _amount:
-                self._logger.warning(
-                    "Insufficient paper wallet balance: ${} < ${}".format(
-                        current_balance, _amount
-                    )
-                )
-                return None
+            fill = await self._fill_simulator.simulate_buy(
+                token_id, float(_trade_record['amount']), float(_trade_record['price'])
+            )
+        except Exception as e:
+            self._logger.error("Fill simulation failed, using target's price: {}".format(str(e)))
+            return _trade_record
+
+        if fill is None:
+            return _trade_record
+
+        filled = round(fill['filled'], 2)
+        if filled < 0.01:
+            self._logger.warning("No paper fill for trade {}: no asks within the slippage limit".format(
+                _trade_record['source_trade_id'][:10]
+            ))
+            return None
+
+        if fill['partial'] == True:
+            self._logger.info("Partial paper fill for trade {}: ${} of ${}".format(
+                _trade_record['source_trade_id'][:10], filled, _trade_record['amount']
+            ))
+
+        _trade_record['amount'] = filled
+        _trade_record['price'] = round(fill['price'], 6)
+        _trade_record['entry_slippage'] = round(fill['slippage'], 6) if fill['slippage'] is not None else None
+        return _trade_record
+
+    async def _simulate_paper_exit(self, _trade, _exit_price):
+        """
+        Price a paper exit against the order book.
 
-            # Deduct amount from wallet
-            await self._db_manager.update_paper_wallet_balance(
-                self._id, _amount, 'subtract'
+        Args:
+            _trade: Open trade record
+            _exit_price: Requested exit price
+
+        Returns:
+            Tuple of (exit price, exit slippage); the requested price and None without a book
+        """
+        token_id = _trade.get('token_id')
+        if self._fill_simulator is None or not token_id or _trade.get('is_paper_trade') != True:
+            return (_exit_price, None)
+
+        try:
+            shares = float(_trade['amount']) / float(_trade['price'])
+            fill = await self._fill_simulator.simulate_sell(token_id, shares, _exit_price)
+        except Exception as e:
+            self._logger.error("Exit simulation failed, using requested price: {}".format(str(e)))
+            return (_exit_price, None)
+
+        if fill is None or fill['price'] is None or fill['price'] <= 0:
+            return (_exit_price, None)
+
+        slippage = round(fill['slippage'], 6) if fill['slippage'] is not None else None
+        return (round(min(fill['price'], 1.0), 6), slippage)
+
+    def _reserve_paper_funds(self, _amount):
+        """
+        Hold paper funds in the wallet ledger before a trade is recorded.
+
+        Args:
+            _amount: Calculated trade amount
+
+        Returns:
+            False if the available balance doesn't cover the amount
+        """
+        if self._wallet_ledger is None:
+            return True
+
+        if self._wallet_ledger.reserve(self._id, _amount) == False:
+            self._logger.warning(
+                "Insufficient paper wallet balance: ${} < ${}".format(
+                    self._wallet_ledger.available(self._id), _amount
+                )
             )
+            return False
+        return True
+
+    def _release_paper_funds(self, _amount):
+        """Drop a wallet ledger hold for a trade that was not recorded."""
+        if self._wallet_ledger is not None:
+            self._wallet_ledger.release(self._id, _amount)
 
+    async def _prepare_trade(self, _trade_data, _amount, _is_paper=True):
+        """
+        Build the trade record for a copied trade.
+
+        Args:
+            _trade_data: Trade data dictionary
+            _amount: Calculated trade amount (filled amount for production orders)
+            _is_paper: False for a filled production order
+
+        Returns:
+            Trade record ready to persist, or None
+        """
+        try:
             # Get market name - prioritize the title from activity data
             # The Polymarket activity feed includes the market title like "Bitcoin Up or Down - January 8, 4AM ET"
             market_name = _trade_data.get('market_title')
@@ -550,9 +1122,12 @@ class CopyBot(BaseBot):
 
             # If no title in activity data, try fetching from API
             if not market_name or market_name == 'Unknown Market':
-                if market_id and self._polymarket_client is not None:
+                if market_id and (self._market_cache is not None or self._polymarket_client is not None):
                     try:
-                        market_info = await self._polymarket_client.get_market_info(market_id)
+                        if self._market_cache is not None:
+                            market_info = await self._market_cache.get_market(market_id)
+                        else:
+                            market_info = await self._polymarket_client.get_market_info(market_id)
                         if market_info:
                             # Try to get question, title, or description from market API
                             market_name = (
@@ -567,12 +1142,12 @@ class CopyBot(BaseBot):
             if not market_name:
                 market_name = 'Unknown Market'
 
-            # Record trade in database
-            trade_id = "trade_{}".format(datetime.utcnow().timestamp())
-            trade_record = {
+            # Bots copying the same target trade build their records in the same instant
+            trade_id = "trade_{}_{}".format(datetime.utcnow().timestamp(), uuid.uuid4().hex[:8])
+            return {
                 'trade_id': trade_id,
                 'bot_id': self._id,
-                'is_paper_trade': True,
+                'is_paper_trade': _is_paper,
                 'market_id': market_id,
                 'market_name': market_name,
                 'outcome': _trade_data.get('outcome', ''),
@@ -582,28 +1157,97 @@ class CopyBot(BaseBot):
                 'status': 'open',
                 'source_trade_id': _trade_data.get('source_trade_id', ''),
                 'target_trade_id': _trade_data.get('target_trade_id', ''),
+                'token_id': _trade_data.get('token_id'),
+                'entry_slippage': None,
                 'profit_loss': None,
                 'exit_price': None,
-                'close_value': None
+                'close_value': None,
+                'source_timestamp': self._to_datetime(_trade_data.get('source_timestamp')),
+                'detected_at': self._to_datetime(_trade_data.get('detected_at')),
+                'decided_at': self._to_datetime(_trade_data.get('decided_at')),
+                'submitted_at': self._to_datetime(_trade_data.get('submitted_at')),
+                'acked_at': self._to_datetime(_trade_data.get('acked_at'))
             }
 
-            created_trade = await self._db_manager.record_trade(trade_record)
+        except Exception as e:
+            self._logger.error("Failed to build trade record: {}".format(str(e)))
+            return None
+
+    async def _persist_paper_trade(self, _trade_data, _trade_record, _amount):
+        """
+        Reserve paper funds, record the trade and start tracking it.
+
+        With a wallet ledger the funds are already held in memory; the trade
+        row is inserted alone and the hold is spent once it is recorded.
+
+        Args:
+            _trade_data: Trade data dictionary
+            _trade_record: Record built by _prepare_trade() (amount is what filled)
+            _amount: Calculated trade amount (what was reserved)
+
+        Returns:
+            Trade result or None
+        """
+        ledger = self._wallet_ledger
+        filled = float(_trade_record['amount'])
+        settled = False  # True once the hold has been spent or released
+        try:
+            if ledger is not None and self._trade_writer is not None:
+                # Funds are already held; the row joins other bots' copies of the same trade in one insert
+                created = await self._trade_writer.insert(_trade_record)
+                opened = {
+                    'result': 'opened' if created is not None else 'duplicate',
+                    'balance': None,
+                    'trade': created
+                }
+            else:
+                opened = await self._db_manager.open_paper_trade(_trade_record, _debit_wallet=ledger is None)
+
+            if ledger is not None:
+                if opened['result'] == 'opened':
+                    ledger.commit(self._id, filled)
+                    ledger.release(self._id, _amount - filled)
+                    opened['balance'] = ledger.available(self._id)
+                else:
+                    ledger.release(self._id, _amount)
+            settled = True
+
+            if opened['result'] == 'insufficient_funds':
+                self._logger.warning(
+                    "Insufficient paper wallet balance: ${} < ${}".format(
+                        opened['balance'], filled
+                    )
+                )
+                return None
+
+            if opened['result'] == 'duplicate':
+                self._logger.info("Trade {} already copied".format(_trade_record['source_trade_id'][:10]))
+                return None
+
+            created_trade = opened['trade']
+            self._record_latency(_trade_data, self._to_epoch(created_trade.get('committed_at')))
 
             # Track in active trades
-            self._active_trades[trade_id] = created_trade
+            trade_id = _trade_record['trade_id']
+            self._active_trades.add(created_trade)
+            self._track_market(
+                _trade_record['market_id'], _trade_record.get('outcome'), _trade_record.get('token_id')
+            )
 
             self._logger.info(
                 "PAPER TRADE OPENED: ${} {} @ {} (Balance: ${})".format(
-                    _amount,
+                    filled,
                     _trade_data.get('outcome', ''),
-                    _trade_data.get('price', 0),
-                    current_balance - _amount
+                    _trade_record['price'],
+                    opened['balance']
                 )
             )
 
-            return {'status': 'open', 'trade_id': trade_id, 'amount': _amount}
+            return {'status': 'open', 'trade_id': trade_id, 'amount': filled}
 
         except Exception as e:
+            if settled == False:
+                self._release_paper_funds(_amount)
             self._logger.error("Paper trade execution failed: {}".format(str(e)))
             return None
 
@@ -618,19 +1262,201 @@ class CopyBot(BaseBot):
         Returns:
             Trade result
         """
+        return await asyncio.shield(self._start_production_order(_trade_data, _amount))
+
+    def _start_production_order(self, _trade_data, _amount):
+        """
+        Place a production order and record its fill in a task of its own.
+
+        The task is tracked rather than owned by the caller: once an order is
+        sent, stopping the bot waits for its fill to be recorded instead of
+        cancelling it.
+
+        Args:
+            _trade_data: Trade data dictionary
+            _amount: Calculated trade amount
+
+        Returns:
+            Task resolving to the trade result or None
+        """
+        task = asyncio.create_task(self._place_and_record_order(_trade_data, _amount))
+        self._order_tasks.add(task)
+        task.add_done_callback(self._order_tasks.discard)
+        return task
+
+    async def _place_and_record_order(self, _trade_data, _amount):
+        """Submit a production order, then record whatever filled."""
+        fill = await self._submit_production_order(_trade_data, _amount)
+        if fill is None:
+            return None
+        return await self._persist_production_trade(_trade_data, fill)
+
+    async def _submit_production_order(self, _trade_data, _amount):
+        """
+        Place a production order, merged with other bots' matching orders when aggregating.
+
+        Args:
+            _trade_data: Trade data dictionary (stamped with submit/ack times)
+            _amount: Calculated trade amount
+
+        Returns:
+            This bot's fill (see order_fill()) or None
+        """
         try:
-            result = await self._polymarket_client.place_order(
-                _market_id=_trade_data['market_id'],
-                _outcome=_trade_data['outcome'],
-                _amount=_amount,
-                _price=_trade_data['price']
-            )
-            return result
+            _trade_data['submitted_at'] = time.time()
+            if self._order_aggregator is not None:
+                fill = await self._order_aggregator.submit(
+                    _bot_id=self._id,
+                    _market_id=_trade_data['market_id'],
+                    _outcome=_trade_data['outcome'],
+                    _amount=_amount,
+                    _price=_trade_data['price']
+                )
+            else:
+                response = await self._polymarket_client.place_order(
+                    _market_id=_trade_data['market_id'],
+                    _outcome=_trade_data['outcome'],
+                    _amount=_amount,
+                    _price=_trade_data['price']
+                )
+                if response is None:
+                    return None
+                fill = order_fill(response, _amount, _trade_data['price'])
+                await self._cancel_resting_order(fill)
+
+            _trade_data['acked_at'] = time.time()
+            return fill
 
         except Exception as e:
             self._logger.error("Trade execution failed: {}".format(str(e)))
             return None
 
+    async def _cancel_resting_order(self, _fill):
+        """Cancel an order left resting on the book so it can't fill later without a trade row."""
+        try:
+            if await cancel_resting(self._polymarket_client, _fill) == True:
+                self._logger.info("Cancelled resting order {} ({})".format(_fill['order_id'], _fill['status']))
+        except Exception as e:
+            self._logger.error("Order {} is resting ({}) and could not be cancelled: {}".format(
+                _fill['order_id'], _fill['status'], str(e)
+            ))
+
+    async def _persist_production_trade(self, _trade_data, _fill):
+        """
+        Record the filled part of a production order and start tracking it.
+
+        Args:
+            _trade_data: Trade data dictionary
+            _fill: This bot's fill from _submit_production_order()
+
+        Returns:
+            Trade result or None
+        """
+        if _fill['filled'] <= 0:
+            self._logger.warning("Order {} for trade {} did not fill (status: {})".format(
+                _fill.get('order_id'), _trade_data.get('source_trade_id', '')[:10], _fill.get('status')
+            ))
+            self._record_latency(_trade_data)
+            return None
+
+        if self._db_manager is None:
+            self._record_latency(_trade_data)
+            return _fill
+
+        try:
+            trade_record = await self._prepare_trade(_trade_data, _fill['filled'], _is_paper=False)
+            if trade_record is None:
+                return None
+            trade_record['price'] = _fill['price']
+
+            if self._trade_writer is not None:
+                created_trade = await self._trade_writer.insert(trade_record)
+            else:
+                created_trade = await self._db_manager.record_trade(trade_record)
+
+            if created_trade is None:
+                self._logger.error("Order {} filled but trade {} was already recorded".format(
+                    _fill.get('order_id'), trade_record['source_trade_id'][:10]
+                ))
+                return None
+
+            self._record_latency(_trade_data, self._to_epoch(created_trade.get('committed_at')))
+
+            self._active_trades.add(created_trade)
+            self._track_market(trade_record['market_id'], trade_record.get('outcome'), trade_record.get('token_id'))
+
+            self._logger.info(
+                "PRODUCTION TRADE OPENED: ${:.2f} of ${:.2f} {} @ {:.4f} (order {}, {} bots)".format(
+                    _fill['filled'],
+                    _fill.get('requested', _fill['filled']),
+                    _trade_data.get('outcome', ''),
+                    _fill['price'],
+                    _fill.get('order_id'),
+                    _fill.get('parent_orders', 1)
+                )
+            )
+
+            return {
+                'status': 'open',
+                'trade_id': trade_record['trade_id'],
+                'amount': _fill['filled'],
+                'order_id': _fill.get('order_id')
+            }
+
+        except Exception as e:
+            self._logger.error("Failed to record production trade for order {}: {}".format(
+                _fill.get('order_id'), str(e)
+            ))
+            return None
+
+    def _to_datetime(self, _epoch):
+        """Convert epoch seconds to a naive UTC datetime (None stays None)."""
+        if _epoch is None:
+            return None
+        return datetime.utcfromtimestamp(_epoch)
+
+    def _to_epoch(self, _datetime):
+        """Convert a naive UTC datetime from the database to epoch seconds (None stays None)."""
+        if _datetime is None:
+            return None
+        return _datetime.replace(tzinfo=timezone.utc).timestamp()
+
+    def _record_latency(self, _trade_data, _committed_at=None):
+        """
+        Record stage latencies for a copied trade.
+
+        Args:
+            _trade_data: Trade data carrying epoch timestamps per stage
+            _committed_at: Epoch seconds the trade row was committed (None if not recorded)
+        """
+        timings = dict(_trade_data)
+        timings['committed_at'] = _committed_at
+
+        for name, start_key, end_key in LATENCY_STAGES:
+            start = timings.get(start_key)
+            if name == 'commit' and timings.get('acked_at') is not None:
+                start = timings['acked_at']
+            end = timings.get(end_key)
+            if start is not None and end is not None:
+                self._latency[name].record(max(end - start, 0.0))
+
+        # End to end: target's trade -> copy recorded (or acknowledged when nothing is recorded)
+        finished = _committed_at if _committed_at is not None else timings.get('acked_at')
+        if timings.get('source_timestamp') is not None and finished is not None:
+            self._latency['total'].record(max(finished - timings['source_timestamp'], 0.0))
+
+    def get_latency_stats(self):
+        """
+        Get copy latency percentiles per stage.
+
+        Returns:
+            Dictionary of stage name to LatencyTracker statistics
+        """
+        stats = {}
+        for name, tracker in self._latency.items():
+            stats[name] = tracker.get_stats()
+        return stats
+
     async def close_trade(self, _trade_id, _exit_price):
         """
         Close an open trade and calculate P&L.
@@ -662,20 +1488,6 @@ class CopyBot(BaseBot):
                 )
                 return None
 
-            # Double-check database status for consistency
-            db_trade = await self._db_manager.get_bot_trades(
-                self._id, _limit=1000, _status='open'
-            )
-            trade_exists_in_db = any(t['trade_id'] == _trade_id for t in db_trade)
-
-            if not trade_exists_in_db:
-                self._logger.error(
-                    "Trade {} is in active_trades but not found as open in database. "
-                    "Removing from active_trades to maintain consistency.".format(_trade_id)
-                )
-                del self._active_trades[_trade_id]
-                return None
-
             # Validate exit price (must be between 0.0 and 1.0 for prediction markets)
             if _exit_price <= 0.0 or _exit_price > 1.0:
                 self._logger.error(
@@ -685,45 +1497,47 @@ class CopyBot(BaseBot):
                 )
                 return None
 
-            # Calculate P&L
-            entry_price = float(trade['price'])
-            amount = float(trade['amount'])
-
-            # P&L = amount * (exit_price - entry_price)
+            # Close, credit the wallet and update performance in one statement.
+            # P&L = amount * (exit_price - entry_price) / entry_price
             # If you bought YES at 0.60 for $100, you get 100/0.60 = 166.67 shares
             # If price goes to 0.70, shares are worth 166.67 * 0.70 = $116.67
             # Profit = $116.67 - $100 = $16.67
-            shares = amount / entry_price
-            exit_value = shares * _exit_price
-            profit_loss = exit_value - amount
-
-            # Update trade in database
-            update_data = {
-                'status': 'closed',
-                'closed_at': datetime.utcnow(),
-                'exit_price': _exit_price,
-                'close_value': exit_value,
-                'profit_loss': profit_loss
-            }
+            # Paper exits are priced against the order book's bids when available
+            exit_price, exit_slippage = await self._simulate_paper_exit(trade, _exit_price)
 
-            closed_trade = await self._db_manager.update_trade(_trade_id, update_data)
+            ledger = self._wallet_ledger
+            closed_trade = await self._db_manager.close_trade(
+                _trade_id, self._id, exit_price, _credit_wallet=ledger is None, _exit_slippage=exit_slippage
+            )
+
+            # Remove from active trades
+            self._active_trades.remove(_trade_id)
+            self._untrack_market(trade.get('market_id', ''), trade.get('outcome'), trade.get('token_id'))
 
-            # Return funds to wallet (original amount + profit/loss)
-            total_return = amount + profit_loss
-            if total_return > 0:
-                await self._db_manager.update_paper_wallet_balance(
-                    self._id, total_return, 'add'
+            if closed_trade is None:
+                self._logger.error(
+                    "Trade {} is in active_trades but not found as open in database. "
+                    "Removing from active_trades to maintain consistency.".format(_trade_id)
                 )
+                return None
 
-            # Update bot performance
-            await self._db_manager.update_bot_performance(self._id)
+            profit_loss = float(closed_trade['profit_loss'])
 
-            # Remove from active trades
-            del self._active_trades[_trade_id]
+            # The ledger credits the wallet and writes it out with the next flush
+            if ledger is not None and closed_trade.get('is_paper_trade') == True:
+                close_value = float(closed_trade.get('close_value') or 0)
+                if close_value > 0:
+                    ledger.credit(self._id, close_value)
+                closed_trade['paper_wallet_balance'] = ledger.balance(self._id)
+
+            # Re-check the daily loss limit now rather than on the next tick
+            if profit_loss < 0:
+                self._daily_losses.record(profit_loss)
+                self._risk_event.set()
 
             self._logger.info(
                 "TRADE CLOSED: {} - P&L: ${:.2f} (Entry: {} Exit: {})".format(
-                    _trade_id, profit_loss, entry_price, _exit_price
+                    _trade_id, profit_loss, trade['price'], exit_price
                 )
             )
 
@@ -0,0 +1,150 @@
+"""
+Paper fill simulator for BotForm2.
+
+Prices paper trades against the outcome token's CLOB order book instead of
+assuming the whole amount fills at the target's price. Entries walk the
+asks up to a slippage limit (the rest of the order goes unfilled); exits
+walk the bids. Books come from the shared order book cache, so every bot
+prices against the same current book.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+from typing import Optional, Dict, List
+
+from ..utils.metrics import LatencyTracker
+
+
+class FillSimulator:
+    """Simulates paper entries and exits against cached order books."""
+
+    def __init__(self, _order_book_cache, _max_slippage=0.05):
+        """
+        Initialize fill simulator.
+
+        Args:
+            _order_book_cache: OrderBookCache instance
+            _max_slippage: Highest entry price as a fraction above the target's price (None for no limit)
+        """
+        self._order_book_cache = _order_book_cache
+        self._max_slippage = _max_slippage
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._simulations = 0
+        self._no_book = 0
+        self._partial_fills = 0
+        self._unfilled = 0
+        self._entry_slippage = LatencyTracker()  # fractions, not seconds
+        self._exit_slippage = LatencyTracker()
+
+    async def get_book(self, _token_id):
+        """
+        Get a token's current book.
+
+        Args:
+            _token_id: Outcome token ID
+
+        Returns:
+            OrderBook, or None if no current book could be fetched
+        """
+        return await self._order_book_cache.get_book(_token_id)
+
+    async def simulate_buy(self, _token_id, _amount, _reference_price):
+        """
+        Simulate a paper entry.
+
+        Args:
+            _token_id: Outcome token ID
+            _amount: Dollars to spend
+            _reference_price: Target's fill price
+
+        Returns:
+            Fill dictionary (see OrderBook.simulate_buy()), or None if there is no book
+        """
+        book = await self.get_book(_token_id)
+        if book is None:
+            self._no_book = self._no_book + 1
+            return None
+
+        limit_price = None
+        if self._max_slippage is not None:
+            limit_price = min(_reference_price * (1 + self._max_slippage), 1.0)
+
+        fill = book.simulate_buy(_amount, _reference_price, _limit_price=limit_price)
+        self._count(fill, self._entry_slippage)
+        return fill
+
+    async def simulate_sell(self, _token_id, _shares, _reference_price):
+        """
+        Simulate a paper exit.
+
+        A position is closed in full: if the visible bids run out, the rest
+        is priced at the last bid reached.
+
+        Args:
+            _token_id: Outcome token ID
+            _shares: Shares to sell
+            _reference_price: Requested exit price
+
+        Returns:
+            Fill dictionary (see OrderBook.simulate_sell()), or None if there is no book or no bids
+        """
+        book = await self.get_book(_token_id)
+        if book is None:
+            self._no_book = self._no_book + 1
+            return None
+
+        fill = book.simulate_sell(_shares, _reference_price)
+        if fill['shares'] <= 0:
+            self._no_book = self._no_book + 1
+            return None
+
+        if fill['partial'] == True:
+            self._partial_fills = self._partial_fills + 1
+            last_bid = book.bids[fill['levels'] - 1][0]
+            remaining = float(_shares) - fill['shares']
+            fill['filled'] = fill['filled'] + remaining * last_bid
+            fill['shares'] = float(_shares)
+            fill['price'] = fill['filled'] / fill['shares']
+            fill['slippage'] = (_reference_price - fill['price']) / _reference_price if _reference_price else None
+
+        self._simulations = self._simulations + 1
+        if fill['slippage'] is not None:
+            self._exit_slippage.record(fill['slippage'])
+        return fill
+
+    def _count(self, _fill, _tracker):
+        """Update counters for one entry simulation."""
+        self._simulations = self._simulations + 1
+        if _fill['shares'] <= 0:
+            self._unfilled = self._unfilled + 1
+            return
+        if _fill['partial'] == True:
+            self._partial_fills = self._partial_fills + 1
+        if _fill['slippage'] is not None:
+            _tracker.record(_fill['slippage'])
+
+    def get_stats(self):
+        """
+        Get simulator statistics.
+
+        Returns:
+            Dictionary of fill counters and slippage percentiles (in basis points)
+        """
+        return {
+            'simulations': self._simulations,
+            'no_book': self._no_book,
+            'partial_fills': self._partial_fills,
+            'unfilled': self._unfilled,
+            'entry_slippage_bps': self._slippage_stats(self._entry_slippage),
+            'exit_slippage_bps': self._slippage_stats(self._exit_slippage)
+        }
+
+    def _slippage_stats(self, _tracker):
+        """Slippage percentiles in basis points."""
+        stats = {'count': _tracker.count}
+        for percentile in [50, 95]:
+            value = _tracker.percentile(percentile)
+            stats['p{}'.format(percentile)] = round(value * 10000, 1) if value is not None else None
+        return stats
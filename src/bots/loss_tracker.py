@@ -0,0 +1,136 @@
+"""
+Rolling loss tracker for BotForm2.
+
+Keeps a bot's realized losses in per-minute buckets over a sliding
+window (24 hours by default), so the daily loss limit can be checked
+without querying the database. Seeded once from an aggregate query and
+updated as trades close.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Optional, Dict, List
+
+
+class LossTracker:
+    """Sliding-window sum of realized losses, bucketed by minute."""
+
+    def __init__(self, _window=86400, _bucket_size=60):
+        """
+        Initialize loss tracker.
+
+        Args:
+            _window: Window length in seconds
+            _bucket_size: Bucket width in seconds
+        """
+        self._window = _window
+        self._bucket_size = _bucket_size
+
+        self._buckets = deque()  # [bucket_start_epoch, loss, count], oldest first
+        self._total_loss = 0.0
+        self._loss_count = 0
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def window(self):
+        """Get window length in seconds."""
+        return self._window
+
+    def seed(self, _buckets):
+        """
+        Replace the window contents with pre-aggregated buckets.
+
+        Args:
+            _buckets: List of (bucket_start_epoch, loss, count) tuples, oldest first
+
+        Returns:
+            Self for chaining
+        """
+        self._buckets = deque()
+        self._total_loss = 0.0
+        self._loss_count = 0
+
+        for bucket_start, loss, count in _buckets:
+            self._buckets.append([float(bucket_start), float(loss), int(count)])
+            self._total_loss = self._total_loss + float(loss)
+            self._loss_count = self._loss_count + int(count)
+
+        self._expire(time.time())
+        return self
+
+    def record(self, _profit_loss, _at=None):
+        """
+        Record a closed trade's result (gains are ignored).
+
+        Args:
+            _profit_loss: Realized P&L of the trade
+            _at: Close time as epoch seconds (defaults to now)
+
+        Returns:
+            Self for chaining
+        """
+        if _profit_loss is None or _profit_loss >= 0:
+            return self
+
+        at = time.time() if _at is None else _at
+        bucket_start = at - at % self._bucket_size
+        loss = abs(float(_profit_loss))
+
+        if len(self._buckets) > 0 and self._buckets[-1][0] == bucket_start:
+            self._buckets[-1][1] = self._buckets[-1][1] + loss
+            self._buckets[-1][2] = self._buckets[-1][2] + 1
+        else:
+            self._buckets.append([bucket_start, loss, 1])
+
+        self._total_loss = self._total_loss + loss
+        self._loss_count = self._loss_count + 1
+        return self
+
+    def _expire(self, _now):
+        """Drop buckets that have left the window."""
+        cutoff = _now - self._window
+        while len(self._buckets) > 0 and self._buckets[0][0] + self._bucket_size <= cutoff:
+            bucket_start, loss, count = self._buckets.popleft()
+            self._total_loss = self._total_loss - loss
+            self._loss_count = self._loss_count - count
+
+        if len(self._buckets) == 0:
+            self._total_loss = 0.0
+            self._loss_count = 0
+
+    def total_loss(self):
+        """
+        Get realized losses within the window.
+
+        Returns:
+            Sum of losses as a positive float
+        """
+        self._expire(time.time())
+        return max(self._total_loss, 0.0)
+
+    def loss_count(self):
+        """
+        Get number of losing trades within the window.
+
+        Returns:
+            Count of losing trades
+        """
+        self._expire(time.time())
+        return self._loss_count
+
+    def get_stats(self):
+        """
+        Get tracker statistics.
+
+        Returns:
+            Dictionary of window total, losing trades and bucket count
+        """
+        self._expire(time.time())
+        return {
+            'window': self._window,
+            'total_loss': round(max(self._total_loss, 0.0), 2),
+            'losing_trades': self._loss_count,
+            'buckets': len(self._buckets)
+        }
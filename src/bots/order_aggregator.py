@@ -0,0 +1,322 @@
+"""
+Order aggregator for BotForm2.
+
+Production bots following the same trader all want the same order at the
+same moment. Orders for the same market, outcome, side and limit price
+that arrive within a short window are merged into one parent order; its
+fill is then split back across the bots in proportion to what each asked
+for. One round trip replaces N, and the bots no longer compete with each
+other in the book.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+import time
+from typing import Optional, Dict, List
+
+from ..utils.metrics import LatencyTracker
+
+
+# Order statuses that mean nothing has filled yet
+UNFILLED_STATUSES = ('live', 'unmatched', 'delayed')
+
+
+def order_fill(_response, _amount, _price):
+    """
+    Work out how much of an order filled from its response.
+
+    Uses makingAmount/takingAmount (dollars spent / shares received) when
+    the response has them; otherwise a matched (or status-less) response
+    counts as a full fill at the limit price.
+
+    Args:
+        _response: Response from place_order()
+        _amount: Amount ordered in dollars
+        _price: Limit price
+
+    Returns:
+        Dictionary with order_id, status, filled (dollars), price (average fill price) and shares
+    """
+    response = _response if isinstance(_response, dict) else {}
+    status = str(response.get('status') or '').lower()
+    amount = float(_amount)
+    price = float(_price)
+
+    making = response.get('makingAmount')
+    taking = response.get('takingAmount')
+    try:
+        if making is not None and making != '':
+            filled = min(float(making), amount)
+            if taking is not None and taking != '' and float(taking) > 0 and filled > 0:
+                price = float(making) / float(taking)
+        elif status in UNFILLED_STATUSES:
+            filled = 0.0
+        else:
+            filled = amount
+    except (TypeError, ValueError):
+        filled = 0.0 if status in UNFILLED_STATUSES else amount
+
+    return {
+        'order_id': response.get('orderID') or response.get('order_id') or response.get('id'),
+        'status': status or 'matched',
+        'filled': filled,
+        'price': price,
+        'shares': filled / price if price > 0 else 0.0
+    }
+
+
+async def cancel_resting(_polymarket_client, _fill):
+    """
+    Cancel the unfilled rest of an order that was left resting on the book.
+
+    A 'live' or 'delayed' order would otherwise fill later with no trade
+    row behind it.
+
+    Args:
+        _polymarket_client: Polymarket API client instance
+        _fill: Fill from order_fill()
+
+    Returns:
+        True if a cancel was sent, False if nothing was resting
+
+    Raises:
+        Whatever cancel_order() raises
+    """
+    if _fill['status'] not in UNFILLED_STATUSES or not _fill['order_id']:
+        return False
+
+    await _polymarket_client.cancel_order(_fill['order_id'])
+    return True
+
+
+class OrderAggregator:
+    """Merges matching orders from many bots into parent orders and splits the fills."""
+
+    def __init__(self, _polymarket_client, _window=0.05, _max_orders=50):
+        """
+        Initialize order aggregator.
+
+        Args:
+            _polymarket_client: Polymarket API client instance
+            _window: Seconds an order waits for matching orders from other bots (0 places it directly)
+            _max_orders: Largest number of bot orders merged into one parent
+        """
+        self._polymarket_client = _polymarket_client
+        self._window = _window
+        self._max_orders = max(int(_max_orders), 1)
+
+        self._groups = {}  # (market_id, outcome, side, price) -> list of child orders
+        self._timers = {}  # group key -> task placing the group when its window ends
+        self._placing = set()  # parent orders in flight
+        self._running = False
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._parent_orders = 0
+        self._child_orders = 0
+        self._merged_orders = 0
+        self._largest_group = 0
+        self._requested = 0.0
+        self._filled = 0.0
+        self._errors = 0
+        self._orphaned = 0
+        self._cancelled = 0
+        self._resting = {}  # order_id -> status, for resting orders that could not be cancelled
+        self._place_latency = LatencyTracker()
+
+    async def start(self):
+        """
+        Start accepting orders for aggregation.
+
+        Returns:
+            Self for chaining
+        """
+        self._running = True
+        return self
+
+    async def stop(self):
+        """Place every open group now and wait for parent orders in flight."""
+        self._running = False
+
+        for key in list(self._groups.keys()):
+            group = self._take_group(key, _cancel_timer=True)
+            self._spawn(key, group)
+
+        if len(self._placing) > 0:
+            await asyncio.gather(*list(self._placing), return_exceptions=True)
+
+    async def submit(self, _bot_id, _market_id, _outcome, _amount, _price, _side='BUY'):
+        """
+        Submit a bot's order, merged with matching orders from other bots.
+
+        Args:
+            _bot_id: Bot identifier
+            _market_id: Market identifier
+            _outcome: Outcome to trade
+            _amount: Amount in dollars
+            _price: Limit price
+            _side: 'BUY' or 'SELL'
+
+        Returns:
+            This bot's share of the fill: order_fill() fields plus requested,
+            parent_amount and parent_orders (bots in the parent order)
+        """
+        if self._running == False or self._window <= 0:
+            response = await self._polymarket_client.place_order(
+                _market_id=_market_id, _outcome=_outcome, _amount=_amount, _price=_price, _side=_side
+            )
+            fill = order_fill(response, _amount, _price)
+            await self._cancel_resting(fill)
+            fill['requested'] = float(_amount)
+            fill['parent_amount'] = float(_amount)
+            fill['parent_orders'] = 1
+            return fill
+
+        key = (_market_id, _outcome, _side, round(float(_price), 4))
+        future = asyncio.get_running_loop().create_future()
+
+        group = self._groups.get(key)
+        if group is None:
+            group = []
+            self._groups[key] = group
+            self._timers[key] = asyncio.create_task(self._place_after_window(key))
+
+        child = {'bot_id': _bot_id, 'amount': float(_amount), 'future': future}
+        group.append(child)
+
+        # Full groups go out without waiting for the window
+        if len(group) >= self._max_orders:
+            self._spawn(key, self._take_group(key, _cancel_timer=True))
+
+        # The parent order goes out whether or not this caller keeps waiting
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            child['abandoned'] = True
+            raise
+
+    def _take_group(self, _key, _cancel_timer=False):
+        """Remove a group from the open set."""
+        group = self._groups.pop(_key, [])
+        timer = self._timers.pop(_key, None)
+        if _cancel_timer == True and timer is not None:
+            timer.cancel()
+        return group
+
+    def _spawn(self, _key, _group):
+        """Place a group in the background, tracking the task until it finishes."""
+        if len(_group) == 0:
+            return
+        task = asyncio.create_task(self._place_group(_key, _group))
+        self._placing.add(task)
+        task.add_done_callback(self._placing.discard)
+
+    async def _place_after_window(self, _key):
+        """Place a group once its window has passed."""
+        await asyncio.sleep(self._window)
+        self._spawn(_key, self._take_group(_key))
+
+    async def _place_group(self, _key, _group):
+        """
+        Place one parent order for a group and hand each bot its share.
+
+        Args:
+            _key: (market_id, outcome, side, price) group key
+            _group: List of child orders (bot_id, amount, future)
+        """
+        market_id, outcome, side, price = _key
+        total = sum([child['amount'] for child in _group])
+
+        self._parent_orders = self._parent_orders + 1
+        self._child_orders = self._child_orders + len(_group)
+        if len(_group) > 1:
+            self._merged_orders = self._merged_orders + len(_group)
+        self._largest_group = max(self._largest_group, len(_group))
+        self._requested = self._requested + total
+
+        started = time.monotonic()
+        try:
+            response = await self._polymarket_client.place_order(
+                _market_id=market_id, _outcome=outcome, _amount=round(total, 2), _price=price, _side=side
+            )
+        except Exception as e:
+            self._errors = self._errors + 1
+            for child in _group:
+                if child['future'].done() == False:
+                    child['future'].set_exception(e)
+            return
+
+        self._place_latency.record(time.monotonic() - started)
+        fill = order_fill(response, total, price)
+        self._filled = self._filled + fill['filled']
+        await self._cancel_resting(fill)
+
+        if len(_group) > 1:
+            self._logger.info("Parent order {} for {} bots: ${:.2f} requested, ${:.2f} filled".format(
+                fill['order_id'], len(_group), total, fill['filled']
+            ))
+
+        # Pro rata by requested amount; the last bot takes the rounding remainder
+        allocated = 0.0
+        i = 0
+        for child in _group:
+            if i == len(_group) - 1:
+                filled = round(fill['filled'] - allocated, 2)
+            else:
+                filled = round(fill['filled'] * child['amount'] / total, 2) if total > 0 else 0.0
+            allocated = allocated + filled
+
+            share = {
+                'order_id': fill['order_id'],
+                'status': fill['status'],
+                'requested': child['amount'],
+                'filled': max(filled, 0.0),
+                'price': fill['price'],
+                'shares': max(filled, 0.0) / fill['price'] if fill['price'] > 0 else 0.0,
+                'parent_amount': total,
+                'parent_orders': len(_group)
+            }
+
+            if child['future'].done() == False:
+                child['future'].set_result(share)
+            if child.get('abandoned') == True and share['filled'] > 0:
+                # The caller was cancelled without handing the wait to anyone; its fill has no trade row
+                self._orphaned = self._orphaned + 1
+                self._logger.warning("Bot {} left before its ${:.2f} share of order {} was recorded".format(
+                    child['bot_id'], share['filled'], fill['order_id']
+                ))
+            i = i + 1
+
+    async def _cancel_resting(self, _fill):
+        """Cancel a parent order left resting on the book, remembering it if the cancel fails."""
+        try:
+            if await cancel_resting(self._polymarket_client, _fill) == True:
+                self._cancelled = self._cancelled + 1
+                self._logger.info("Cancelled resting order {} ({})".format(_fill['order_id'], _fill['status']))
+        except Exception as e:
+            self._resting[_fill['order_id']] = _fill['status']
+            self._logger.error("Order {} is resting ({}) and could not be cancelled: {}".format(
+                _fill['order_id'], _fill['status'], str(e)
+            ))
+
+    def get_stats(self):
+        """
+        Get aggregator statistics.
+
+        Returns:
+            Dictionary of order counters, fill ratio and placement latency
+        """
+        return {
+            'open_groups': len(self._groups),
+            'parent_orders': self._parent_orders,
+            'child_orders': self._child_orders,
+            'merged_orders': self._merged_orders,
+            'largest_group': self._largest_group,
+            'fill_ratio': round(self._filled / self._requested, 4) if self._requested > 0 else None,
+            'errors': self._errors,
+            'orphaned_fills': self._orphaned,
+            'cancelled_resting': self._cancelled,
+            'uncancelled_resting': sorted(self._resting.keys()),
+            'place_latency': self._place_latency.get_stats()
+        }
@@ -0,0 +1,214 @@
+"""
+Adaptive polling schedule for BotForm2.
+
+Learns how often each target trades (an exponentially weighted average of
+the gaps between their trades) and picks a poll interval between the
+configured bounds: busy traders are polled fast, quiet ones slowly. A
+target drops to the minimum interval right after new activity, and while
+one of its copied positions is in a market close to its end time.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Optional, Dict, List
+
+
+class PollScheduler:
+    """Per-target poll intervals driven by observed trading frequency."""
+
+    def __init__(self, _min_interval=2.0, _max_interval=60.0, _base_interval=5.0, _smoothing=0.3,
+                 _gap_fraction=0.1, _burst_window=60.0, _end_time_window=900.0, _market_cache=None):
+        """
+        Initialize poll scheduler.
+
+        Args:
+            _min_interval: Fastest poll interval in seconds
+            _max_interval: Slowest poll interval in seconds
+            _base_interval: Interval used before anything is known about a target
+            _smoothing: Weight of the newest gap in the moving average (0-1)
+            _gap_fraction: Poll interval as a fraction of the expected gap between trades
+            _burst_window: Seconds after detected activity during which the target is polled at the minimum
+            _end_time_window: Seconds before a held market's end time during which the target is polled at the minimum
+            _market_cache: Shared MarketCache used to look up market end times
+        """
+        self._min_interval = float(_min_interval)
+        self._max_interval = float(max(_max_interval, _min_interval))
+        self._base_interval = min(max(float(_base_interval), self._min_interval), self._max_interval)
+        self._smoothing = _smoothing
+        self._gap_fraction = _gap_fraction
+        self._burst_window = _burst_window
+        self._end_time_window = _end_time_window
+        self._market_cache = _market_cache
+
+        self._targets = {}
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def min_interval(self):
+        """Get fastest poll interval in seconds."""
+        return self._min_interval
+
+    @property
+    def max_interval(self):
+        """Get slowest poll interval in seconds."""
+        return self._max_interval
+
+    def _get_state(self, _key):
+        """Get (or create) scheduling state for a target key."""
+        state = self._targets.get(_key)
+        if state is None:
+            state = {
+                'ewma_gap': None,
+                'last_trade_timestamp': None,
+                'last_detected': None,
+                'markets': {}
+            }
+            self._targets[_key] = state
+        return state
+
+    def remove_target(self, _key):
+        """
+        Forget a target's schedule.
+
+        Args:
+            _key: Normalized target address
+        """
+        self._targets.pop(_key, None)
+
+    def record_activities(self, _key, _activities, _detected=True):
+        """
+        Update a target's trading rate from newly seen activities.
+
+        Args:
+            _key: Normalized target address
+            _activities: New Activity records (any order)
+            _detected: False for the initial history window (learn the rate without a burst)
+        """
+        state = self._get_state(_key)
+
+        timestamps = sorted([
+            activity.timestamp for activity in _activities
+            if activity.timestamp is not None and activity.timestamp > 0
+        ])
+
+        previous = state['last_trade_timestamp']
+        for timestamp in timestamps:
+            if previous is not None and timestamp > previous:
+                gap = float(timestamp - previous)
+                if state['ewma_gap'] is None:
+                    state['ewma_gap'] = gap
+                else:
+                    state['ewma_gap'] = self._smoothing * gap + (1 - self._smoothing) * state['ewma_gap']
+            if previous is None or timestamp > previous:
+                previous = timestamp
+        state['last_trade_timestamp'] = previous
+
+        if _detected == True and len(_activities) > 0:
+            state['last_detected'] = time.monotonic()
+
+    def track_market(self, _key, _market_id):
+        """
+        Register a copied position's market for a target.
+
+        Args:
+            _key: Normalized target address
+            _market_id: Market/condition ID
+        """
+        markets = self._get_state(_key)['markets']
+        markets[_market_id] = markets.get(_market_id, 0) + 1
+
+    def untrack_market(self, _key, _market_id):
+        """
+        Release a copied position's market for a target.
+
+        Args:
+            _key: Normalized target address
+            _market_id: Market/condition ID
+        """
+        state = self._targets.get(_key)
+        if state is None:
+            return
+
+        count = state['markets'].get(_market_id, 0)
+        if count <= 1:
+            state['markets'].pop(_market_id, None)
+        else:
+            state['markets'][_market_id] = count - 1
+
+    def is_market_ending(self, _market_id):
+        """
+        Check if a market ends within the end-time window.
+
+        Args:
+            _market_id: Market/condition ID
+
+        Returns:
+            True if the market's end time (from the cache) is close and not yet past
+        """
+        if self._market_cache is None:
+            return False
+
+        end_date = self._market_cache.get_end_date(_market_id)
+        if end_date is None:
+            return False
+
+        remaining = (end_date - datetime.utcnow()).total_seconds()
+        # Markets that have already ended no longer need fast polling
+        return True if 0 <= remaining <= self._end_time_window else False
+
+    def next_interval(self, _key):
+        """
+        Get the number of seconds to wait before polling a target again.
+
+        Args:
+            _key: Normalized target address
+
+        Returns:
+            Poll interval in seconds
+        """
+        state = self._targets.get(_key)
+        if state is None:
+            return self._base_interval
+
+        # Just saw activity: follow-up trades (and exits) tend to come in bursts
+        if state['last_detected'] is not None and time.monotonic() - state['last_detected'] < self._burst_window:
+            return self._min_interval
+
+        # A copied position is about to resolve: the target's exit matters now
+        for market_id in state['markets'].keys():
+            if self.is_market_ending(market_id) == True:
+                return self._min_interval
+
+        if state['ewma_gap'] is None:
+            return self._base_interval
+
+        # Expected gap, stretched by how long the target has already been quiet
+        expected_gap = state['ewma_gap']
+        if state['last_trade_timestamp'] is not None:
+            expected_gap = max(expected_gap, time.time() - state['last_trade_timestamp'])
+
+        interval = expected_gap * self._gap_fraction
+        return min(max(interval, self._min_interval), self._max_interval)
+
+    def get_stats(self, _key):
+        """
+        Get scheduling statistics for a target.
+
+        Args:
+            _key: Normalized target address
+
+        Returns:
+            Dictionary of learned rate and current interval
+        """
+        state = self._targets.get(_key)
+        if state is None:
+            return None
+
+        return {
+            'ewma_gap': round(state['ewma_gap'], 1) if state['ewma_gap'] is not None else None,
+            'last_trade_timestamp': state['last_trade_timestamp'],
+            'held_markets': len(state['markets']),
+            'next_interval': round(self.next_interval(_key), 2)
+        }
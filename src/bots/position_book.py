@@ -0,0 +1,207 @@
+"""
+Position book for BotForm2.
+
+Holds a bot's open copied trades indexed by (market_id, outcome), with
+opening times parsed once into epoch seconds. Target SELLs are applied as
+they arrive and only touch the trades in their market/outcome; matched
+trades wait as pending exits until the monitor closes them.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Optional, Dict, List
+
+
+class PositionBook:
+    """Open trades indexed by market/outcome, with pending exits from target SELLs."""
+
+    def __init__(self, _min_hold=30):
+        """
+        Initialize position book.
+
+        Args:
+            _min_hold: Seconds a trade must have been open before a target SELL closes it
+        """
+        self._min_hold = _min_hold
+
+        self._trades = {}  # trade_id -> trade record
+        self._opened = {}  # trade_id -> opened_at as epoch seconds
+        self._by_key = {}  # (market_id, outcome) -> set of trade_ids
+        self._exits = {}  # trade_id -> (exit_price, sell_timestamp)
+        self._logger = logging.getLogger(__name__)
+
+    def __len__(self):
+        """Get number of open trades."""
+        return len(self._trades)
+
+    def __contains__(self, _trade_id):
+        """Check if a trade is open in the book."""
+        return _trade_id in self._trades
+
+    def get(self, _trade_id):
+        """
+        Get an open trade.
+
+        Args:
+            _trade_id: Trade identifier
+
+        Returns:
+            Trade record or None
+        """
+        return self._trades.get(_trade_id)
+
+    def trades(self):
+        """
+        Get every open trade.
+
+        Returns:
+            List of (trade_id, trade) tuples
+        """
+        return list(self._trades.items())
+
+    def opened_at(self, _trade_id):
+        """
+        Get a trade's opening time.
+
+        Args:
+            _trade_id: Trade identifier
+
+        Returns:
+            Epoch seconds, or None if the trade isn't in the book
+        """
+        return self._opened.get(_trade_id)
+
+    def add(self, _trade):
+        """
+        Add an open trade.
+
+        Args:
+            _trade: Trade record (needs trade_id, market_id, outcome, opened_at)
+
+        Returns:
+            Self for chaining
+        """
+        trade_id = _trade.get('trade_id')
+        if trade_id in self._trades:
+            self.remove(trade_id)
+
+        key = (_trade.get('market_id', ''), _trade.get('outcome', ''))
+        self._trades[trade_id] = _trade
+        self._opened[trade_id] = self._to_epoch(_trade.get('opened_at'))
+        if key not in self._by_key:
+            self._by_key[key] = set()
+        self._by_key[key].add(trade_id)
+        return self
+
+    def remove(self, _trade_id):
+        """
+        Remove a trade (closed or no longer open).
+
+        Args:
+            _trade_id: Trade identifier
+
+        Returns:
+            Removed trade record or None
+        """
+        trade = self._trades.pop(_trade_id, None)
+        self._opened.pop(_trade_id, None)
+        self._exits.pop(_trade_id, None)
+        if trade is None:
+            return None
+
+        key = (trade.get('market_id', ''), trade.get('outcome', ''))
+        trade_ids = self._by_key.get(key)
+        if trade_ids is not None:
+            trade_ids.discard(_trade_id)
+            if len(trade_ids) == 0:
+                del self._by_key[key]
+        return trade
+
+    def apply_sell(self, _activity):
+        """
+        Apply a target SELL to the trades in its market/outcome.
+
+        A trade is marked for exit when the SELL happened more than the
+        minimum hold after the trade opened; the latest SELL sets the exit price.
+
+        Args:
+            _activity: SELL Activity from the target
+
+        Returns:
+            List of trade IDs newly marked for exit
+        """
+        trade_ids = self._by_key.get((_activity.condition_id, _activity.outcome))
+        if trade_ids is None:
+            return []
+
+        sell_timestamp = _activity.timestamp or 0
+        marked = []
+        for trade_id in trade_ids:
+            if sell_timestamp <= self._opened[trade_id] + self._min_hold:
+                continue
+
+            previous = self._exits.get(trade_id)
+            if previous is None:
+                marked.append(trade_id)
+            if previous is None or sell_timestamp >= previous[1]:
+                self._exits[trade_id] = (_activity.price, sell_timestamp)
+
+        return marked
+
+    def is_exiting(self, _trade_id):
+        """Check if a trade is waiting to be closed."""
+        return True if _trade_id in self._exits else False
+
+    def mark_exit(self, _trade_id, _exit_price):
+        """
+        Mark a trade for exit directly (e.g. to retry a failed close).
+
+        Args:
+            _trade_id: Trade identifier
+            _exit_price: Exit price
+
+        Returns:
+            Self for chaining
+        """
+        if _trade_id in self._trades:
+            previous = self._exits.get(_trade_id)
+            self._exits[_trade_id] = (_exit_price, previous[1] if previous is not None else 0)
+        return self
+
+    def take_exits(self):
+        """
+        Take every pending exit.
+
+        Returns:
+            List of (trade_id, exit_price) tuples
+        """
+        exits = [(trade_id, exit[0]) for trade_id, exit in self._exits.items()]
+        self._exits = {}
+        return exits
+
+    def _to_epoch(self, _opened_at):
+        """Convert an opening time (naive UTC datetime or ISO string) to epoch seconds."""
+        if _opened_at is None:
+            return datetime.utcnow().replace(tzinfo=timezone.utc).timestamp()
+
+        if isinstance(_opened_at, str):
+            from dateutil import parser
+            _opened_at = parser.parse(_opened_at)
+
+        if _opened_at.tzinfo is None:
+            _opened_at = _opened_at.replace(tzinfo=timezone.utc)
+        return _opened_at.timestamp()
+
+    def get_stats(self):
+        """
+        Get book statistics.
+
+        Returns:
+            Dictionary of open trades, indexed markets and pending exits
+        """
+        return {
+            'open_trades': len(self._trades),
+            'markets': len(self._by_key),
+            'pending_exits': len(self._exits)
+        }
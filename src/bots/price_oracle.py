@@ -0,0 +1,303 @@
+"""
+Shared price oracle for BotForm2.
+
+One place for every bot to get current outcome prices. Lookups are grouped
+per market (a single /trades fetch prices every outcome of a market),
+concurrent lookups share one fetch, and prices are cached with a staleness
+bound. Markets held by any bot are refreshed together in the background.
+Outcomes whose token is held are priced from the order book cache first
+(book midpoint while the spread is tight), so exits react to the current
+book instead of the last print.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+import time
+from typing import Optional, Dict, List
+
+
+class PriceOracle:
+    """Batched, deduplicated and cached last-trade prices per (market, outcome)."""
+
+    def __init__(self, _polymarket_client=None, _activity_feed=None, _max_age=10.0, _refresh_interval=5.0,
+                 _trade_window=20, _order_book_cache=None, _max_spread=0.10):
+        """
+        Initialize price oracle.
+
+        Args:
+            _polymarket_client: Polymarket API client instance
+            _activity_feed: Shared ActivityFeed; its streamed prices are used first when fresh
+            _max_age: Seconds a cached price is served before it is refetched
+            _refresh_interval: Seconds between background refreshes of held markets
+            _trade_window: Recent market trades fetched per lookup (covers all outcomes)
+            _order_book_cache: Shared OrderBookCache; held outcomes are priced from their book first
+            _max_spread: Widest spread at which the book midpoint is trusted as the price
+        """
+        self._polymarket_client = _polymarket_client
+        self._activity_feed = _activity_feed
+        self._max_age = _max_age
+        self._refresh_interval = _refresh_interval
+        self._trade_window = _trade_window
+        self._order_book_cache = _order_book_cache
+        self._max_spread = _max_spread
+
+        self._prices = {}  # (market_id, outcome) -> (price, monotonic time)
+        self._fetched_at = {}  # market_id -> monotonic time of the last completed fetch
+        self._inflight = {}  # market_id -> task
+        self._held = {}  # market_id -> reference count
+        self._tokens = {}  # (market_id, outcome) -> outcome token ID of a held position
+        self._task = None
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._lookups = 0
+        self._streamed_hits = 0
+        self._book_hits = 0
+        self._cache_hits = 0
+        self._fetches = 0
+        self._refresh_passes = 0
+
+    @property
+    def held_market_count(self):
+        """Get number of markets held by any bot."""
+        return len(self._held)
+
+    async def start(self):
+        """
+        Start refreshing held markets in the background.
+
+        Returns:
+            Self for chaining
+        """
+        if self._task is None and self._refresh_interval > 0:
+            self._task = asyncio.create_task(self._refresh_loop())
+        return self
+
+    async def stop(self):
+        """Stop the background refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for task in list(self._inflight.values()):
+            task.cancel()
+
+    def track_market(self, _market_id, _outcome=None, _token_id=None):
+        """
+        Register a market as held so it is kept fresh.
+
+        Args:
+            _market_id: Market/condition ID
+            _outcome: Outcome held (needed with _token_id)
+            _token_id: Outcome token ID; its order book is kept in the cache while held
+        """
+        if not _market_id:
+            return
+        self._held[_market_id] = self._held.get(_market_id, 0) + 1
+
+        if _token_id and self._order_book_cache is not None:
+            self._order_book_cache.track_token(_token_id)
+            if _outcome is not None:
+                self._tokens[(_market_id, _outcome)] = _token_id
+
+    def untrack_market(self, _market_id, _outcome=None, _token_id=None):
+        """
+        Release a held market, dropping its prices when no bot holds it.
+
+        Args:
+            _market_id: Market/condition ID
+            _outcome: Outcome that was held
+            _token_id: Outcome token ID passed to track_market()
+        """
+        if _token_id and self._order_book_cache is not None:
+            self._order_book_cache.untrack_token(_token_id)
+
+        count = self._held.get(_market_id, 0)
+        if count > 1:
+            self._held[_market_id] = count - 1
+            return
+
+        self._held.pop(_market_id, None)
+        self._fetched_at.pop(_market_id, None)
+        stale_keys = [key for key in self._prices.keys() if key[0] == _market_id]
+        for key in stale_keys:
+            del self._prices[key]
+        stale_keys = [key for key in self._tokens.keys() if key[0] == _market_id]
+        for key in stale_keys:
+            del self._tokens[key]
+
+    async def get_price(self, _market_id, _outcome):
+        """
+        Get the current price for a market outcome.
+
+        Args:
+            _market_id: Market/condition ID
+            _outcome: Outcome name (e.g., "Yes", "No", "Up", "Down")
+
+        Returns:
+            Price as float, or None if unavailable
+        """
+        prices = await self.get_prices([(_market_id, _outcome)])
+        return prices.get((_market_id, _outcome))
+
+    async def get_prices(self, _keys):
+        """
+        Get current prices for many market outcomes at once.
+
+        Each market is fetched at most once, all stale markets concurrently.
+
+        Args:
+            _keys: Iterable of (market_id, outcome) tuples
+
+        Returns:
+            Dictionary of (market_id, outcome) to price (missing if unavailable)
+        """
+        prices = {}
+        stale_markets = set()
+        now = time.monotonic()
+
+        for key in set(_keys):
+            self._lookups = self._lookups + 1
+            price = self._cached_price(key[0], key[1])
+            if price is not None:
+                prices[key] = price
+            elif now - self._fetched_at.get(key[0], float('-inf')) > self._max_age:
+                # Only refetch if the market wasn't just fetched (outcome may simply have no recent trades)
+                stale_markets.add(key[0])
+
+        if len(stale_markets) == 0:
+            return prices
+
+        await self._refresh_markets(stale_markets)
+
+        for key in set(_keys):
+            if key in prices:
+                continue
+            entry = self._prices.get(key)
+            if entry is not None:
+                prices[key] = entry[0]
+
+        return prices
+
+    def get_stats(self):
+        """
+        Get oracle statistics.
+
+        Returns:
+            Dictionary of sizes and counters
+        """
+        return {
+            'held_markets': len(self._held),
+            'cached_prices': len(self._prices),
+            'inflight': len(self._inflight),
+            'max_age': self._max_age,
+            'refresh_interval': self._refresh_interval,
+            'lookups': self._lookups,
+            'streamed_hits': self._streamed_hits,
+            'book_hits': self._book_hits,
+            'cache_hits': self._cache_hits,
+            'fetches': self._fetches,
+            'refresh_passes': self._refresh_passes
+        }
+
+    def _cached_price(self, _market_id, _outcome):
+        """Get a price from the order book, the stream or the cache if it is fresh enough."""
+        book_price = self._book_price(_market_id, _outcome)
+        if book_price is not None:
+            self._book_hits = self._book_hits + 1
+            return book_price
+
+        if self._activity_feed is not None:
+            streamed_price = self._activity_feed.get_streamed_price(_market_id, _outcome, _max_age=self._max_age)
+            if streamed_price is not None:
+                self._streamed_hits = self._streamed_hits + 1
+                return streamed_price
+
+        entry = self._prices.get((_market_id, _outcome))
+        if entry is not None and time.monotonic() - entry[1] <= self._max_age:
+            self._cache_hits = self._cache_hits + 1
+            return entry[0]
+
+        return None
+
+    def _book_price(self, _market_id, _outcome):
+        """Get the cached book midpoint for a held outcome, if current and the spread is tight."""
+        if self._order_book_cache is None:
+            return None
+
+        token_id = self._tokens.get((_market_id, _outcome))
+        if token_id is None:
+            return None
+
+        book = self._order_book_cache.peek(token_id)
+        if book is None or book.spread is None or book.spread > self._max_spread:
+            return None
+        return book.midpoint
+
+    async def _refresh_markets(self, _market_ids):
+        """Fetch several markets concurrently, sharing any fetch already in flight."""
+        tasks = []
+        for market_id in _market_ids:
+            task = self._inflight.get(market_id)
+            if task is None:
+                task = asyncio.create_task(self._fetch_market(market_id))
+                self._inflight[market_id] = task
+                task.add_done_callback(lambda _task, _market_id=market_id: self._inflight.pop(_market_id, None))
+            tasks.append(task)
+
+        if len(tasks) > 0:
+            await asyncio.gather(*[asyncio.shield(task) for task in tasks], return_exceptions=True)
+
+    async def _fetch_market(self, _market_id):
+        """Fetch recent trades for a market and record the latest price of each outcome."""
+        if self._polymarket_client is None:
+            return
+
+        self._fetches = self._fetches + 1
+        try:
+            trades = await self._polymarket_client.get_market_trades(_market_id, _limit=self._trade_window)
+        except Exception as e:
+            self._logger.debug("Failed to fetch prices for {}: {}".format(_market_id, str(e)))
+            return
+
+        now = time.monotonic()
+        seen_outcomes = set()
+
+        # Trades are newest first, so the first trade per outcome is its last price
+        for trade in trades:
+            outcome = trade.get('outcome')
+            if outcome is None or outcome in seen_outcomes:
+                continue
+            seen_outcomes.add(outcome)
+
+            try:
+                self._prices[(_market_id, outcome)] = (float(trade.get('price', 0)), now)
+            except (TypeError, ValueError):
+                continue
+
+        self._fetched_at[_market_id] = now
+
+    async def _refresh_loop(self):
+        """Keep every held market's prices fresh."""
+        while True:
+            try:
+                await asyncio.sleep(self._refresh_interval)
+
+                now = time.monotonic()
+                due = [
+                    market_id for market_id in list(self._held.keys())
+                    if now - self._fetched_at.get(market_id, 0) >= self._refresh_interval
+                ]
+                if len(due) > 0:
+                    await self._refresh_markets(due)
+                    self._refresh_passes = self._refresh_passes + 1
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self._logger.error("Price refresh failed: {}".format(str(e)))
@@ -0,0 +1,109 @@
+"""
+Seen transaction index for BotForm2.
+
+Bounded, least-recently-used set of transaction hashes a bot has already
+handled. It only answers "seen recently"; the unique (bot_id,
+source_trade_id) index on trades is the durable record, so a hash that
+was evicted (or lost on restart) is checked against the database instead.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Optional, Dict, List
+
+
+class SeenIndex:
+    """LRU set of recently handled transaction hashes."""
+
+    def __init__(self, _capacity=10000):
+        """
+        Initialize seen index.
+
+        Args:
+            _capacity: Maximum number of hashes kept in memory
+        """
+        self._capacity = max(int(_capacity), 1)
+        self._entries = OrderedDict()
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def capacity(self):
+        """Get maximum number of hashes kept."""
+        return self._capacity
+
+    def __len__(self):
+        """Get number of hashes currently kept."""
+        return len(self._entries)
+
+    def __contains__(self, _tx_hash):
+        """
+        Check if a hash was seen recently, refreshing it if so.
+
+        Args:
+            _tx_hash: Transaction hash
+
+        Returns:
+            True if the hash is in the index
+        """
+        if _tx_hash in self._entries:
+            self._entries.move_to_end(_tx_hash)
+            self._hits = self._hits + 1
+            return True
+
+        self._misses = self._misses + 1
+        return False
+
+    def add(self, _tx_hash):
+        """
+        Mark a hash as seen, evicting the least recently used one when full.
+
+        Args:
+            _tx_hash: Transaction hash
+
+        Returns:
+            Self for chaining
+        """
+        if _tx_hash in self._entries:
+            self._entries.move_to_end(_tx_hash)
+            return self
+
+        self._entries[_tx_hash] = True
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+            self._evictions = self._evictions + 1
+        return self
+
+    def add_all(self, _tx_hashes):
+        """
+        Mark several hashes as seen.
+
+        Args:
+            _tx_hashes: Iterable of transaction hashes
+
+        Returns:
+            Self for chaining
+        """
+        for tx_hash in _tx_hashes:
+            self.add(tx_hash)
+        return self
+
+    def get_stats(self):
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary of size and hit/miss/eviction counters
+        """
+        return {
+            'size': len(self._entries),
+            'capacity': self._capacity,
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions
+        }
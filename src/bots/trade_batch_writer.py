@@ -0,0 +1,195 @@
+"""
+Trade batch writer for BotForm2.
+
+When several bots copy the same target trade they all reach their persist
+stage within a few milliseconds of each other. Rather than each bot taking
+a pool connection for its own INSERT, the writer collects the trade rows
+that arrive within a short window and records them in one multi-row
+statement, so the last bot's copy is committed as soon as the first one's.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+import time
+from collections import deque
+from typing import Optional, Dict, List
+
+from ..utils.metrics import LatencyTracker
+
+
+class TradeBatchWriter:
+    """Groups trade inserts from many bots into multi-row statements."""
+
+    def __init__(self, _db_manager, _window=0.01, _max_batch=100):
+        """
+        Initialize trade batch writer.
+
+        Args:
+            _db_manager: Database manager instance
+            _window: Seconds to wait after the first pending trade for others to join the batch
+            _max_batch: Largest number of trades written in one statement
+        """
+        self._db_manager = _db_manager
+        self._window = _window
+        self._max_batch = max(int(_max_batch), 1)
+
+        self._pending = deque()  # (trade_record, future), oldest first
+        self._pending_event = asyncio.Event()
+        self._task = None
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._batches = 0
+        self._batched_trades = 0
+        self._written = 0
+        self._duplicates = 0
+        self._largest_batch = 0
+        self._fallbacks = 0
+        self._errors = 0
+        self._write_latency = LatencyTracker()
+
+    async def start(self):
+        """
+        Start the background writer.
+
+        Returns:
+            Self for chaining
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    async def stop(self):
+        """Stop the background writer and write anything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while len(self._pending) > 0:
+            await self._write(self._take_batch())
+
+    async def insert(self, _trade_record):
+        """
+        Record a trade with the next batch.
+
+        Writes directly when the writer isn't running.
+
+        Args:
+            _trade_record: Trade dictionary (as for DatabaseManager.record_trade)
+
+        Returns:
+            Created trade record, or None if the bot already copied the source trade
+        """
+        if self._task is None:
+            return await self._db_manager.record_trade(_trade_record)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((_trade_record, future))
+        self._pending_event.set()
+        return await future
+
+    def _take_batch(self):
+        """Take up to max_batch pending trades, oldest first."""
+        batch = []
+        while len(self._pending) > 0 and len(batch) < self._max_batch:
+            batch.append(self._pending.popleft())
+        if len(self._pending) == 0:
+            self._pending_event.clear()
+        return batch
+
+    async def _run(self):
+        """Write pending trades in batches until cancelled."""
+        while True:
+            try:
+                await self._pending_event.wait()
+
+                # Let the other bots copying the same trade catch up
+                if self._window > 0 and len(self._pending) < self._max_batch:
+                    await asyncio.sleep(self._window)
+
+                # A batch already taken is finished even if the writer is stopping
+                await asyncio.shield(self._write(self._take_batch()))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.error("Trade batch writer loop error: {}".format(str(e)))
+
+    async def _write(self, _batch):
+        """
+        Write one batch and resolve its callers.
+
+        If the multi-row statement fails (e.g. one row references a deleted
+        bot), the trades are written one by one so a bad row fails alone.
+
+        Args:
+            _batch: List of (trade_record, future) tuples
+        """
+        if len(_batch) == 0:
+            return
+
+        started = time.monotonic()
+        try:
+            created = await self._db_manager.insert_trades([record for record, future in _batch])
+        except Exception as e:
+            self._fallbacks = self._fallbacks + 1
+            self._logger.warning("Batch insert of {} trades failed, writing individually: {}".format(
+                len(_batch), str(e)
+            ))
+            await self._write_individually(_batch)
+            return
+
+        self._write_latency.record(time.monotonic() - started)
+        self._batches = self._batches + 1
+        self._batched_trades = self._batched_trades + len(_batch)
+        self._largest_batch = max(self._largest_batch, len(_batch))
+
+        for record, future in _batch:
+            row = created.get(record['trade_id'])
+            if row is None:
+                self._duplicates = self._duplicates + 1
+            else:
+                self._written = self._written + 1
+            if future.done() == False:
+                future.set_result(row)
+
+    async def _write_individually(self, _batch):
+        """Write each trade of a failed batch on its own."""
+        for record, future in _batch:
+            try:
+                row = await self._db_manager.record_trade(record)
+                if row is None:
+                    self._duplicates = self._duplicates + 1
+                else:
+                    self._written = self._written + 1
+                if future.done() == False:
+                    future.set_result(row)
+
+            except Exception as e:
+                self._errors = self._errors + 1
+                if future.done() == False:
+                    future.set_exception(e)
+
+    def get_stats(self):
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary of batch counters and write latency
+        """
+        return {
+            'pending': len(self._pending),
+            'batches': self._batches,
+            'written': self._written,
+            'duplicates': self._duplicates,
+            'largest_batch': self._largest_batch,
+            'avg_batch': round(float(self._batched_trades) / self._batches, 2) if self._batches > 0 else None,
+            'fallbacks': self._fallbacks,
+            'errors': self._errors,
+            'write_latency': self._write_latency.get_stats()
+        }
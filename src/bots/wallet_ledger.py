@@ -0,0 +1,343 @@
+"""
+Paper wallet ledger for BotForm2.
+
+Keeps every running bot's paper wallet in memory so balance checks and
+reservations cost nothing on the trading path. Committed changes go into
+an ordered journal that a background task writes to the bots table in
+batches; a periodic reconciliation against the database picks up changes
+made outside the ledger (e.g. a wallet reset).
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+from collections import deque
+from typing import Optional, Dict, List
+
+
+class WalletLedger:
+    """In-memory paper wallets with batched write-through to the database."""
+
+    def __init__(self, _db_manager, _flush_interval=1.0, _reconcile_interval=60.0, _tolerance=0.01):
+        """
+        Initialize wallet ledger.
+
+        Args:
+            _db_manager: Database manager instance
+            _flush_interval: Seconds between journal flushes
+            _reconcile_interval: Seconds between reconciliations against the database
+            _tolerance: Largest difference (in dollars) treated as rounding rather than drift
+        """
+        self._db_manager = _db_manager
+        self._flush_interval = _flush_interval
+        self._reconcile_interval = _reconcile_interval
+        self._tolerance = _tolerance
+
+        # bot_id -> {'balance', 'reserved', 'persisted'}
+        self._accounts = {}
+        self._journal = deque()  # (sequence, bot_id, delta), oldest first
+        self._sequence = 0
+        self._lock = asyncio.Lock()
+        self._task = None
+        self._logger = logging.getLogger(__name__)
+
+        # Statistics
+        self._flushes = 0
+        self._flushed_entries = 0
+        self._flush_errors = 0
+        self._reconciliations = 0
+        self._drift_corrections = 0
+
+    async def start(self):
+        """
+        Start the background flush and reconcile loop.
+
+        Returns:
+            Self for chaining
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    async def stop(self):
+        """Stop the background loop and write out the journal."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+    def is_loaded(self, _bot_id):
+        """Check if a bot's wallet is held by the ledger."""
+        return True if _bot_id in self._accounts else False
+
+    async def load(self, _bot_id):
+        """
+        Load a bot's wallet from the database (no-op if already loaded).
+
+        Args:
+            _bot_id: Bot identifier
+
+        Returns:
+            Available balance
+        """
+        if _bot_id not in self._accounts:
+            balance = await self._db_manager.get_paper_wallet_balance(_bot_id)
+            balance = float(balance) if balance is not None else 0.0
+            self._accounts[_bot_id] = {'balance': balance, 'reserved': 0.0, 'persisted': balance}
+
+        return self.available(_bot_id)
+
+    async def unload(self, _bot_id):
+        """
+        Write out a bot's pending changes and drop its wallet.
+
+        Args:
+            _bot_id: Bot identifier
+        """
+        await self.flush()
+        self._accounts.pop(_bot_id, None)
+
+    def balance(self, _bot_id):
+        """
+        Get a bot's balance including unflushed changes.
+
+        Args:
+            _bot_id: Bot identifier
+
+        Returns:
+            Balance, or None if the wallet isn't loaded
+        """
+        account = self._accounts.get(_bot_id)
+        if account is None:
+            return None
+        return account['balance']
+
+    def available(self, _bot_id):
+        """
+        Get a bot's balance minus open reservations.
+
+        Args:
+            _bot_id: Bot identifier
+
+        Returns:
+            Available balance, or None if the wallet isn't loaded
+        """
+        account = self._accounts.get(_bot_id)
+        if account is None:
+            return None
+        return account['balance'] - account['reserved']
+
+    def reserve(self, _bot_id, _amount):
+        """
+        Hold funds for a trade that is about to be recorded.
+
+        Args:
+            _bot_id: Bot identifier
+            _amount: Amount to hold
+
+        Returns:
+            True if the available balance covered the amount
+        """
+        account = self._accounts.get(_bot_id)
+        if account is None or account['balance'] - account['reserved'] < _amount:
+            return False
+
+        account['reserved'] = account['reserved'] + _amount
+        return True
+
+    def release(self, _bot_id, _amount):
+        """
+        Drop a hold without spending it (the trade was not recorded).
+
+        Args:
+            _bot_id: Bot identifier
+            _amount: Amount previously reserved
+        """
+        account = self._accounts.get(_bot_id)
+        if account is not None:
+            account['reserved'] = max(account['reserved'] - _amount, 0.0)
+
+    def commit(self, _bot_id, _amount):
+        """
+        Spend a hold once its trade is recorded.
+
+        Args:
+            _bot_id: Bot identifier
+            _amount: Amount previously reserved
+        """
+        account = self._accounts.get(_bot_id)
+        if account is None:
+            return
+
+        account['reserved'] = max(account['reserved'] - _amount, 0.0)
+        account['balance'] = account['balance'] - _amount
+        self._append(_bot_id, -_amount)
+
+    def credit(self, _bot_id, _amount):
+        """
+        Add funds (e.g. a closed trade's value).
+
+        Args:
+            _bot_id: Bot identifier
+            _amount: Amount to add
+        """
+        account = self._accounts.get(_bot_id)
+        if account is None:
+            return
+
+        account['balance'] = account['balance'] + _amount
+        self._append(_bot_id, _amount)
+
+    def _append(self, _bot_id, _delta):
+        """Add a change to the journal."""
+        self._sequence = self._sequence + 1
+        self._journal.append((self._sequence, _bot_id, _delta))
+
+    async def flush(self):
+        """
+        Write journaled changes to the database in one statement.
+
+        Returns:
+            Number of journal entries written
+        """
+        async with self._lock:
+            return await self._flush_locked()
+
+    async def _flush_locked(self):
+        """Write the journal (caller holds the lock); entries are put back on failure."""
+        if len(self._journal) == 0:
+            return 0
+
+        entries = list(self._journal)
+        self._journal.clear()
+
+        # Sum per bot, keeping first-seen order
+        deltas = {}
+        for sequence, bot_id, delta in entries:
+            deltas[bot_id] = deltas.get(bot_id, 0.0) + delta
+
+        try:
+            await self._db_manager.apply_wallet_deltas(list(deltas.items()))
+        except Exception as e:
+            self._flush_errors = self._flush_errors + 1
+            self._journal.extendleft(reversed(entries))
+            self._logger.error("Wallet journal flush failed ({} entries kept): {}".format(len(entries), str(e)))
+            return 0
+
+        for bot_id, delta in deltas.items():
+            account = self._accounts.get(bot_id)
+            if account is not None:
+                account['persisted'] = account['persisted'] + delta
+
+        self._flushes = self._flushes + 1
+        self._flushed_entries = self._flushed_entries + len(entries)
+        return len(entries)
+
+    async def reconcile(self, _bot_ids=None):
+        """
+        Compare wallets with the database and adopt changes made outside the ledger.
+
+        Args:
+            _bot_ids: Bots to check (all loaded wallets if None)
+
+        Returns:
+            Dictionary of bot_id to corrected drift (only bots that drifted)
+        """
+        async with self._lock:
+            await self._flush_locked()
+
+            bot_ids = list(self._accounts.keys()) if _bot_ids is None else [
+                bot_id for bot_id in _bot_ids if bot_id in self._accounts
+            ]
+            if len(bot_ids) == 0:
+                return {}
+
+            balances = await self._db_manager.get_paper_wallet_balances(bot_ids)
+            self._reconciliations = self._reconciliations + 1
+
+            drifted = {}
+            for bot_id in bot_ids:
+                account = self._accounts.get(bot_id)
+                if account is None or bot_id not in balances:
+                    continue
+
+                db_balance = float(balances[bot_id]) if balances[bot_id] is not None else 0.0
+                drift = db_balance - account['persisted']
+                if abs(drift) <= self._tolerance:
+                    continue
+
+                self._logger.warning("Paper wallet for bot {} drifted by ${:.2f}, adopting database balance".format(
+                    bot_id, drift
+                ))
+                account['balance'] = account['balance'] + drift
+                account['persisted'] = db_balance
+                drifted[bot_id] = drift
+                self._drift_corrections = self._drift_corrections + 1
+
+            return drifted
+
+    async def resync(self, _bot_id):
+        """
+        Adopt a bot's database balance right away (after a wallet reset).
+
+        Args:
+            _bot_id: Bot identifier
+
+        Returns:
+            Available balance, or None if the wallet isn't loaded
+        """
+        await self.reconcile([_bot_id])
+        return self.available(_bot_id)
+
+    async def _run(self):
+        """Flush the journal every interval and reconcile less often."""
+        since_reconcile = 0.0
+        while True:
+            try:
+                await asyncio.sleep(self._flush_interval)
+                since_reconcile = since_reconcile + self._flush_interval
+
+                if since_reconcile >= self._reconcile_interval:
+                    since_reconcile = 0.0
+                    await self.reconcile()
+                else:
+                    await self.flush()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.error("Wallet ledger loop error: {}".format(str(e)))
+
+    def get_stats(self, _bot_id=None):
+        """
+        Get ledger statistics.
+
+        Args:
+            _bot_id: Include this bot's wallet (optional)
+
+        Returns:
+            Dictionary of journal and reconciliation counters
+        """
+        stats = {
+            'wallets': len(self._accounts),
+            'pending': len(self._journal),
+            'flushes': self._flushes,
+            'flushed_entries': self._flushed_entries,
+            'flush_errors': self._flush_errors,
+            'reconciliations': self._reconciliations,
+            'drift_corrections': self._drift_corrections
+        }
+
+        if _bot_id is not None and _bot_id in self._accounts:
+            account = self._accounts[_bot_id]
+            stats['wallet'] = {
+                'balance': round(account['balance'], 2),
+                'reserved': round(account['reserved'], 2),
+                'persisted': round(account['persisted'], 2)
+            }
+        return stats
@@ -25,6 +25,20 @@ class Config:
         self._polymarket_api_secret = os.getenv('POLYMARKET_API_SECRET', '')
         self._polymarket_base_url = os.getenv('POLYMARKET_BASE_URL', 'https://api.polymarket.com')
 
+        # Per-service base URL overrides (empty uses the public endpoint; set to run against the fake server)
+        self._polymarket_data_url = os.getenv('POLYMARKET_DATA_URL', '')
+        self._polymarket_gamma_url = os.getenv('POLYMARKET_GAMMA_URL', '')
+        self._polymarket_clob_url = os.getenv('POLYMARKET_CLOB_URL', '')
+        self._polymarket_strapi_url = os.getenv('POLYMARKET_STRAPI_URL', '')
+
+        # Polymarket connection pool configuration (per upstream host)
+        self._polymarket_http2 = os.getenv('POLYMARKET_HTTP2', 'true').lower() == 'true'
+        self._polymarket_max_connections = int(os.getenv('POLYMARKET_MAX_CONNECTIONS', '20'))
+        self._polymarket_max_keepalive = int(os.getenv('POLYMARKET_MAX_KEEPALIVE', '10'))
+        self._polymarket_keepalive_expiry = float(os.getenv('POLYMARKET_KEEPALIVE_EXPIRY', '30'))  # seconds
+        self._polymarket_timeout = float(os.getenv('POLYMARKET_TIMEOUT', '10'))  # seconds
+        self._polymarket_dns_cache_ttl = float(os.getenv('POLYMARKET_DNS_CACHE_TTL', '300'))  # seconds
+
         # Security configuration
         self._require_vpn = os.getenv('REQUIRE_VPN', 'false').lower() == 'true'
         self._allowed_vpn_ips = os.getenv('ALLOWED_VPN_IPS', '').split(',') if os.getenv('ALLOWED_VPN_IPS', '') != '' else []
@@ -37,7 +51,33 @@ class Config:
 
         # Bot configuration
         self._poll_interval = int(os.getenv('POLL_INTERVAL', '5'))  # seconds
-        self._rate_limit_delay = float(os.getenv('RATE_LIMIT_DELAY', '0.2'))  # seconds
+        self._poll_min_interval = float(os.getenv('POLL_MIN_INTERVAL', '2'))  # seconds, adaptive lower bound
+        self._poll_max_interval = float(os.getenv('POLL_MAX_INTERVAL', '60'))  # seconds, adaptive upper bound
+        self._rate_limit_delay = float(os.getenv('RATE_LIMIT_DELAY', '0.2'))  # seconds between requests per host
+        self._rate_limit_burst = int(os.getenv('RATE_LIMIT_BURST', '5'))
+        self._max_concurrency = int(os.getenv('POLYMARKET_MAX_CONCURRENCY', '4'))  # in-flight requests per host
+        self._max_retries = int(os.getenv('POLYMARKET_MAX_RETRIES', '3'))
+        self._coalesce_ttl = float(os.getenv('POLYMARKET_COALESCE_TTL', '0.5'))  # seconds identical GETs reuse a response
+        self._hedge_percentile = float(os.getenv('POLYMARKET_HEDGE_PERCENTILE', '95'))  # 0 disables hedged fetches
+        self._breaker_threshold = int(os.getenv('POLYMARKET_BREAKER_THRESHOLD', '5'))  # consecutive failures
+        self._breaker_recovery = float(os.getenv('POLYMARKET_BREAKER_RECOVERY', '30'))  # seconds before probing
+        self._price_max_age = float(os.getenv('PRICE_MAX_AGE', '10'))  # seconds a cached price is served
+        self._price_refresh_interval = float(os.getenv('PRICE_REFRESH_INTERVAL', '5'))  # seconds
+        self._wallet_flush_interval = float(os.getenv('WALLET_FLUSH_INTERVAL', '1'))  # seconds
+        self._wallet_reconcile_interval = float(os.getenv('WALLET_RECONCILE_INTERVAL', '60'))  # seconds
+        self._trade_batch_window = float(os.getenv('TRADE_BATCH_WINDOW', '0.01'))  # seconds trades wait to share an insert
+        self._trade_batch_size = int(os.getenv('TRADE_BATCH_SIZE', '100'))
+        self._order_aggregation_window = float(os.getenv('ORDER_AGGREGATION_WINDOW', '0.05'))  # seconds, 0 disables
+        self._order_aggregation_max = int(os.getenv('ORDER_AGGREGATION_MAX', '50'))  # bot orders per parent order
+        self._order_book_max_age = float(os.getenv('ORDER_BOOK_MAX_AGE', '5'))  # seconds without an update before stale
+        self._order_book_refresh_interval = float(os.getenv('ORDER_BOOK_REFRESH_INTERVAL', '2'))  # seconds
+        self._order_book_capacity = int(os.getenv('ORDER_BOOK_CAPACITY', '200'))  # books kept for tokens not held
+        self._paper_max_slippage = float(os.getenv('PAPER_MAX_SLIPPAGE', '0.05'))  # fraction above target's price
+
+        # Ingestion configuration ('poll' or 'stream')
+        self._ingestion_mode = os.getenv('INGESTION_MODE', 'poll').lower()
+        # CLOB market channel: streams books and trades of held tokens; target activity is always polled
+        self._stream_url = os.getenv('STREAM_URL', 'wss://ws-subscriptions-clob.polymarket.com/ws/market')
 
         # Authentication configuration
         self._secret_key = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -65,6 +105,56 @@ class Config:
         """Get Polymarket API base URL."""
         return self._polymarket_base_url
 
+    @property
+    def polymarket_data_url(self):
+        """Get data API base URL override (None for the public endpoint)."""
+        return self._polymarket_data_url if self._polymarket_data_url != '' else None
+
+    @property
+    def polymarket_gamma_url(self):
+        """Get gamma API base URL override (None for the public endpoint)."""
+        return self._polymarket_gamma_url if self._polymarket_gamma_url != '' else None
+
+    @property
+    def polymarket_clob_url(self):
+        """Get CLOB API base URL override (None for the public endpoint)."""
+        return self._polymarket_clob_url if self._polymarket_clob_url != '' else None
+
+    @property
+    def polymarket_strapi_url(self):
+        """Get strapi base URL override (None for the public endpoint)."""
+        return self._polymarket_strapi_url if self._polymarket_strapi_url != '' else None
+
+    @property
+    def polymarket_http2(self):
+        """Check if pooled Polymarket connections use HTTP/2."""
+        return True if self._polymarket_http2 == True else False
+
+    @property
+    def polymarket_max_connections(self):
+        """Get maximum open connections per Polymarket host."""
+        return self._polymarket_max_connections
+
+    @property
+    def polymarket_max_keepalive(self):
+        """Get maximum idle keep-alive connections per Polymarket host."""
+        return self._polymarket_max_keepalive
+
+    @property
+    def polymarket_keepalive_expiry(self):
+        """Get idle keep-alive expiry in seconds."""
+        return self._polymarket_keepalive_expiry
+
+    @property
+    def polymarket_timeout(self):
+        """Get Polymarket request timeout in seconds."""
+        return self._polymarket_timeout
+
+    @property
+    def polymarket_dns_cache_ttl(self):
+        """Get DNS cache TTL in seconds."""
+        return self._polymarket_dns_cache_ttl
+
     @property
     def require_vpn(self):
         """Check if VPN is required."""
@@ -100,11 +190,136 @@ class Config:
         """Get bot polling interval in seconds."""
         return self._poll_interval
 
+    @property
+    def poll_min_interval(self):
+        """Get fastest adaptive polling interval in seconds."""
+        return self._poll_min_interval
+
+    @property
+    def poll_max_interval(self):
+        """Get slowest adaptive polling interval in seconds."""
+        return self._poll_max_interval
+
     @property
     def rate_limit_delay(self):
         """Get API rate limit delay in seconds."""
         return self._rate_limit_delay
 
+    @property
+    def rate_limit(self):
+        """Get sustained requests per second allowed per host (0 means unlimited)."""
+        return 1.0 / self._rate_limit_delay if self._rate_limit_delay > 0 else 0.0
+
+    @property
+    def rate_limit_burst(self):
+        """Get token bucket burst size per host."""
+        return self._rate_limit_burst
+
+    @property
+    def max_concurrency(self):
+        """Get maximum in-flight requests per host."""
+        return self._max_concurrency
+
+    @property
+    def max_retries(self):
+        """Get maximum retries after a 429 response."""
+        return self._max_retries
+
+    @property
+    def coalesce_ttl(self):
+        """Get seconds a successful GET response is reused for identical requests."""
+        return self._coalesce_ttl
+
+    @property
+    def hedge_percentile(self):
+        """Get primary latency percentile after which fallback requests are fired (0 disables)."""
+        return self._hedge_percentile
+
+    @property
+    def breaker_threshold(self):
+        """Get consecutive failures that open a host's circuit breaker."""
+        return self._breaker_threshold
+
+    @property
+    def breaker_recovery(self):
+        """Get seconds a host's circuit breaker stays open before probing."""
+        return self._breaker_recovery
+
+    @property
+    def price_max_age(self):
+        """Get seconds a cached market price is served before refetching."""
+        return self._price_max_age
+
+    @property
+    def price_refresh_interval(self):
+        """Get seconds between background refreshes of held market prices."""
+        return self._price_refresh_interval
+
+    @property
+    def wallet_flush_interval(self):
+        """Get seconds between writes of paper wallet changes to the database."""
+        return self._wallet_flush_interval
+
+    @property
+    def wallet_reconcile_interval(self):
+        """Get seconds between paper wallet checks against the database."""
+        return self._wallet_reconcile_interval
+
+    @property
+    def trade_batch_window(self):
+        """Get seconds new trades wait for other bots' copies to share one insert."""
+        return self._trade_batch_window
+
+    @property
+    def trade_batch_size(self):
+        """Get largest number of trades written in one insert."""
+        return self._trade_batch_size
+
+    @property
+    def order_aggregation_window(self):
+        """Get seconds a production order waits for matching orders from other bots."""
+        return self._order_aggregation_window
+
+    @property
+    def order_aggregation_max(self):
+        """Get largest number of bot orders merged into one parent order."""
+        return self._order_aggregation_max
+
+    @property
+    def order_book_max_age(self):
+        """Get seconds an order book goes without a snapshot or streamed change before it is stale."""
+        return self._order_book_max_age
+
+    @property
+    def order_book_refresh_interval(self):
+        """Get seconds between checks that refetch stale held order books."""
+        return self._order_book_refresh_interval
+
+    @property
+    def order_book_capacity(self):
+        """Get maximum order books kept for tokens no position holds."""
+        return self._order_book_capacity
+
+    @property
+    def paper_max_slippage(self):
+        """Get highest paper entry price as a fraction above the target's price."""
+        return self._paper_max_slippage
+
+    @property
+    def ingestion_mode(self):
+        """Get activity ingestion mode ('poll' or 'stream')."""
+        return self._ingestion_mode
+
+    @property
+    def stream_url(self):
+        """Get CLOB market channel websocket URL used in streaming mode."""
+        return self._stream_url
+
+    @property
+    def is_streaming(self):
+        """Check if market data is streamed over the CLOB market channel (needs a STREAM_URL)."""
+        return True if self._ingestion_mode == 'stream' and self._stream_url != '' else False
+
     @property
     def is_development(self):
         """Check if running in development mode."""
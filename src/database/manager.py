@@ -9,6 +9,9 @@ import logging
 from typing import Optional, Dict, List, Any
 from psycopg_pool import AsyncConnectionPool
 from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from psycopg import errors
+from datetime import datetime
 import os
 
 
@@ -285,23 +288,294 @@ class DatabaseManager:
             _trade_data: Dictionary containing trade information
 
         Returns:
-            Created trade record
+            Created trade record, or None if the bot already copied this source trade
         """
+        # Copy latency timestamps are optional; committed_at is stamped by the database
+        params = dict(_trade_data)
+        for key in ['source_timestamp', 'detected_at', 'decided_at', 'submitted_at', 'acked_at',
+                    'token_id', 'entry_slippage']:
+            params.setdefault(key, None)
+
         query = """
             INSERT INTO trades (
                 trade_id, bot_id, is_paper_trade, market_id, market_name, outcome,
-                amount, price, opened_at, status, source_trade_id, target_trade_id, close_value
+                amount, price, opened_at, status, source_trade_id, target_trade_id, close_value,
+                token_id, entry_slippage,
+                source_timestamp, detected_at, decided_at, submitted_at, acked_at, committed_at
             ) VALUES (
                 %(trade_id)s, %(bot_id)s, %(is_paper_trade)s, %(market_id)s, %(market_name)s, %(outcome)s,
-                %(amount)s, %(price)s, %(opened_at)s, %(status)s, %(source_trade_id)s, %(target_trade_id)s, %(close_value)s
+                %(amount)s, %(price)s, %(opened_at)s, %(status)s, %(source_trade_id)s, %(target_trade_id)s, %(close_value)s,
+                %(token_id)s, %(entry_slippage)s,
+                %(source_timestamp)s, %(detected_at)s, %(decided_at)s, %(submitted_at)s, %(acked_at)s,
+                clock_timestamp() AT TIME ZONE 'UTC'
             )
+            ON CONFLICT (bot_id, source_trade_id) WHERE source_trade_id IS NOT NULL AND source_trade_id <> ''
+            DO NOTHING
             RETURNING *
         """
 
-        result = await self.fetch(query, _trade_data)
+        result = await self.fetch(query, params)
+        if result is None:
+            self._logger.info("Skipped duplicate trade for source {}".format(_trade_data.get('source_trade_id')))
+            return None
+
         self._logger.info("Recorded trade: {}".format(_trade_data['trade_id']))
         return result
 
+    async def insert_trades(self, _trades):
+        """
+        Record several new trades in one statement.
+
+        Args:
+            _trades: List of trade dictionaries (as for record_trade)
+
+        Returns:
+            Dictionary of trade_id to created trade record; trades whose bot
+            already copied the source trade are left out
+        """
+        if len(_trades) == 0:
+            return {}
+
+        columns = [
+            'trade_id', 'bot_id', 'is_paper_trade', 'market_id', 'market_name', 'outcome',
+            'amount', 'price', 'opened_at', 'status', 'source_trade_id', 'target_trade_id', 'close_value',
+            'token_id', 'entry_slippage', 'source_timestamp', 'detected_at', 'decided_at', 'submitted_at', 'acked_at'
+        ]
+
+        # One VALUES row per trade, with parameters suffixed by the row number
+        params = {}
+        rows = []
+        i = 0
+        for trade in _trades:
+            placeholders = []
+            for column in columns:
+                key = "{}_{}".format(column, i)
+                params[key] = trade.get(column)
+                placeholders.append("%({})s".format(key))
+            rows.append("({}, clock_timestamp() AT TIME ZONE 'UTC')".format(", ".join(placeholders)))
+            i = i + 1
+
+        query = """
+            INSERT INTO trades ({}, committed_at)
+            VALUES {}
+            ON CONFLICT (bot_id, source_trade_id) WHERE source_trade_id IS NOT NULL AND source_trade_id <> ''
+            DO NOTHING
+            RETURNING *
+        """.format(", ".join(columns), ",\n                   ".join(rows))
+
+        created = await self.fetch_all(query, params)
+
+        skipped = len(_trades) - len(created)
+        if skipped > 0:
+            self._logger.info("Skipped {} duplicate trades in batch of {}".format(skipped, len(_trades)))
+
+        return dict([(row['trade_id'], row) for row in created])
+
+    async def open_paper_trade(self, _trade_data, _debit_wallet=True):
+        """
+        Reserve paper funds and record a new trade in one statement.
+
+        The wallet is debited only if it covers the amount and the bot has
+        not already copied the source trade; the trade row is inserted in the
+        same statement, so the two can't diverge.
+
+        Args:
+            _trade_data: Dictionary containing trade information (as for record_trade)
+            _debit_wallet: False when the wallet is kept by the WalletLedger (insert only)
+
+        Returns:
+            Dictionary with 'result' ('opened', 'insufficient_funds' or 'duplicate'),
+            'balance' (wallet balance after the debit, or the unchanged balance)
+            and 'trade' (created trade record, or None)
+        """
+        params = dict(_trade_data)
+        for key in ['source_timestamp', 'detected_at', 'decided_at', 'submitted_at', 'acked_at',
+                    'token_id', 'entry_slippage']:
+            params.setdefault(key, None)
+
+        if _debit_wallet == True:
+            debit = """
+                UPDATE bots
+                SET paper_wallet_balance = paper_wallet_balance - %(amount)s,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE bot_id = %(bot_id)s
+                  AND paper_wallet_balance >= %(amount)s
+                  AND NOT EXISTS (SELECT 1 FROM already_copied)
+                RETURNING paper_wallet_balance
+            """
+        else:
+            debit = """
+                SELECT COALESCE(paper_wallet_balance, 0) AS paper_wallet_balance
+                FROM bots
+                WHERE bot_id = %(bot_id)s
+                  AND NOT EXISTS (SELECT 1 FROM already_copied)
+            """
+
+        query = """
+            WITH already_copied AS (
+                SELECT 1
+                FROM trades
+                WHERE bot_id = %(bot_id)s
+                  AND source_trade_id = %(source_trade_id)s
+                  AND source_trade_id <> ''
+            ), debited AS ({}), opened AS (
+                INSERT INTO trades (
+                    trade_id, bot_id, is_paper_trade, market_id, market_name, outcome,
+                    amount, price, opened_at, status, source_trade_id, target_trade_id, close_value,
+                    token_id, entry_slippage,
+                    source_timestamp, detected_at, decided_at, submitted_at, acked_at, committed_at
+                )
+                SELECT
+                    %(trade_id)s, %(bot_id)s, TRUE, %(market_id)s, %(market_name)s, %(outcome)s,
+                    %(amount)s, %(price)s, %(opened_at)s, %(status)s, %(source_trade_id)s, %(target_trade_id)s, %(close_value)s,
+                    %(token_id)s, %(entry_slippage)s,
+                    %(source_timestamp)s, %(detected_at)s, %(decided_at)s, %(submitted_at)s, %(acked_at)s,
+                    clock_timestamp() AT TIME ZONE 'UTC'
+                FROM debited
+                RETURNING *
+            )
+            SELECT
+                CASE
+                    WHEN (SELECT paper_wallet_balance FROM debited) IS NOT NULL THEN 'opened'
+                    WHEN EXISTS (SELECT 1 FROM already_copied) THEN 'duplicate'
+                    ELSE 'insufficient_funds'
+                END AS open_result,
+                COALESCE(
+                    (SELECT paper_wallet_balance FROM debited),
+                    (SELECT paper_wallet_balance FROM bots WHERE bot_id = %(bot_id)s)
+                ) AS wallet_balance,
+                opened.*
+            FROM (SELECT 1) AS single_row
+            LEFT JOIN opened ON TRUE
+        """.format(debit)
+
+        try:
+            async with self._pool.connection() as conn:
+                async with conn.cursor(row_factory=dict_row) as cur:
+                    await cur.execute(query, params)
+                    row = await cur.fetchone()
+
+        except errors.UniqueViolation:
+            # A concurrent open of the same source trade won; this statement rolled back
+            self._logger.info("Skipped duplicate trade for source {}".format(params.get('source_trade_id')))
+            return {'result': 'duplicate', 'balance': None, 'trade': None}
+
+        except Exception as e:
+            self._logger.error("Open paper trade failed: {}".format(str(e)))
+            raise
+
+        result = row.pop('open_result')
+        balance = row.pop('wallet_balance')
+        if result != 'opened':
+            self._logger.info("Paper trade not opened for bot {}: {}".format(params['bot_id'], result))
+            return {'result': result, 'balance': balance, 'trade': None}
+
+        self._logger.info("Opened paper trade: {}".format(params['trade_id']))
+        return {'result': result, 'balance': balance, 'trade': row}
+
+    async def get_loss_buckets(self, _bot_id, _window_hours=24):
+        """
+        Get a bot's realized losses per minute over a recent window.
+
+        Args:
+            _bot_id: Bot identifier
+            _window_hours: Window length in hours
+
+        Returns:
+            List of (minute_start_epoch, loss, count) tuples, oldest first
+        """
+        query = """
+            SELECT
+                EXTRACT(EPOCH FROM date_trunc('minute', closed_at))::float8 AS minute,
+                SUM(-profit_loss)::float8 AS loss,
+                COUNT(*) AS count
+            FROM trades
+            WHERE bot_id = %(bot_id)s
+              AND status = 'closed'
+              AND profit_loss < 0
+              AND closed_at >= (now() AT TIME ZONE 'UTC') - make_interval(hours => %(window_hours)s)
+            GROUP BY 1
+            ORDER BY 1
+        """
+
+        rows = await self.fetch_all(query, {'bot_id': _bot_id, 'window_hours': _window_hours})
+        return [(row['minute'], row['loss'], row['count']) for row in rows]
+
+    async def get_copied_source_trades(self, _bot_id, _source_trade_ids):
+        """
+        Find which source trades a bot has already copied.
+
+        Args:
+            _bot_id: Bot identifier
+            _source_trade_ids: List of source transaction hashes to check
+
+        Returns:
+            Set of the given hashes that already have a trade row
+        """
+        if len(_source_trade_ids) == 0:
+            return set()
+
+        query = """
+            SELECT source_trade_id
+            FROM trades
+            WHERE bot_id = %(bot_id)s AND source_trade_id = ANY(%(source_trade_ids)s)
+        """
+
+        rows = await self.fetch_all(query, {'bot_id': _bot_id, 'source_trade_ids': list(_source_trade_ids)})
+        return set([row['source_trade_id'] for row in rows])
+
+    async def get_trade_latency_stats(self, _bot_id, _limit=500):
+        """
+        Get copy latency percentiles from a bot's recorded trades.
+
+        Args:
+            _bot_id: Bot identifier
+            _limit: Number of most recent trades to include
+
+        Returns:
+            Dictionary of stage name to count, p50_ms, p95_ms, p99_ms and max_ms
+        """
+        query = """
+            WITH recent AS (
+                SELECT source_timestamp, detected_at, decided_at, submitted_at, acked_at, committed_at
+                FROM trades
+                WHERE bot_id = %(bot_id)s AND committed_at IS NOT NULL
+                ORDER BY opened_at DESC
+                LIMIT %(limit)s
+            )
+            SELECT
+                s.stage,
+                COUNT(*) AS count,
+                percentile_cont(0.50) WITHIN GROUP (ORDER BY s.seconds) * 1000 AS p50_ms,
+                percentile_cont(0.95) WITHIN GROUP (ORDER BY s.seconds) * 1000 AS p95_ms,
+                percentile_cont(0.99) WITHIN GROUP (ORDER BY s.seconds) * 1000 AS p99_ms,
+                MAX(s.seconds) * 1000 AS max_ms
+            FROM recent r
+            CROSS JOIN LATERAL (VALUES
+                ('detect', EXTRACT(EPOCH FROM r.detected_at - r.source_timestamp)::float8),
+                ('decide', EXTRACT(EPOCH FROM r.decided_at - r.detected_at)::float8),
+                ('submit', EXTRACT(EPOCH FROM r.submitted_at - r.decided_at)::float8),
+                ('ack', EXTRACT(EPOCH FROM r.acked_at - r.submitted_at)::float8),
+                ('commit', EXTRACT(EPOCH FROM r.committed_at - COALESCE(r.acked_at, r.decided_at))::float8),
+                ('total', EXTRACT(EPOCH FROM r.committed_at - r.source_timestamp)::float8)
+            ) AS s(stage, seconds)
+            WHERE s.seconds IS NOT NULL
+            GROUP BY s.stage
+        """
+
+        rows = await self.fetch_all(query, {'bot_id': _bot_id, 'limit': _limit})
+
+        stats = {}
+        for row in rows:
+            stats[row['stage']] = {
+                'count': row['count'],
+                'p50_ms': round(row['p50_ms'], 1),
+                'p95_ms': round(row['p95_ms'], 1),
+                'p99_ms': round(row['p99_ms'], 1),
+                'max_ms': round(row['max_ms'], 1)
+            }
+        return stats
+
     async def update_trade(self, _trade_id, _update_data):
         """
         Update trade record.
@@ -332,6 +606,82 @@ class DatabaseManager:
         result = await self.fetch(query, params)
         return result
 
+    async def get_trade(self, _trade_id):
+        """
+        Retrieve a single trade.
+
+        Args:
+            _trade_id: Trade identifier
+
+        Returns:
+            Trade record or None if not found
+        """
+        query = "SELECT * FROM trades WHERE trade_id = %(trade_id)s"
+        return await self.fetch(query, {'trade_id': _trade_id})
+
+    async def close_trade(self, _trade_id, _bot_id, _exit_price, _credit_wallet=True, _exit_slippage=None):
+        """
+        Close an open trade in one statement.
+
+        Computes P&L from the stored entry, closes the trade only if it is
+        still open, returns the close value to the paper wallet and adds the
+        result to the bot's performance totals.
+
+        Args:
+            _trade_id: Trade identifier
+            _bot_id: Bot that owns the trade
+            _exit_price: Exit price (0.0-1.0)
+            _credit_wallet: False when the wallet is kept by the WalletLedger
+            _exit_slippage: Simulated exit slippage to record (paper trades)
+
+        Returns:
+            Closed trade record (with the bot's new paper_wallet_balance), or None if it was not open
+        """
+        credit = "CASE WHEN c.is_paper_trade AND c.close_value > 0 THEN c.close_value ELSE 0 END"
+        if _credit_wallet == False:
+            credit = "0"
+
+        query = """
+            WITH closed AS (
+                UPDATE trades
+                SET status = 'closed',
+                    closed_at = now() AT TIME ZONE 'UTC',
+                    exit_price = %(exit_price)s,
+                    exit_slippage = %(exit_slippage)s,
+                    close_value = amount / price * %(exit_price)s,
+                    profit_loss = amount / price * %(exit_price)s - amount
+                WHERE trade_id = %(trade_id)s
+                  AND bot_id = %(bot_id)s
+                  AND status = 'open'
+                  AND price > 0
+                RETURNING *
+            ), credited AS (
+                UPDATE bots b
+                SET paper_wallet_balance = b.paper_wallet_balance + {},
+                    total_trades = COALESCE(b.total_trades, 0) + 1,
+                    winning_trades = COALESCE(b.winning_trades, 0) + CASE WHEN c.profit_loss > 0 THEN 1 ELSE 0 END,
+                    total_profit = COALESCE(b.total_profit, 0) + GREATEST(c.profit_loss, 0),
+                    total_loss = COALESCE(b.total_loss, 0) + GREATEST(-c.profit_loss, 0),
+                    updated_at = CURRENT_TIMESTAMP
+                FROM closed c
+                WHERE b.bot_id = c.bot_id
+                RETURNING b.paper_wallet_balance
+            )
+            SELECT closed.*, (SELECT paper_wallet_balance FROM credited) AS paper_wallet_balance
+            FROM closed
+        """.format(credit)
+
+        result = await self.fetch(query, {
+            'trade_id': _trade_id,
+            'bot_id': _bot_id,
+            'exit_price': _exit_price,
+            'exit_slippage': _exit_slippage
+        })
+
+        if result is not None:
+            self._logger.info("Closed trade: {}".format(_trade_id))
+        return result
+
     async def get_bot_trades(self, _bot_id, _limit=None, _offset=None, _status=None):
         """
         Retrieve trades for a specific bot.
@@ -585,6 +935,59 @@ class DatabaseManager:
             return float(result['paper_wallet_balance'])
         return None
 
+    async def get_paper_wallet_balances(self, _bot_ids):
+        """
+        Get paper trading wallet balances for several bots.
+
+        Args:
+            _bot_ids: List of bot identifiers
+
+        Returns:
+            Dictionary of bot_id to balance (float, or None if unset)
+        """
+        if len(_bot_ids) == 0:
+            return {}
+
+        query = """
+            SELECT bot_id, paper_wallet_balance
+            FROM bots
+            WHERE bot_id = ANY(%(bot_ids)s)
+        """
+        rows = await self.fetch_all(query, {'bot_ids': list(_bot_ids)})
+
+        balances = {}
+        for row in rows:
+            balance = row['paper_wallet_balance']
+            balances[row['bot_id']] = float(balance) if balance is not None else None
+        return balances
+
+    async def apply_wallet_deltas(self, _deltas):
+        """
+        Apply paper wallet changes for several bots in one statement.
+
+        Args:
+            _deltas: List of (bot_id, delta) tuples, one per bot
+
+        Returns:
+            Number of bots updated
+        """
+        if len(_deltas) == 0:
+            return 0
+
+        query = """
+            UPDATE bots AS b
+            SET paper_wallet_balance = b.paper_wallet_balance + v.delta,
+                updated_at = CURRENT_TIMESTAMP
+            FROM unnest(%(bot_ids)s::varchar[], %(deltas)s::numeric[]) AS v(bot_id, delta)
+            WHERE b.bot_id = v.bot_id
+        """
+
+        result = await self.execute(query, {
+            'bot_ids': [bot_id for bot_id, delta in _deltas],
+            'deltas': [round(delta, 2) for bot_id, delta in _deltas]
+        })
+        return result
+
     async def get_total_paper_wallet_balance(self):
         """
         Get total paper trading wallet balance across all bots.
@@ -634,6 +1037,54 @@ class DatabaseManager:
             self._logger.info("Reset paper wallet for bot: {}".format(_bot_id))
         return result
 
+    # Market metadata methods
+    async def get_market(self, _key):
+        """
+        Get cached market metadata by condition ID, token ID or slug.
+
+        Args:
+            _key: Condition ID, token ID or slug
+
+        Returns:
+            Market record or None
+        """
+        query = """
+            SELECT *
+            FROM markets
+            WHERE condition_id = %(key)s
+               OR slug = %(key)s
+               OR token_ids @> ARRAY[%(key)s]::TEXT[]
+            LIMIT 1
+        """
+        return await self.fetch(query, {'key': _key})
+
+    async def upsert_market(self, _market_data):
+        """
+        Insert or refresh cached market metadata.
+
+        Args:
+            _market_data: Dictionary with condition_id, slug, token_ids, question, end_date, data
+
+        Returns:
+            Market record
+        """
+        query = """
+            INSERT INTO markets (condition_id, slug, token_ids, question, end_date, data, fetched_at)
+            VALUES (%(condition_id)s, %(slug)s, %(token_ids)s, %(question)s, %(end_date)s, %(data)s, %(fetched_at)s)
+            ON CONFLICT (condition_id) DO UPDATE
+            SET slug = EXCLUDED.slug,
+                token_ids = EXCLUDED.token_ids,
+                question = EXCLUDED.question,
+                end_date = EXCLUDED.end_date,
+                data = EXCLUDED.data,
+                fetched_at = EXCLUDED.fetched_at
+            RETURNING *
+        """
+        params = dict(_market_data)
+        params['data'] = Jsonb(_market_data.get('data'))
+        params['fetched_at'] = datetime.utcnow()
+        return await self.fetch(query, params)
+
     # User management methods
     async def get_all_users(self):
         """
@@ -0,0 +1,10 @@
+-- Migration to add copy latency timestamps to trades table
+-- Run this if your database already exists
+
+ALTER TABLE trades
+ADD COLUMN IF NOT EXISTS source_timestamp TIMESTAMP,
+ADD COLUMN IF NOT EXISTS detected_at TIMESTAMP,
+ADD COLUMN IF NOT EXISTS decided_at TIMESTAMP,
+ADD COLUMN IF NOT EXISTS submitted_at TIMESTAMP,
+ADD COLUMN IF NOT EXISTS acked_at TIMESTAMP,
+ADD COLUMN IF NOT EXISTS committed_at TIMESTAMP;
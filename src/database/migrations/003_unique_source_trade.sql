@@ -0,0 +1,24 @@
+-- Migration to enforce one copy per target trade per bot
+-- Run this if your database already exists (schema.sql applies the same change on startup)
+
+-- One copy per target trade per bot. Rows duplicated before the index existed keep
+-- the earliest copy's link; later copies get a suffixed source_trade_id.
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_indexes WHERE indexname = 'idx_trades_bot_source_trade'
+    ) THEN
+        UPDATE trades t
+        SET source_trade_id = t.source_trade_id || '#dup-' || t.id
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY bot_id, source_trade_id ORDER BY id) AS copy_number
+            FROM trades
+            WHERE source_trade_id IS NOT NULL AND source_trade_id <> ''
+        ) d
+        WHERE t.id = d.id AND d.copy_number > 1;
+    END IF;
+END $$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_trades_bot_source_trade
+    ON trades(bot_id, source_trade_id)
+    WHERE source_trade_id IS NOT NULL AND source_trade_id <> '';
@@ -0,0 +1,7 @@
+-- Migration to add outcome token and simulated slippage to trades table
+-- Run this if your database already exists
+
+ALTER TABLE trades
+ADD COLUMN IF NOT EXISTS token_id VARCHAR(255),
+ADD COLUMN IF NOT EXISTS entry_slippage DECIMAL(10, 6),
+ADD COLUMN IF NOT EXISTS exit_slippage DECIMAL(10, 6);
@@ -72,7 +72,20 @@ CREATE TABLE IF NOT EXISTS trades (
 
     -- Copy trading link
     source_trade_id VARCHAR(255),  -- ID of the trade being copied
-    target_trade_id VARCHAR(255)   -- ID of the original trader's trade
+    target_trade_id VARCHAR(255),  -- ID of the original trader's trade
+
+    -- Execution quality
+    token_id VARCHAR(255),  -- CLOB outcome token traded
+    entry_slippage DECIMAL(10, 6),  -- Fill price vs target's price, as a fraction (positive = worse)
+    exit_slippage DECIMAL(10, 6),  -- Fill price vs requested exit price, as a fraction (positive = worse)
+
+    -- Copy latency (UTC)
+    source_timestamp TIMESTAMP,  -- Target's trade time
+    detected_at TIMESTAMP,  -- When we first saw the target's trade
+    decided_at TIMESTAMP,  -- When the copy passed sizing and limits
+    submitted_at TIMESTAMP,  -- When the order was sent (production)
+    acked_at TIMESTAMP,  -- When the exchange acknowledged the order (production)
+    committed_at TIMESTAMP  -- When this row was written
 );
 
 -- Performance snapshots table
@@ -89,6 +102,18 @@ CREATE TABLE IF NOT EXISTS performance_snapshots (
     snapshot_type VARCHAR(50)  -- 'hourly', 'daily', 'weekly'
 );
 
+-- Market metadata cache (persistent tier behind the in-process LRU)
+CREATE TABLE IF NOT EXISTS markets (
+    id SERIAL PRIMARY KEY,
+    condition_id VARCHAR(255) UNIQUE NOT NULL,
+    slug VARCHAR(255),
+    token_ids TEXT[],  -- Outcome token IDs (CLOB asset IDs)
+    question TEXT,
+    end_date TIMESTAMP,
+    data JSONB,  -- Raw market metadata from Polymarket
+    fetched_at TIMESTAMP NOT NULL
+);
+
 -- Create indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
 CREATE INDEX IF NOT EXISTS idx_users_user_id ON users(user_id);
@@ -99,3 +124,27 @@ CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status);
 CREATE INDEX IF NOT EXISTS idx_trades_opened_at ON trades(opened_at);
 CREATE INDEX IF NOT EXISTS idx_performance_bot_id ON performance_snapshots(bot_id);
 CREATE INDEX IF NOT EXISTS idx_performance_timestamp ON performance_snapshots(timestamp);
+CREATE INDEX IF NOT EXISTS idx_markets_slug ON markets(slug);
+CREATE INDEX IF NOT EXISTS idx_markets_token_ids ON markets USING GIN(token_ids);
+
+-- One copy per target trade per bot. Rows duplicated before the index existed keep
+-- the earliest copy's link; later copies get a suffixed source_trade_id.
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_indexes WHERE indexname = 'idx_trades_bot_source_trade'
+    ) THEN
+        UPDATE trades t
+        SET source_trade_id = t.source_trade_id || '#dup-' || t.id
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY bot_id, source_trade_id ORDER BY id) AS copy_number
+            FROM trades
+            WHERE source_trade_id IS NOT NULL AND source_trade_id <> ''
+        ) d
+        WHERE t.id = d.id AND d.copy_number > 1;
+    END IF;
+END $$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_trades_bot_source_trade
+    ON trades(bot_id, source_trade_id)
+    WHERE source_trade_id IS NOT NULL AND source_trade_id <> '';
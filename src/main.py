@@ -76,16 +76,54 @@ async def lifespan(app: FastAPI):
     polymarket_client = PolymarketClient(
         _api_key=config.polymarket_api_key,
         _api_secret=config.polymarket_api_secret,
-        _base_url=config.polymarket_base_url
+        _base_url=config.polymarket_base_url,
+        _http2=config.polymarket_http2,
+        _max_connections=config.polymarket_max_connections,
+        _max_keepalive_connections=config.polymarket_max_keepalive,
+        _keepalive_expiry=config.polymarket_keepalive_expiry,
+        _timeout=config.polymarket_timeout,
+        _dns_cache_ttl=config.polymarket_dns_cache_ttl,
+        _rate_limit=config.rate_limit,
+        _rate_burst=config.rate_limit_burst,
+        _max_concurrency=config.max_concurrency,
+        _max_retries=config.max_retries,
+        _coalesce_ttl=config.coalesce_ttl,
+        _hedge_percentile=config.hedge_percentile,
+        _breaker_threshold=config.breaker_threshold,
+        _breaker_recovery=config.breaker_recovery,
+        _data_url=config.polymarket_data_url,
+        _gamma_url=config.polymarket_gamma_url,
+        _clob_url=config.polymarket_clob_url,
+        _strapi_url=config.polymarket_strapi_url
     )
     await polymarket_client.initialize()
 
     # Initialize bot manager
+    if config.ingestion_mode == 'stream' and config.is_streaming == False:
+        logger.warning("INGESTION_MODE=stream but STREAM_URL is not set, polling instead")
+
     logger.info("Initializing bot manager")
     bot_manager = BotManager(
         _polymarket_client=polymarket_client,
-        _db_manager=db_manager
+        _db_manager=db_manager,
+        _poll_interval=config.poll_interval,
+        _stream_url=config.stream_url if config.is_streaming == True else None,
+        _price_max_age=config.price_max_age,
+        _price_refresh_interval=config.price_refresh_interval,
+        _min_poll_interval=config.poll_min_interval,
+        _max_poll_interval=config.poll_max_interval,
+        _wallet_flush_interval=config.wallet_flush_interval,
+        _wallet_reconcile_interval=config.wallet_reconcile_interval,
+        _trade_batch_window=config.trade_batch_window,
+        _trade_batch_size=config.trade_batch_size,
+        _order_aggregation_window=config.order_aggregation_window,
+        _order_aggregation_max=config.order_aggregation_max,
+        _order_book_max_age=config.order_book_max_age,
+        _order_book_refresh_interval=config.order_book_refresh_interval,
+        _order_book_capacity=config.order_book_capacity,
+        _paper_max_slippage=config.paper_max_slippage
     )
+    await bot_manager.initialize()
 
     # Load and start all active bots from database
     logger.info("Loading active bots from database")
@@ -0,0 +1,280 @@
+"""
+Activity data model for BotForm2.
+
+Normalized representation of a target trader's trade, decoded once from
+either the data-api or the CLOB trade history schema.
+Follows bobbyofna coding style conventions.
+"""
+
+import json
+from typing import Optional, List
+
+try:
+    import orjson
+except ImportError:  # Optional fast decoder; fall back to the standard library
+    orjson = None
+
+
+def loads(_content):
+    """
+    Decode a JSON payload, using orjson when it is installed.
+
+    Args:
+        _content: Raw bytes or str
+
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(_content)
+    return json.loads(_content)
+
+
+class Activity:
+    """Compact trade activity record (one per upstream trade)."""
+
+    __slots__ = (
+        '_transaction_hash', '_timestamp', '_side', '_condition_id', '_asset', '_outcome', '_outcome_index',
+        '_price', '_size', '_title', '_slug', '_proxy_wallet', '_source', '_detected_at'
+    )
+
+    def __init__(self, _transaction_hash, _timestamp, _side, _condition_id, _outcome, _price, _size,
+                 _asset=None, _outcome_index=None, _title=None, _slug=None, _proxy_wallet=None, _source='data',
+                 _detected_at=None):
+        """
+        Initialize activity.
+
+        Args:
+            _transaction_hash: On-chain transaction hash
+            _timestamp: Trade time as epoch seconds (None if unknown)
+            _side: 'BUY' or 'SELL'
+            _condition_id: Market/condition ID
+            _outcome: Outcome name
+            _price: Trade price (probability)
+            _size: Trade size in shares
+            _asset: Outcome token ID
+            _outcome_index: Outcome index within the market
+            _title: Market title
+            _slug: Market slug
+            _proxy_wallet: Trader's wallet address
+            _source: Upstream schema the record came from ('data' or 'clob')
+            _detected_at: Epoch seconds when we first saw the trade (set on ingest)
+        """
+        self._transaction_hash = _transaction_hash
+        self._timestamp = _timestamp
+        self._side = _side
+        self._condition_id = _condition_id
+        self._outcome = _outcome
+        self._price = _price
+        self._size = _size
+        self._asset = _asset
+        self._outcome_index = _outcome_index
+        self._title = _title
+        self._slug = _slug
+        self._proxy_wallet = _proxy_wallet
+        self._source = _source
+        self._detected_at = _detected_at
+
+    @property
+    def transaction_hash(self):
+        """Get transaction hash."""
+        return self._transaction_hash
+
+    @property
+    def timestamp(self):
+        """Get trade time as epoch seconds."""
+        return self._timestamp
+
+    @property
+    def side(self):
+        """Get trade side."""
+        return self._side
+
+    @property
+    def condition_id(self):
+        """Get market/condition ID."""
+        return self._condition_id
+
+    @property
+    def asset(self):
+        """Get outcome token ID."""
+        return self._asset
+
+    @property
+    def outcome(self):
+        """Get outcome name."""
+        return self._outcome
+
+    @property
+    def outcome_index(self):
+        """Get outcome index."""
+        return self._outcome_index
+
+    @property
+    def price(self):
+        """Get trade price."""
+        return self._price
+
+    @property
+    def size(self):
+        """Get trade size."""
+        return self._size
+
+    @property
+    def title(self):
+        """Get market title."""
+        return self._title
+
+    @property
+    def slug(self):
+        """Get market slug."""
+        return self._slug
+
+    @property
+    def proxy_wallet(self):
+        """Get trader's wallet address."""
+        return self._proxy_wallet
+
+    @property
+    def source(self):
+        """Get upstream schema name."""
+        return self._source
+
+    @property
+    def detected_at(self):
+        """Get epoch seconds when the trade was first seen."""
+        return self._detected_at
+
+    @detected_at.setter
+    def detected_at(self, _value):
+        """Set epoch seconds when the trade was first seen."""
+        self._detected_at = _value
+
+    @property
+    def is_buy(self):
+        """Check if this is a BUY."""
+        return True if self._side == 'BUY' else False
+
+    @property
+    def is_sell(self):
+        """Check if this is a SELL."""
+        return True if self._side == 'SELL' else False
+
+    def to_dict(self):
+        """
+        Convert activity to a dictionary using data-api field names.
+
+        Returns:
+            Dictionary containing all activity data
+        """
+        return {
+            'transactionHash': self._transaction_hash,
+            'timestamp': self._timestamp,
+            'side': self._side,
+            'conditionId': self._condition_id,
+            'asset': self._asset,
+            'outcome': self._outcome,
+            'outcomeIndex': self._outcome_index,
+            'price': self._price,
+            'size': self._size,
+            'title': self._title,
+            'slug': self._slug,
+            'proxyWallet': self._proxy_wallet,
+            'source': self._source,
+            'detectedAt': self._detected_at
+        }
+
+    @classmethod
+    def from_data_api(cls, _data, _source='data'):
+        """
+        Create activity from a data-api trade.
+
+        Args:
+            _data: Trade dictionary from data-api /trades
+
+        Returns:
+            Activity instance
+        """
+        return cls(
+            _transaction_hash=_data.get('transactionHash'),
+            _timestamp=_to_int(_data.get('timestamp')),
+            _side=_data.get('side'),
+            _condition_id=_data.get('conditionId', ''),
+            _outcome=_data.get('outcome', ''),
+            _price=_to_float(_data.get('price')),
+            _size=_to_float(_data.get('size')),
+            _asset=_data.get('asset'),
+            _outcome_index=_data.get('outcomeIndex'),
+            _title=_data.get('title'),
+            _slug=_data.get('slug'),
+            _proxy_wallet=_data.get('proxyWallet'),
+            _source=_source
+        )
+
+    @classmethod
+    def from_clob(cls, _data):
+        """
+        Create activity from a CLOB trade history record.
+
+        Args:
+            _data: Trade dictionary from CLOB /data/trades
+
+        Returns:
+            Activity instance
+        """
+        return cls(
+            _transaction_hash=_data.get('transaction_hash'),
+            _timestamp=_to_int(_data.get('match_time')),
+            _side=_data.get('side'),
+            _condition_id=_data.get('market', ''),
+            _outcome=_data.get('outcome', ''),
+            _price=_to_float(_data.get('price')),
+            _size=_to_float(_data.get('size')),
+            _asset=_data.get('asset_id'),
+            _title=None,
+            _slug=None,
+            _proxy_wallet=_data.get('maker_address'),
+            _source='clob'
+        )
+
+
+def decode_activities(_content, _source='data'):
+    """
+    Decode an upstream trade list straight into activities.
+
+    Args:
+        _content: Raw response body (bytes or str)
+        _source: 'data' for data-api /trades, 'clob' for CLOB /data/trades
+
+    Returns:
+        List of Activity (records that aren't objects are skipped)
+    """
+    payload = loads(_content)
+    if isinstance(payload, dict):
+        payload = payload.get('data', [])
+    if isinstance(payload, list) == False:
+        return []
+
+    if _source == 'clob':
+        return [Activity.from_clob(item) for item in payload if isinstance(item, dict)]
+    return [Activity.from_data_api(item, _source) for item in payload if isinstance(item, dict)]
+
+
+def _to_int(_value):
+    """Convert an epoch value (int, float or numeric string) to int seconds, or None."""
+    if _value is None:
+        return None
+    try:
+        return int(float(_value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(_value):
+    """Convert a numeric value (or numeric string) to float, defaulting to 0.0."""
+    if _value is None:
+        return 0.0
+    try:
+        return float(_value)
+    except (TypeError, ValueError):
+        return 0.0
@@ -0,0 +1,599 @@
+"""
+Local stand-in for the Polymarket APIs.
+
+Lets bots, PolymarketClient and the routes be exercised offline. One
+server answers for every upstream host: the data-api (/trades), gamma
+(/markets), CLOB (/markets, /data/trades, /book), the legacy order host
+(/orders, reached through POLYMARKET_BASE_URL) and the CLOB market
+channel (/ws/market). Trader activity comes from a recorded or
+synthetic replay, or is injected through a small control API, and
+latency, 5xx errors and 429 throttling can be injected to measure
+throughput and copy latency reproducibly.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+import json
+import random
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Dict, Set, Optional, List
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Body, Request
+from fastapi.responses import JSONResponse
+
+from .replay import ActivityReplay, load_recording, build_markets, generate_synthetic
+
+
+class FakePolymarketServer:
+    """Fake Polymarket REST and websocket APIs with replay and fault injection."""
+
+    def __init__(self, _max_trades=100000):
+        """
+        Initialize fake server state and routes.
+
+        Args:
+            _max_trades: Maximum trades kept in memory (oldest dropped first)
+        """
+        self._connections = {}
+        self._published = 0
+        self._logger = logging.getLogger(__name__)
+
+        # Upstream data
+        self._max_trades = _max_trades
+        self._trades = []  # newest last
+        self._released_at = {}  # transaction hash -> epoch seconds the trade became visible
+        self._markets = {}  # condition ID -> market
+        self._market_aliases = {}  # condition ID, token ID, slug or gamma ID -> condition ID
+        self._orders = []
+
+        # Fault injection
+        self._faults = {
+            'latency': 0.0,  # seconds added to every REST response
+            'jitter': 0.0,  # extra uniform random latency in seconds
+            'error_rate': 0.0,  # share of REST requests answered with 503
+            'throttle_rate': 0.0,  # share of REST requests answered with 429
+            'retry_after': 1  # Retry-After seconds on injected 429s
+        }
+
+        # Statistics
+        self._requests = {}
+        self._errors_injected = 0
+        self._throttled = 0
+
+        # Replay started with the app (set before the server runs)
+        self._replay = None
+        self._pending_replay = None
+
+        self._app = FastAPI(title="Fake Polymarket", lifespan=self._lifespan)
+        self._register_routes()
+
+    @property
+    def app(self):
+        """Get ASGI application."""
+        return self._app
+
+    @property
+    def connection_count(self):
+        """Get number of open websocket connections."""
+        return len(self._connections)
+
+    @property
+    def trade_count(self):
+        """Get number of trades held."""
+        return len(self._trades)
+
+    @asynccontextmanager
+    async def _lifespan(self, _app):
+        """Start any replay configured before startup; stop it on shutdown."""
+        if self._pending_replay is not None:
+            self._replay = ActivityReplay(_on_trade=self.release_trade, **self._pending_replay).start()
+            self._pending_replay = None
+        yield
+        if self._replay is not None:
+            await self._replay.stop()
+
+    def configure_faults(self, **_faults):
+        """
+        Update fault injection settings.
+
+        Args:
+            **_faults: Any of latency, jitter, error_rate, throttle_rate, retry_after
+
+        Returns:
+            Current fault settings
+        """
+        for key, value in _faults.items():
+            if key in self._faults and value is not None:
+                self._faults[key] = value
+        return dict(self._faults)
+
+    def load_markets(self, _markets):
+        """
+        Register markets served by gamma/CLOB /markets.
+
+        Args:
+            _markets: List of gamma-style market dictionaries
+
+        Returns:
+            Self for chaining
+        """
+        for market in _markets:
+            condition_id = market['conditionId']
+            self._markets[condition_id] = market
+            aliases = [condition_id, market.get('slug'), market.get('id')]
+            for token in market.get('tokens', []):
+                aliases.append(token.get('token_id'))
+            for alias in aliases:
+                if alias:
+                    self._market_aliases[str(alias)] = condition_id
+        return self
+
+    def schedule_replay(self, _timeline, _speed=1.0, _loop=False):
+        """
+        Replay a timeline once the server starts.
+
+        Args:
+            _timeline: List of (offset_seconds, trade) tuples
+            _speed: Replay speed multiplier
+            _loop: Start over when the timeline ends
+
+        Returns:
+            Self for chaining
+        """
+        self._pending_replay = {'_timeline': _timeline, '_speed': _speed, '_loop': _loop}
+        return self
+
+    async def start_replay(self, _timeline, _speed=1.0, _loop=False):
+        """
+        Replace any running replay with a new one.
+
+        Args:
+            _timeline: List of (offset_seconds, trade) tuples
+            _speed: Replay speed multiplier
+            _loop: Start over when the timeline ends
+
+        Returns:
+            ActivityReplay instance
+        """
+        if self._replay is not None:
+            await self._replay.stop()
+        self._replay = ActivityReplay(_timeline, self.release_trade, _speed=_speed, _loop=_loop).start()
+        return self._replay
+
+    async def release_trade(self, _trade):
+        """
+        Make a trade visible on the REST APIs and push it to the market channel.
+
+        Args:
+            _trade: data-api style trade dictionary
+        """
+        self._trades.append(_trade)
+        if len(self._trades) > self._max_trades:
+            dropped = self._trades[:len(self._trades) - self._max_trades]
+            self._trades = self._trades[len(dropped):]
+            for trade in dropped:
+                self._released_at.pop(trade.get('transactionHash'), None)
+        self._released_at[_trade.get('transactionHash')] = time.time()
+
+        asset = _trade.get('asset')
+        if asset:
+            await self.publish({
+                'event_type': 'last_trade_price',
+                'asset_id': str(asset),
+                'market': _trade.get('conditionId'),
+                'price': str(_trade.get('price')),
+                'side': _trade.get('side'),
+                'size': str(_trade.get('size')),
+                'fee_rate_bps': '0',
+                'timestamp': str(int(time.time() * 1000))
+            })
+            # The book moves with the trade; subscribers get the new snapshot
+            await self.publish(self._book_event(asset))
+
+    def _register_routes(self):
+        """Attach upstream, websocket and control routes to the app."""
+        app = self._app
+
+        @app.middleware("http")
+        async def inject_faults(request: Request, call_next):
+            """Apply configured latency, 5xx errors and 429 throttling to upstream routes."""
+            path = request.url.path
+            if path.startswith('/_fake'):
+                return await call_next(request)
+
+            self._requests[path] = self._requests.get(path, 0) + 1
+
+            delay = self._faults['latency'] + random.uniform(0, self._faults['jitter'])
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if random.random() < self._faults['throttle_rate']:
+                self._throttled = self._throttled + 1
+                return JSONResponse(
+                    {"error": "Too Many Requests"}, status_code=429,
+                    headers={"Retry-After": str(self._faults['retry_after'])}
+                )
+            if random.random() < self._faults['error_rate']:
+                self._errors_injected = self._errors_injected + 1
+                return JSONResponse({"error": "Service Unavailable"}, status_code=503)
+
+            return await call_next(request)
+
+        # data-api
+        @app.get("/trades")
+        async def data_trades(request: Request):
+            """data-api trade history, filtered by maker/user or market, newest first."""
+            params = request.query_params
+            trades = self._find_trades(
+                _maker=params.get('maker') or params.get('user'),
+                _market=params.get('condition_id') or params.get('market'),
+                _limit=int(params.get('_limit', params.get('limit', 100))),
+                _offset=int(params.get('_offset', params.get('offset', 0)))
+            )
+            return trades
+
+        # CLOB trade history
+        @app.get("/data/trades")
+        async def clob_trades(request: Request):
+            """CLOB trade history in the CLOB schema."""
+            params = request.query_params
+            trades = self._find_trades(
+                _maker=params.get('maker'),
+                _market=params.get('market'),
+                _limit=int(params.get('limit', 100)),
+                _offset=0
+            )
+            return [self._to_clob_trade(trade) for trade in trades]
+
+        # gamma and CLOB markets
+        @app.get("/markets")
+        async def list_markets(request: Request):
+            """Market search by id, slug or condition ID."""
+            params = request.query_params
+            key = params.get('id') or params.get('slug') or params.get('condition_ids')
+            if key is None:
+                return list(self._markets.values())[:int(params.get('limit', 100))]
+            market = self._get_market(key)
+            return [market] if market is not None else []
+
+        @app.get("/markets/{market_id}")
+        async def get_market(market_id: str):
+            """Single market by condition ID, token ID, slug or gamma ID."""
+            market = self._get_market(market_id)
+            if market is None:
+                return JSONResponse({"error": "market not found"}, status_code=404)
+            return market
+
+        @app.get("/book")
+        async def order_book(token_id: str):
+            """CLOB order book for a token, built around its last traded price."""
+            return self._build_book(token_id)
+
+        @app.post("/orders")
+        async def place_order(order: dict = Body(...)):
+            """Accept an order and report it filled."""
+            record = dict(order)
+            record['orderID'] = str(uuid.uuid4())
+            record['status'] = 'matched'
+            record.setdefault('side', 'BUY')
+            # Filled in full at the limit price: dollars spent and shares received
+            amount = float(record.get('amount') or 0)
+            price = float(record.get('price') or 0)
+            record['makingAmount'] = amount
+            record['takingAmount'] = amount / price if price > 0 else 0.0
+            record['created_at'] = time.time()
+            self._orders.append(record)
+            return record
+
+        @app.delete("/orders/{order_id}")
+        async def cancel_order(order_id: str):
+            """Cancel an order."""
+            return {"canceled": [order_id]}
+
+        # Streaming
+        @app.websocket("/ws/market")
+        async def stream(websocket: WebSocket):
+            """CLOB market channel: asset subscriptions, PING/PONG and market events."""
+            await websocket.accept()
+            subscriptions = set()
+            self._connections[websocket] = subscriptions
+
+            try:
+                while True:
+                    message = await websocket.receive_text()
+                    if message == 'PING':
+                        await websocket.send_text('PONG')
+                        continue
+                    added = self._handle_subscription(subscriptions, message)
+                    # New subscribers start from a book snapshot, as on the real channel
+                    if len(added) > 0:
+                        await websocket.send_text(json.dumps([self._book_event(asset) for asset in added]))
+            except WebSocketDisconnect:
+                pass
+            finally:
+                self._connections.pop(websocket, None)
+
+        # Control API
+        @app.post("/_fake/publish")
+        async def publish(event: dict = Body(...)):
+            """Push one market event to every connection subscribed to its asset."""
+            delivered = await self.publish(event)
+            return {"delivered": delivered}
+
+        @app.post("/_fake/trades")
+        async def inject_trade(trade: dict = Body(...)):
+            """Release one trade now (timestamp and hash filled in if missing)."""
+            trade = dict(trade)
+            trade.setdefault('timestamp', int(time.time()))
+            trade.setdefault('transactionHash', '0x' + uuid.uuid4().hex * 2)
+            await self.release_trade(trade)
+            return trade
+
+        @app.get("/_fake/released/{tx_hash}")
+        async def released(tx_hash: str):
+            """When a trade became visible (for measuring copy latency)."""
+            released_at = self._released_at.get(tx_hash)
+            if released_at is None:
+                return JSONResponse({"error": "unknown trade"}, status_code=404)
+            return {"transactionHash": tx_hash, "released_at": released_at}
+
+        @app.post("/_fake/faults")
+        async def faults(settings: dict = Body(...)):
+            """Update latency/error/throttle injection."""
+            return self.configure_faults(**settings)
+
+        @app.post("/_fake/replay")
+        async def replay(settings: dict = Body(...)):
+            """Start a recorded or synthetic replay."""
+            timeline = self.build_timeline(**settings)
+            replay = await self.start_replay(
+                timeline, _speed=settings.get('speed', 1.0), _loop=settings.get('loop', False)
+            )
+            return replay.get_stats()
+
+        @app.post("/_fake/replay/stop")
+        async def stop_replay():
+            """Stop the running replay."""
+            if self._replay is not None:
+                await self._replay.stop()
+            return {"stopped": True}
+
+        @app.post("/_fake/disconnect")
+        async def disconnect():
+            """Drop every websocket connection (exercises reconnect/resubscribe)."""
+            closed = await self.disconnect_all()
+            return {"closed": closed}
+
+        @app.get("/_fake/stats")
+        async def stats():
+            """Get fake server statistics."""
+            return self.get_stats()
+
+    def build_timeline(self, path=None, traders=None, rate=0.2, duration=600, markets=20, sell_ratio=0.3,
+                       seed=None, **_ignored):
+        """
+        Build a replay timeline from a recording or synthetic settings.
+
+        Synthetic runs also register their markets so /markets can answer.
+
+        Args:
+            path: JSONL recording to replay (takes precedence)
+            traders: Trader addresses (or a count) for a synthetic run
+            rate: Trades per second per trader
+            duration: Synthetic timeline length in seconds
+            markets: Number of synthetic markets
+            sell_ratio: Share of synthetic trades that sell a held position
+            seed: Random seed
+
+        Returns:
+            List of (offset_seconds, trade) tuples
+        """
+        if path is not None:
+            return load_recording(path)
+
+        if traders is None:
+            traders = 1
+        if isinstance(traders, int):
+            rng = random.Random(seed)
+            traders = ['0x' + ''.join(rng.choice('0123456789abcdef') for _ in range(40)) for _ in range(traders)]
+
+        market_list = build_markets(markets, _seed=seed)
+        self.load_markets(market_list)
+        return generate_synthetic(traders, market_list, _rate=rate, _duration=duration, _sell_ratio=sell_ratio,
+                                  _seed=seed)
+
+    def _find_trades(self, _maker=None, _market=None, _limit=100, _offset=0):
+        """Filter held trades, newest first, with offset paging."""
+        maker = _maker.lower() if _maker else None
+        results = []
+        skipped = 0
+
+        for trade in reversed(self._trades):
+            if maker is not None and (trade.get('proxyWallet') or '').lower() != maker:
+                continue
+            if _market is not None and trade.get('conditionId') != _market:
+                continue
+            if skipped < _offset:
+                skipped = skipped + 1
+                continue
+            results.append(trade)
+            if len(results) >= _limit:
+                break
+
+        return results
+
+    def _build_book(self, _token_id, _levels=10, _tick=0.01, _size=100.0):
+        """
+        Build a synthetic book around a token's last traded price.
+
+        Levels are one tick apart and get deeper away from the touch, so
+        larger orders walk further and see more slippage.
+
+        Args:
+            _token_id: Outcome token ID
+            _levels: Price levels per side
+            _tick: Price step between levels
+            _size: Shares at the best level (level n holds n times this)
+
+        Returns:
+            CLOB /book style dictionary (prices and sizes as strings, best price last)
+        """
+        mid = 0.5
+        for trade in reversed(self._trades):
+            if str(trade.get('asset')) == str(_token_id) and trade.get('price') is not None:
+                mid = float(trade['price'])
+                break
+
+        bids = []
+        asks = []
+        i = 1
+        while i <= _levels:
+            bid = round(mid - _tick * i, 4)
+            ask = round(mid + _tick * i, 4)
+            if bid > 0:
+                bids.append({'price': str(bid), 'size': str(_size * i)})
+            if ask < 1:
+                asks.append({'price': str(ask), 'size': str(_size * i)})
+            i = i + 1
+
+        return {
+            'market': self._market_aliases.get(str(_token_id)),
+            'asset_id': str(_token_id),
+            'bids': list(reversed(bids)),
+            'asks': list(reversed(asks)),
+            'timestamp': str(int(time.time() * 1000))
+        }
+
+    def _get_market(self, _key):
+        """Look a market up by any of its identifiers."""
+        condition_id = self._market_aliases.get(str(_key))
+        if condition_id is None:
+            return None
+        return self._markets.get(condition_id)
+
+    def _to_clob_trade(self, _trade):
+        """Convert a data-api trade into the CLOB /data/trades schema."""
+        return {
+            'id': _trade.get('transactionHash'),
+            'transaction_hash': _trade.get('transactionHash'),
+            'market': _trade.get('conditionId'),
+            'asset_id': _trade.get('asset'),
+            'side': _trade.get('side'),
+            'size': str(_trade.get('size')),
+            'price': str(_trade.get('price')),
+            'outcome': _trade.get('outcome'),
+            'match_time': str(_trade.get('timestamp')),
+            'maker_address': _trade.get('proxyWallet'),
+            'status': 'CONFIRMED'
+        }
+
+    def _book_event(self, _token_id):
+        """Build a market channel 'book' event for a token."""
+        book = self._build_book(_token_id)
+        book['event_type'] = 'book'
+        return book
+
+    def _handle_subscription(self, _subscriptions, _message):
+        """
+        Apply an assets_ids frame to a connection's subscriptions.
+
+        Returns:
+            List of asset IDs newly subscribed
+        """
+        try:
+            payload = json.loads(_message)
+        except Exception:
+            return []
+
+        if isinstance(payload, dict) == False or isinstance(payload.get('assets_ids'), list) == False:
+            return []
+
+        added = []
+        operation = payload.get('operation', 'subscribe')
+        for asset in payload['assets_ids']:
+            asset = str(asset)
+            if operation == 'unsubscribe':
+                _subscriptions.discard(asset)
+            elif asset not in _subscriptions:
+                _subscriptions.add(asset)
+                added.append(asset)
+        return added
+
+    async def publish(self, _event):
+        """
+        Send a market event to connections subscribed to its asset.
+
+        Args:
+            _event: Market channel event ('book', 'price_change', 'last_trade_price', ...)
+
+        Returns:
+            Number of connections the event was sent to
+        """
+        assets = set()
+        if _event.get('asset_id'):
+            assets.add(str(_event['asset_id']))
+        for change in _event.get('price_changes') or []:
+            if change.get('asset_id'):
+                assets.add(str(change['asset_id']))
+        frame = json.dumps(_event)
+
+        delivered = 0
+        for websocket, subscriptions in list(self._connections.items()):
+            if len(assets & subscriptions) == 0:
+                continue
+            try:
+                await websocket.send_text(frame)
+                delivered = delivered + 1
+            except Exception as e:
+                self._logger.debug("Failed to send to fake client: {}".format(str(e)))
+
+        self._published = self._published + 1
+        return delivered
+
+    async def disconnect_all(self):
+        """
+        Close every websocket connection.
+
+        Returns:
+            Number of connections closed
+        """
+        websockets = list(self._connections.keys())
+        for websocket in websockets:
+            try:
+                await websocket.close()
+            except Exception:
+                pass
+        return len(websockets)
+
+    def get_stats(self):
+        """
+        Get fake server statistics.
+
+        Returns:
+            Dictionary of connection, data, request and fault counters
+        """
+        assets = set()
+        for subscriptions in self._connections.values():
+            assets.update(subscriptions)
+
+        return {
+            'connections': len(self._connections),
+            'subscribed_assets': sorted(assets),
+            'published': self._published,
+            'trades': len(self._trades),
+            'markets': len(self._markets),
+            'orders': len(self._orders),
+            'requests': dict(self._requests),
+            'faults': dict(self._faults),
+            'errors_injected': self._errors_injected,
+            'throttled': self._throttled,
+            'replay': self._replay.get_stats() if self._replay is not None else None
+        }
+
+
+# Module-level app for `uvicorn src.testing.fake_polymarket:app`
+fake_server = FakePolymarketServer()
+app = fake_server.app
@@ -0,0 +1,237 @@
+"""
+Activity replay for the fake Polymarket server.
+
+Produces a timeline of trader activity, either loaded from a recording
+(JSONL, one data-api trade per line) or generated synthetically, and
+releases it in real time at a configurable speed.
+Follows bobbyofna coding style conventions.
+"""
+
+import logging
+import asyncio
+import json
+import random
+import time
+import uuid
+from typing import Optional, Dict, List
+
+
+def load_recording(_path):
+    """
+    Load a recorded activity timeline.
+
+    Each line is one data-api trade (the objects /trades returns). Lines are
+    ordered by their 'timestamp' and turned into offsets from the first one.
+
+    Args:
+        _path: Path to a JSONL file
+
+    Returns:
+        List of (offset_seconds, trade) tuples, oldest first
+    """
+    trades = []
+    with open(_path, 'r') as handle:
+        for line in handle:
+            line = line.strip()
+            if line == '' or line.startswith('#'):
+                continue
+            trade = json.loads(line)
+            if isinstance(trade, dict) and trade.get('timestamp') is not None:
+                trades.append(trade)
+
+    trades.sort(key=lambda x: int(x['timestamp']))
+    if len(trades) == 0:
+        return []
+
+    start = int(trades[0]['timestamp'])
+    return [(int(trade['timestamp']) - start, trade) for trade in trades]
+
+
+def build_markets(_count=20, _seed=None, _end_in=86400):
+    """
+    Build synthetic binary markets.
+
+    Args:
+        _count: Number of markets
+        _seed: Random seed for reproducible runs
+        _end_in: Seconds from now until the markets end
+
+    Returns:
+        List of gamma-style market dictionaries
+    """
+    rng = random.Random(_seed)
+    end_date = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(time.time() + _end_in))
+
+    markets = []
+    i = 0
+    while i < _count:
+        condition_id = '0x' + ''.join(rng.choice('0123456789abcdef') for _ in range(64))
+        token_ids = [str(rng.randint(10 ** 20, 10 ** 21)), str(rng.randint(10 ** 20, 10 ** 21))]
+        markets.append({
+            'id': str(100000 + i),
+            'conditionId': condition_id,
+            'question': "Synthetic market {}?".format(i + 1),
+            'slug': "synthetic-market-{}".format(i + 1),
+            'endDate': end_date,
+            'outcomes': json.dumps(['Yes', 'No']),
+            'clobTokenIds': json.dumps(token_ids),
+            'tokens': [
+                {'token_id': token_ids[0], 'outcome': 'Yes'},
+                {'token_id': token_ids[1], 'outcome': 'No'}
+            ],
+            'active': True,
+            'closed': False
+        })
+        i = i + 1
+
+    return markets
+
+
+def generate_synthetic(_traders, _markets, _rate=0.2, _duration=600, _sell_ratio=0.3, _seed=None):
+    """
+    Generate a synthetic activity timeline.
+
+    Each trader trades as a Poisson process; sells close an earlier buy of
+    the same market/outcome so exit copying gets exercised too.
+
+    Args:
+        _traders: List of trader addresses
+        _markets: List of markets from build_markets()
+        _rate: Trades per second per trader
+        _duration: Timeline length in seconds
+        _sell_ratio: Share of trades that sell a held position
+        _seed: Random seed for reproducible runs
+
+    Returns:
+        List of (offset_seconds, trade) tuples, oldest first
+    """
+    rng = random.Random(_seed)
+    timeline = []
+
+    for trader in _traders:
+        held = []
+        offset = 0.0
+        while _rate > 0:
+            offset = offset + rng.expovariate(_rate)
+            if offset > _duration:
+                break
+
+            if len(held) > 0 and rng.random() < _sell_ratio:
+                market, outcome_index = held.pop(rng.randrange(len(held)))
+                side = 'SELL'
+            else:
+                market = rng.choice(_markets)
+                outcome_index = rng.randint(0, 1)
+                held.append((market, outcome_index))
+                side = 'BUY'
+
+            token_ids = json.loads(market['clobTokenIds'])
+            price = round(rng.uniform(0.05, 0.95), 2)
+            timeline.append((offset, {
+                'proxyWallet': trader,
+                'side': side,
+                'asset': token_ids[outcome_index],
+                'conditionId': market['conditionId'],
+                'size': round(rng.uniform(10, 500), 2),
+                'price': price,
+                'timestamp': 0,
+                'title': market['question'],
+                'slug': market['slug'],
+                'outcome': ['Yes', 'No'][outcome_index],
+                'outcomeIndex': outcome_index,
+                'transactionHash': '0x' + uuid.UUID(int=rng.getrandbits(128)).hex * 2
+            }))
+
+    timeline.sort(key=lambda x: x[0])
+    return timeline
+
+
+class ActivityReplay:
+    """Releases a timeline of trades into the fake server at a chosen speed."""
+
+    def __init__(self, _timeline, _on_trade, _speed=1.0, _loop=False):
+        """
+        Initialize replay.
+
+        Args:
+            _timeline: List of (offset_seconds, trade) tuples, oldest first
+            _on_trade: Async callback(trade) run as each trade is released
+            _speed: Replay speed multiplier (2.0 = twice as fast)
+            _loop: Start over when the timeline ends
+        """
+        self._timeline = _timeline
+        self._on_trade = _on_trade
+        self._speed = max(float(_speed), 0.001)
+        self._loop = _loop
+        self._task = None
+        self._released = 0
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def is_running(self):
+        """Check if the replay is still releasing trades."""
+        return True if self._task is not None and self._task.done() == False else False
+
+    @property
+    def released(self):
+        """Get number of trades released so far."""
+        return self._released
+
+    def start(self):
+        """
+        Start releasing trades.
+
+        Returns:
+            Self for chaining
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    async def stop(self):
+        """Stop releasing trades."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        """Release each trade at its (scaled) offset, re-stamped to the current time."""
+        while True:
+            started = time.monotonic()
+            for offset, trade in self._timeline:
+                delay = started + offset / self._speed - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                released = dict(trade)
+                released['timestamp'] = int(time.time())
+                if self._loop == True:
+                    released['transactionHash'] = "{}-{}".format(trade.get('transactionHash'), self._released)
+
+                try:
+                    await self._on_trade(released)
+                except Exception as e:
+                    self._logger.error("Replay callback failed: {}".format(str(e)))
+                self._released = self._released + 1
+
+            if self._loop == False or len(self._timeline) == 0:
+                break
+
+    def get_stats(self):
+        """
+        Get replay statistics.
+
+        Returns:
+            Dictionary of progress counters
+        """
+        return {
+            'running': self.is_running,
+            'speed': self._speed,
+            'loop': self._loop,
+            'timeline': len(self._timeline),
+            'released': self._released
+        }
@@ -0,0 +1,91 @@
+"""
+Latency metrics utility for BotForm2.
+
+Keeps a bounded window of recent samples and reports percentiles.
+Follows bobbyofna coding style conventions.
+"""
+
+import math
+from collections import deque
+from typing import Optional, Dict
+
+
+class LatencyTracker:
+    """Rolling window of latency samples with percentile queries."""
+
+    def __init__(self, _capacity=500):
+        """
+        Initialize latency tracker.
+
+        Args:
+            _capacity: Number of most recent samples kept
+        """
+        self._samples = deque(maxlen=_capacity)
+        self._total = 0
+
+    @property
+    def count(self):
+        """Get number of samples in the window."""
+        return len(self._samples)
+
+    @property
+    def total(self):
+        """Get number of samples ever recorded."""
+        return self._total
+
+    def record(self, _seconds):
+        """
+        Record one sample.
+
+        Args:
+            _seconds: Latency in seconds
+
+        Returns:
+            Self for chaining
+        """
+        self._samples.append(float(_seconds))
+        self._total = self._total + 1
+        return self
+
+    def percentile(self, _percentile):
+        """
+        Get a percentile of the samples in the window (nearest rank).
+
+        Args:
+            _percentile: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None if there are no samples
+        """
+        if len(self._samples) == 0:
+            return None
+
+        ordered = sorted(self._samples)
+        rank = int(math.ceil(_percentile / 100.0 * len(ordered))) - 1
+        rank = min(max(rank, 0), len(ordered) - 1)
+        return ordered[rank]
+
+    def get_stats(self):
+        """
+        Get summary statistics in milliseconds.
+
+        Returns:
+            Dictionary with count, p50, p95, p99 and max
+        """
+        if len(self._samples) == 0:
+            return {'count': 0, 'total': self._total, 'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'max_ms': None}
+
+        ordered = sorted(self._samples)
+
+        def rank(_percentile):
+            index = int(math.ceil(_percentile / 100.0 * len(ordered))) - 1
+            return round(ordered[min(max(index, 0), len(ordered) - 1)] * 1000, 1)
+
+        return {
+            'count': len(ordered),
+            'total': self._total,
+            'p50_ms': rank(50),
+            'p95_ms': rank(95),
+            'p99_ms': rank(99),
+            'max_ms': round(ordered[-1] * 1000, 1)
+        }